@@ -0,0 +1,32 @@
+"""add_job_posting_seek_index
+
+Revision ID: 8b8b4e91f3de
+Revises: a96117a55003
+Create Date: 2025-10-20 09:15:12.482311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b8b4e91f3de'
+down_revision: Union[str, None] = 'a96117a55003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 키셋 페이지네이션 (posted_at, id) 정렬 인덱스
+    op.create_index(
+        'idx_job_posted_at_id',
+        'job_posting',
+        [sa.text('posted_at DESC NULLS LAST'), sa.text('id DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_job_posted_at_id', table_name='job_posting')
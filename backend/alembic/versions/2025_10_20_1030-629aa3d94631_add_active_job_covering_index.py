@@ -0,0 +1,34 @@
+"""add_active_job_covering_index
+
+Revision ID: 629aa3d94631
+Revises: 8b8b4e91f3de
+Create Date: 2025-10-20 10:30:41.207715
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '629aa3d94631'
+down_revision: Union[str, None] = '8b8b4e91f3de'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY는 트랜잭션 밖에서만 실행 가능
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_job_active_seek
+            ON job_posting (posted_at DESC NULLS LAST, id DESC)
+            INCLUDE (title, location, experience_level, employment_type, company_id)
+            WHERE is_active = true
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_job_active_seek")
@@ -0,0 +1,56 @@
+"""replace_expiry_trigger_with_batch_index
+
+Revision ID: 8f5b6233110e
+Revises: 629aa3d94631
+Create Date: 2025-10-21 09:00:27.534102
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f5b6233110e'
+down_revision: Union[str, None] = '629aa3d94631'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. 행 단위 만료 트리거 제거 (주기적 배치 UPDATE로 대체)
+    op.execute("DROP TRIGGER IF EXISTS trigger_deactivate_expired ON job_posting")
+    op.execute("DROP FUNCTION IF EXISTS deactivate_expired_jobs()")
+
+    # 2. 만료 대상 조회용 부분 인덱스 (활성 + 만료일 있는 공고만)
+    op.create_index(
+        'idx_job_expiring',
+        'job_posting',
+        ['expires_at'],
+        unique=False,
+        postgresql_where=sa.text('is_active AND expires_at IS NOT NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_job_expiring', table_name='job_posting')
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION deactivate_expired_jobs()
+        RETURNS trigger AS $$
+        BEGIN
+            IF NEW.expires_at IS NOT NULL AND NEW.expires_at < CURRENT_DATE THEN
+                NEW.is_active := FALSE;
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+        CREATE TRIGGER trigger_deactivate_expired
+        BEFORE INSERT OR UPDATE ON job_posting
+        FOR EACH ROW
+        EXECUTE FUNCTION deactivate_expired_jobs();
+    """)
@@ -0,0 +1,64 @@
+"""denormalize_company_and_candidate_name
+
+Revision ID: 53efc073b1c4
+Revises: 8f5b6233110e
+Create Date: 2025-10-21 11:00:48.913027
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '53efc073b1c4'
+down_revision: Union[str, None] = '8f5b6233110e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. 비정규화 컬럼 추가
+    op.add_column('job_posting', sa.Column('company_name', sa.String(length=255), nullable=True))
+    op.add_column('resume', sa.Column('candidate_name', sa.String(length=255), nullable=True))
+
+    # 2. 기존 데이터 백필
+    op.execute("""
+        UPDATE job_posting j
+        SET company_name = c.name
+        FROM company c
+        WHERE c.id = j.company_id
+    """)
+    op.execute("""
+        UPDATE resume
+        SET candidate_name = LEFT(parsed_data->'personal_info'->>'name', 255)
+        WHERE parsed_data->'personal_info'->>'name' IS NOT NULL
+    """)
+
+    # 3. 회사명 변경 시 공고의 company_name 동기화 (회사 행 단위, 변경 시에만)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION sync_job_company_name()
+        RETURNS trigger AS $$
+        BEGIN
+            UPDATE job_posting SET company_name = NEW.name WHERE company_id = NEW.id;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+        CREATE TRIGGER trigger_sync_job_company_name
+        AFTER UPDATE OF name ON company
+        FOR EACH ROW
+        WHEN (OLD.name IS DISTINCT FROM NEW.name)
+        EXECUTE FUNCTION sync_job_company_name();
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trigger_sync_job_company_name ON company")
+    op.execute("DROP FUNCTION IF EXISTS sync_job_company_name()")
+
+    op.drop_column('resume', 'candidate_name')
+    op.drop_column('job_posting', 'company_name')
@@ -0,0 +1,30 @@
+"""add_resume_processing_status
+
+Revision ID: 43cb097dbdaf
+Revises: 53efc073b1c4
+Create Date: 2025-10-22 09:30:14.662871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '43cb097dbdaf'
+down_revision: Union[str, None] = '53efc073b1c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 백그라운드 파싱 상태 (processing, completed, failed)
+    op.add_column(
+        'resume',
+        sa.Column('processing_status', sa.String(length=20), nullable=True, server_default='completed')
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('resume', 'processing_status')
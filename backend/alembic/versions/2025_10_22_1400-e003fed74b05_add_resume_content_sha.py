@@ -0,0 +1,29 @@
+"""add_resume_content_sha
+
+Revision ID: e003fed74b05
+Revises: 43cb097dbdaf
+Create Date: 2025-10-22 14:00:37.180254
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e003fed74b05'
+down_revision: Union[str, None] = '43cb097dbdaf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 업로드 내용 해시 (중복 이력서 판별)
+    op.add_column('resume', sa.Column('content_sha', sa.CHAR(length=32), nullable=True))
+    op.create_index(op.f('ix_resume_content_sha'), 'resume', ['content_sha'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_resume_content_sha'), table_name='resume')
+    op.drop_column('resume', 'content_sha')
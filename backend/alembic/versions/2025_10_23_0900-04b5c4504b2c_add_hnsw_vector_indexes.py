@@ -0,0 +1,49 @@
+"""add_hnsw_vector_indexes
+
+Revision ID: 04b5c4504b2c
+Revises: e003fed74b05
+Create Date: 2025-10-23 09:00:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '04b5c4504b2c'
+down_revision: Union[str, None] = 'e003fed74b05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, column) - 모두 코사인 거리(<=>) 연산자 클래스 사용
+HNSW_INDEXES = [
+    ('ix_resume_embedding_hnsw', 'resume', 'embedding'),
+    ('ix_resume_skills_embedding_hnsw', 'resume', 'skills_embedding'),
+    ('ix_resume_experience_embedding_hnsw', 'resume', 'experience_embedding'),
+    ('ix_resume_projects_embedding_hnsw', 'resume', 'projects_embedding'),
+    ('ix_resume_sentence_embedding_hnsw', 'resume_sentence', 'embedding'),
+    ('ix_job_sentence_embedding_hnsw', 'job_sentence', 'embedding'),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY는 트랜잭션 밖에서만 실행 가능
+    with op.get_context().autocommit_block():
+        # 그래프 빌드를 메모리 안에서 끝내도록 세션 단위로 상향
+        op.execute("SET maintenance_work_mem = '2GB'")
+        for name, table, column in HNSW_INDEXES:
+            op.execute(f"""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS {name}
+                ON {table} USING hnsw ({column} vector_cosine_ops)
+                WITH (m = 16, ef_construction = 64)
+            """)
+        op.execute("RESET maintenance_work_mem")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _ in reversed(HNSW_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,63 @@
+"""convert_embeddings_to_halfvec
+
+Revision ID: 7781b0c99ab6
+Revises: 04b5c4504b2c
+Create Date: 2025-10-23 10:30:48.902117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7781b0c99ab6'
+down_revision: Union[str, None] = '04b5c4504b2c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, column)
+HNSW_INDEXES = [
+    ('ix_resume_embedding_hnsw', 'resume', 'embedding'),
+    ('ix_resume_skills_embedding_hnsw', 'resume', 'skills_embedding'),
+    ('ix_resume_experience_embedding_hnsw', 'resume', 'experience_embedding'),
+    ('ix_resume_projects_embedding_hnsw', 'resume', 'projects_embedding'),
+    ('ix_resume_sentence_embedding_hnsw', 'resume_sentence', 'embedding'),
+    ('ix_job_sentence_embedding_hnsw', 'job_sentence', 'embedding'),
+]
+
+
+def _convert(target_type: str, ops: str) -> None:
+    # 기존 HNSW 인덱스는 연산자 클래스가 타입에 묶여 있으므로 먼저 제거
+    with op.get_context().autocommit_block():
+        for name, _, _ in HNSW_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+    # 컬럼 타입 변경 (테이블 재작성)
+    for _, table, column in HNSW_INDEXES:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE {target_type} USING {column}::{target_type}"
+        )
+
+    # CONCURRENTLY는 트랜잭션 밖에서만 실행 가능
+    with op.get_context().autocommit_block():
+        op.execute("SET maintenance_work_mem = '2GB'")
+        for name, table, column in HNSW_INDEXES:
+            op.execute(f"""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS {name}
+                ON {table} USING hnsw ({column} {ops})
+                WITH (m = 16, ef_construction = 64)
+            """)
+        op.execute("RESET maintenance_work_mem")
+
+
+def upgrade() -> None:
+    # FP32(vector) → FP16(halfvec): 행/인덱스 크기 절반
+    _convert('halfvec(768)', 'halfvec_cosine_ops')
+
+
+def downgrade() -> None:
+    _convert('vector(768)', 'vector_cosine_ops')
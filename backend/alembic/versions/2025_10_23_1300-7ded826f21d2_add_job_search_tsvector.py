@@ -0,0 +1,42 @@
+"""add_job_search_tsvector
+
+Revision ID: 7ded826f21d2
+Revises: 7781b0c99ab6
+Create Date: 2025-10-23 13:00:05.731942
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7ded826f21d2'
+down_revision: Union[str, None] = '7781b0c99ab6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 제목+설명 tsvector (STORED generated column - 쓰기 시 DB가 자동 계산)
+    op.execute("""
+        ALTER TABLE job_posting
+        ADD COLUMN search_tsv tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(description, ''))
+        ) STORED
+    """)
+
+    # CONCURRENTLY는 트랜잭션 밖에서만 실행 가능
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_job_search_tsv
+            ON job_posting USING gin (search_tsv)
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_job_search_tsv")
+    op.drop_column('job_posting', 'search_tsv')
@@ -0,0 +1,39 @@
+"""add_matching_job_resume_covering_index
+
+Revision ID: f81557923081
+Revises: 7ded826f21d2
+Create Date: 2025-10-23 15:00:22.590418
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f81557923081'
+down_revision: Union[str, None] = '7ded826f21d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY는 트랜잭션 밖에서만 실행 가능
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_matching_job_resume_created
+            ON matching_result (job_id, resume_id, created_at DESC)
+            INCLUDE (overall_score, grade)
+        """)
+        # job_id 단일 인덱스는 복합 인덱스의 선두 컬럼과 중복
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_matching_result_job_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_matching_result_job_id
+            ON matching_result (job_id)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_matching_job_resume_created")
@@ -0,0 +1,45 @@
+"""convert_matching_grade_to_enum
+
+Revision ID: 7dc5358bc4fc
+Revises: f81557923081
+Create Date: 2025-10-23 16:30:51.048263
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7dc5358bc4fc'
+down_revision: Union[str, None] = 'f81557923081'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE TYPE match_grade AS ENUM ('excellent', 'good', 'fair', 'caution', 'poor')")
+
+    # 정의되지 않은 등급 문자열은 캐스팅 전에 NULL로 정리
+    op.execute("""
+        UPDATE matching_result SET grade = NULL
+        WHERE grade IS NOT NULL
+          AND grade NOT IN ('excellent', 'good', 'fair', 'caution', 'poor')
+    """)
+    op.execute("ALTER TABLE matching_result ALTER COLUMN grade TYPE match_grade USING grade::match_grade")
+
+    # CONCURRENTLY는 트랜잭션 밖에서만 실행 가능
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_match_excellent
+            ON matching_result (job_id, overall_score DESC)
+            WHERE grade = 'excellent'
+        """)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_match_excellent")
+    op.execute("ALTER TABLE matching_result ALTER COLUMN grade TYPE VARCHAR(50) USING grade::text")
+    op.execute("DROP TYPE match_grade")
@@ -0,0 +1,37 @@
+"""add_active_job_embedding_hnsw_index
+
+Revision ID: 49a92164e071
+Revises: 7dc5358bc4fc
+Create Date: 2025-10-24 09:00:33.615270
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '49a92164e071'
+down_revision: Union[str, None] = '7dc5358bc4fc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 활성 공고만 그래프에 포함 (비활성 비율이 20%를 넘게 변하면 REINDEX 권장)
+    # CONCURRENTLY는 트랜잭션 밖에서만 실행 가능
+    with op.get_context().autocommit_block():
+        op.execute("SET maintenance_work_mem = '2GB'")
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_job_embedding_hnsw_active
+            ON job_posting USING hnsw (embedding vector_cosine_ops)
+            WITH (m = 16, ef_construction = 64)
+            WHERE is_active
+        """)
+        op.execute("RESET maintenance_work_mem")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_job_embedding_hnsw_active")
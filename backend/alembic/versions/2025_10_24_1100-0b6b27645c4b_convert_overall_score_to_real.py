@@ -0,0 +1,27 @@
+"""convert_overall_score_to_real
+
+Revision ID: 0b6b27645c4b
+Revises: 49a92164e071
+Create Date: 2025-10-24 11:00:17.284906
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b6b27645c4b'
+down_revision: Union[str, None] = '49a92164e071'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # NUMERIC(5,4) → float4 (고정 4바이트, 하드웨어 비교)
+    op.execute("ALTER TABLE matching_result ALTER COLUMN overall_score TYPE real USING overall_score::real")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE matching_result ALTER COLUMN overall_score TYPE numeric(5, 4) USING round(overall_score::numeric, 4)")
@@ -0,0 +1,43 @@
+"""use_lz4_compression_for_jsonb
+
+Revision ID: fd383e45ac7b
+Revises: 0b6b27645c4b
+Create Date: 2025-10-24 13:00:41.552087
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fd383e45ac7b'
+down_revision: Union[str, None] = '0b6b27645c4b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 통째로 읽고 쓰는 JSONB 컬럼 (table, column)
+JSONB_COLUMNS = [
+    ('matching_result', 'category_scores'),
+    ('matching_result', 'matching_evidence'),
+    ('matching_result', 'penalties'),
+    ('matching_config', 'weights'),
+    ('matching_config', 'thresholds'),
+    ('matching_config', 'penalties'),
+    ('resume', 'parsed_data'),
+]
+
+
+def upgrade() -> None:
+    # pglz → lz4 (PG14+): 압축/해제 CPU 절감
+    # 기존 값은 다시 쓰일 때부터 lz4로 저장됨 (pg_column_compression()으로 확인)
+    for table, column in JSONB_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET STORAGE EXTENDED")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION lz4")
+
+
+def downgrade() -> None:
+    for table, column in JSONB_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION pglz")
@@ -0,0 +1,58 @@
+"""make_matching_grade_generated
+
+Revision ID: 3038147b7531
+Revises: fd383e45ac7b
+Create Date: 2025-10-24 15:00:09.873412
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3038147b7531'
+down_revision: Union[str, None] = 'fd383e45ac7b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 모델(MatchingResult.grade Computed)과 같은 식을 공유 (등급 기준이 어긋나지 않도록)
+from app.models.matching import GRADE_EXPRESSION
+
+
+def _create_grade_indexes() -> None:
+    # grade 컬럼 DROP 시 함께 삭제되는 인덱스 재생성
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_matching_result_grade
+            ON matching_result (grade)
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_matching_job_resume_created
+            ON matching_result (job_id, resume_id, created_at DESC)
+            INCLUDE (overall_score, grade)
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_match_excellent
+            ON matching_result (job_id, overall_score DESC)
+            WHERE grade = 'excellent'
+        """)
+
+
+def upgrade() -> None:
+    # 앱에서 따로 쓰던 grade를 overall_score로부터 DB가 계산하는 생성 컬럼으로 교체
+    op.execute("ALTER TABLE matching_result DROP COLUMN grade")
+    op.execute(f"""
+        ALTER TABLE matching_result
+        ADD COLUMN grade match_grade GENERATED ALWAYS AS ({GRADE_EXPRESSION}) STORED
+    """)
+    _create_grade_indexes()
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE matching_result DROP COLUMN grade")
+    op.execute("ALTER TABLE matching_result ADD COLUMN grade match_grade")
+    op.execute(f"UPDATE matching_result SET grade = {GRADE_EXPRESSION}")
+    _create_grade_indexes()
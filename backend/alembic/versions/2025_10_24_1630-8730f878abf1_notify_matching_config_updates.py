@@ -0,0 +1,41 @@
+"""notify_matching_config_updates
+
+Revision ID: 8730f878abf1
+Revises: 3038147b7531
+Create Date: 2025-10-24 16:30:44.120958
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8730f878abf1'
+down_revision: Union[str, None] = '3038147b7531'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # matching_config 변경 시 앱 워커들의 설정 캐시를 무효화하도록 알림
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_matching_config_updated()
+        RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('matching_config_updated', '');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER matching_config_updated
+        AFTER INSERT OR UPDATE OR DELETE ON matching_config
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_matching_config_updated()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS matching_config_updated ON matching_config")
+    op.execute("DROP FUNCTION IF EXISTS notify_matching_config_updated()")
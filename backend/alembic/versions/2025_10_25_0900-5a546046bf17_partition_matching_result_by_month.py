@@ -0,0 +1,179 @@
+"""partition_matching_result_by_month
+
+Revision ID: 5a546046bf17
+Revises: 8730f878abf1
+Create Date: 2025-10-25 09:00:17.402538
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a546046bf17'
+down_revision: Union[str, None] = '8730f878abf1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 미리 만들어 둘 향후 월 파티션 수 (이후는 스케줄러가 settings.MATCHING_PARTITION_MONTHS_AHEAD로 유지)
+MONTHS_AHEAD = 3
+
+# grade(생성 컬럼)를 제외한 실제 INSERT 대상 컬럼
+COPY_COLUMNS = """
+    id, job_id, resume_id, overall_score, category_scores, matching_evidence,
+    penalties, algorithm_version, calculation_time_ms, is_viewed, is_applied,
+    created_at, updated_at
+"""
+
+# matching_result를 참조하던 FK (table, constraint, ondelete)
+FEEDBACK_FKS = [
+    ('llm_feedback', 'llm_feedback_matching_result_id_fkey', 'CASCADE'),
+    ('user_feedback', 'user_feedback_matching_result_id_fkey', 'SET NULL'),
+]
+
+# 테이블 재생성 시 함께 옮겨야 하는 인덱스 (컬럼 정의는 이전 리비전들과 동일)
+INDEXES = [
+    "CREATE INDEX ix_matching_result_resume_id ON {table} (resume_id)",
+    "CREATE INDEX ix_matching_result_overall_score ON {table} (overall_score)",
+    "CREATE INDEX ix_matching_result_grade ON {table} (grade)",
+    "CREATE INDEX ix_matching_result_created_at ON {table} (created_at)",
+    """CREATE INDEX ix_matching_job_resume_created ON {table} (job_id, resume_id, created_at DESC)
+       INCLUDE (overall_score, grade)""",
+    """CREATE INDEX ix_match_excellent ON {table} (job_id, overall_score DESC)
+       WHERE grade = 'excellent'""",
+]
+
+INDEX_NAMES = [
+    'ix_matching_result_resume_id',
+    'ix_matching_result_overall_score',
+    'ix_matching_result_grade',
+    'ix_matching_result_created_at',
+    'ix_matching_job_resume_created',
+    'ix_match_excellent',
+]
+
+
+def _swap_out_old_table() -> None:
+    # 기존 테이블을 옆으로 치우고 이름이 겹치는 인덱스/PK를 정리
+    # 파티션 테이블의 PK는 (id, created_at)이라 id 단독 FK를 걸 수 없음 → 피드백 FK 제거 (인덱스는 유지)
+    for table, constraint, _ in FEEDBACK_FKS:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {constraint}")
+    op.execute("ALTER TABLE matching_result RENAME TO matching_result_old")
+    op.execute("ALTER TABLE matching_result_old RENAME CONSTRAINT matching_result_pkey TO matching_result_old_pkey")
+    for name in INDEX_NAMES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def upgrade() -> None:
+    _swap_out_old_table()
+
+    # 파티션 키(created_at)는 PK에 포함되어야 하므로 PK = (id, created_at)
+    # LIKE ... INCLUDING GENERATED/COMPRESSION: grade 생성 컬럼과 lz4 설정을 그대로 유지
+    op.execute("""
+        CREATE TABLE matching_result (
+            LIKE matching_result_old
+                INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING COMPRESSION INCLUDING STORAGE,
+            PRIMARY KEY (id, created_at),
+            FOREIGN KEY (job_id) REFERENCES job_posting (id) ON DELETE CASCADE,
+            FOREIGN KEY (resume_id) REFERENCES resume (id) ON DELETE CASCADE
+        ) PARTITION BY RANGE (created_at)
+    """)
+
+    # 월 파티션 생성 함수 (from_month가 속한 달 ~ 현재 달 + months_ahead, 이미 있으면 건너뜀)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION create_matching_result_partitions(
+            from_month timestamptz, months_ahead integer
+        ) RETURNS integer AS $$
+        DECLARE
+            month_start timestamptz := date_trunc('month', from_month);
+            last_month timestamptz := date_trunc('month', now()) + make_interval(months => months_ahead);
+            partition_name text;
+            created integer := 0;
+        BEGIN
+            WHILE month_start <= last_month LOOP
+                partition_name := 'matching_result_' || to_char(month_start, 'YYYY_MM');
+                IF to_regclass(partition_name) IS NULL THEN
+                    EXECUTE format(
+                        'CREATE TABLE %I PARTITION OF matching_result FOR VALUES FROM (%L) TO (%L)',
+                        partition_name, month_start, month_start + interval '1 month'
+                    );
+                    created := created + 1;
+                END IF;
+                month_start := month_start + interval '1 month';
+            END LOOP;
+            RETURN created;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(f"""
+        SELECT create_matching_result_partitions(
+            coalesce((SELECT min(created_at) FROM matching_result_old), now()),
+            {MONTHS_AHEAD}
+        )
+    """)
+    # 롤오버가 늦어져도 INSERT가 실패하지 않도록 받아 주는 기본 파티션
+    op.execute("CREATE TABLE matching_result_default PARTITION OF matching_result DEFAULT")
+
+    # created_at이 NULL인 과거 행은 PK(파티션 키) 제약 때문에 updated_at/now()로 채움
+    op.execute(f"""
+        INSERT INTO matching_result ({COPY_COLUMNS})
+        SELECT {COPY_COLUMNS.replace('created_at', 'coalesce(created_at, updated_at, now())')}
+        FROM matching_result_old
+    """)
+    op.execute("DROP TABLE matching_result_old")
+
+    # 부모 테이블 인덱스 → 각 파티션에 btree 자동 생성
+    for ddl in INDEXES:
+        op.execute(ddl.format(table='matching_result'))
+    # 시간 범위 스캔용 BRIN (append-only로 created_at 순서가 물리 순서와 일치)
+    op.execute("""
+        CREATE INDEX ix_matching_result_created_at_brin
+        ON matching_result USING brin (created_at) WITH (pages_per_range = 32)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE matching_result RENAME TO matching_result_old")
+    op.execute("ALTER INDEX matching_result_pkey RENAME TO matching_result_old_pkey")
+    op.execute("DROP INDEX IF EXISTS ix_matching_result_created_at_brin")
+    for name in INDEX_NAMES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+    op.execute("""
+        CREATE TABLE matching_result (
+            LIKE matching_result_old
+                INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING COMPRESSION INCLUDING STORAGE,
+            PRIMARY KEY (id),
+            FOREIGN KEY (job_id) REFERENCES job_posting (id) ON DELETE CASCADE,
+            FOREIGN KEY (resume_id) REFERENCES resume (id) ON DELETE CASCADE
+        )
+    """)
+    op.execute(f"""
+        INSERT INTO matching_result ({COPY_COLUMNS})
+        SELECT {COPY_COLUMNS} FROM matching_result_old
+    """)
+    op.execute("DROP TABLE matching_result_old CASCADE")
+    op.execute("DROP FUNCTION IF EXISTS create_matching_result_partitions(timestamptz, integer)")
+
+    for ddl in INDEXES:
+        op.execute(ddl.format(table='matching_result'))
+
+    # 파티션 기간 동안 생긴 고아 피드백 정리 후 FK 복원
+    op.execute("""
+        DELETE FROM llm_feedback f
+        WHERE f.matching_result_id IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM matching_result m WHERE m.id = f.matching_result_id)
+    """)
+    op.execute("""
+        UPDATE user_feedback f SET matching_result_id = NULL
+        WHERE f.matching_result_id IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM matching_result m WHERE m.id = f.matching_result_id)
+    """)
+    for table, constraint, ondelete in FEEDBACK_FKS:
+        op.execute(f"""
+            ALTER TABLE {table} ADD CONSTRAINT {constraint}
+            FOREIGN KEY (matching_result_id) REFERENCES matching_result (id) ON DELETE {ondelete}
+        """)
@@ -0,0 +1,56 @@
+"""move_resume_embedding_model_to_lookup
+
+Revision ID: 5c643d26ce98
+Revises: 5a546046bf17
+Create Date: 2025-10-25 11:00:52.718304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c643d26ce98'
+down_revision: Union[str, None] = '5a546046bf17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+DEFAULT_EMBEDDING_MODEL = 'jhgan/ko-sroberta-multitask'
+
+
+def upgrade() -> None:
+    # resume 행마다 반복 저장되던 모델명(~30B) → smallint FK (2B)
+    op.execute("""
+        CREATE TABLE embedding_model (
+            id smallserial PRIMARY KEY,
+            name varchar(100) NOT NULL UNIQUE
+        )
+    """)
+    op.execute(f"""
+        INSERT INTO embedding_model (name)
+        SELECT '{DEFAULT_EMBEDDING_MODEL}'
+        UNION
+        SELECT DISTINCT embedding_model FROM resume WHERE embedding_model IS NOT NULL
+        ON CONFLICT (name) DO NOTHING
+    """)
+    op.execute("ALTER TABLE resume ADD COLUMN embedding_model_id smallint REFERENCES embedding_model (id)")
+    op.execute("""
+        UPDATE resume r SET embedding_model_id = m.id
+        FROM embedding_model m
+        WHERE m.name = r.embedding_model
+    """)
+    op.execute("ALTER TABLE resume DROP COLUMN embedding_model")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE resume ADD COLUMN embedding_model varchar(100)")
+    op.execute("""
+        UPDATE resume r SET embedding_model = m.name
+        FROM embedding_model m
+        WHERE m.id = r.embedding_model_id
+    """)
+    op.execute("ALTER TABLE resume DROP COLUMN embedding_model_id")
+    op.execute("DROP TABLE embedding_model")
@@ -0,0 +1,42 @@
+"""make_resume_content_sha_unique
+
+Revision ID: b7e2c41d9a63
+Revises: 5c643d26ce98
+Create Date: 2025-10-25 13:00:41.526317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2c41d9a63'
+down_revision: Union[str, None] = '5c643d26ce98'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 동시 업로드로 이미 생긴 중복은 해시당 한 행만 남기고 나머지는 해시를 비움
+    # (처리 완료된 행 우선, 그다음 최신 행 — id는 uuid7이라 생성 순서와 일치)
+    op.execute("""
+        UPDATE resume r SET content_sha = NULL
+        FROM (
+            SELECT id, row_number() OVER (
+                PARTITION BY content_sha
+                ORDER BY (processing_status = 'completed') DESC, id DESC
+            ) AS rn
+            FROM resume
+            WHERE content_sha IS NOT NULL
+        ) d
+        WHERE r.id = d.id AND d.rn > 1
+    """)
+    op.drop_index(op.f('ix_resume_content_sha'), table_name='resume')
+    op.create_index(op.f('ix_resume_content_sha'), 'resume', ['content_sha'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_resume_content_sha'), table_name='resume')
+    op.create_index(op.f('ix_resume_content_sha'), 'resume', ['content_sha'], unique=False)
@@ -0,0 +1,60 @@
+"""restore_feedback_matching_result_fks
+
+Revision ID: d41f8a2c6e17
+Revises: b7e2c41d9a63
+Create Date: 2025-10-25 15:00:12.804733
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41f8a2c6e17'
+down_revision: Union[str, None] = 'b7e2c41d9a63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 파티션 전환(5a546046bf17)에서 제거된 피드백 FK (table, constraint, ondelete)
+FEEDBACK_FKS = [
+    ('llm_feedback', 'llm_feedback_matching_result_id_fkey', 'CASCADE'),
+    ('user_feedback', 'user_feedback_matching_result_id_fkey', 'SET NULL'),
+]
+
+
+def upgrade() -> None:
+    # 파티션 테이블 PK (id, created_at)를 참조할 수 있도록 파티션 키 컬럼을 함께 보관
+    for table, _, _ in FEEDBACK_FKS:
+        op.add_column(table, sa.Column('matching_result_created_at', sa.DateTime(timezone=True), nullable=True))
+        op.execute(f"""
+            UPDATE {table} f SET matching_result_created_at = m.created_at
+            FROM matching_result m
+            WHERE m.id = f.matching_result_id
+        """)
+
+    # FK가 없던 동안 생긴 고아 행을 원래 ON DELETE 동작대로 정리
+    op.execute("""
+        DELETE FROM llm_feedback
+        WHERE matching_result_id IS NOT NULL AND matching_result_created_at IS NULL
+    """)
+    op.execute("""
+        UPDATE user_feedback SET matching_result_id = NULL
+        WHERE matching_result_id IS NOT NULL AND matching_result_created_at IS NULL
+    """)
+
+    # 복합 FK (PostgreSQL 12+는 파티션 테이블 참조 허용), 삭제/파티션 정리 시 원래 동작 유지
+    for table, constraint, ondelete in FEEDBACK_FKS:
+        op.execute(f"""
+            ALTER TABLE {table} ADD CONSTRAINT {constraint}
+            FOREIGN KEY (matching_result_id, matching_result_created_at)
+            REFERENCES matching_result (id, created_at) ON DELETE {ondelete}
+        """)
+
+
+def downgrade() -> None:
+    for table, constraint, _ in FEEDBACK_FKS:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {constraint}")
+        op.drop_column(table, 'matching_result_created_at')
@@ -1,12 +1,16 @@
 """
 Job Posting API Routes
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from uuid import UUID
-from typing import Optional
+from typing import Optional, Tuple
+from datetime import date
+import base64
 
 from app.core.database import get_db
+from app.models.job import JobPosting
+from app.repositories.job_repository import JobRepository
 from app.schemas.job import (
     JobPostingResponse,
     JobPostingDetail,
@@ -18,34 +22,69 @@ from app.schemas.job import (
 router = APIRouter()
 
 
+def _encode_cursor(job: JobPosting) -> str:
+    """마지막 행의 (posted_at, id)를 불투명 커서로 인코딩"""
+    posted_at = job.posted_at.isoformat() if job.posted_at else ""
+    raw = f"{posted_at}|{job.id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> Tuple[Optional[date], UUID]:
+    """커서를 (posted_at, id)로 복호화"""
+    pad = "=" * (-len(cursor) % 4)
+    raw = base64.urlsafe_b64decode(cursor + pad).decode("utf-8")
+    posted_at, _, job_id = raw.partition("|")
+    return (date.fromisoformat(posted_at) if posted_at else None), UUID(job_id)
+
+
 @router.get("", response_model=JobListResponse)
 async def list_jobs(
-    page: int = 1,
-    page_size: int = 20,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
     search: Optional[str] = None,
     location: Optional[str] = None,
     experience_level: Optional[str] = None,
     employment_type: Optional[str] = None,
     company_id: Optional[UUID] = None,
     is_active: bool = True,
-    sort_by: str = "posted_at",
-    sort_order: str = "desc",
     db: Session = Depends(get_db)
 ):
     """
-    채용공고 목록 조회
-    
-    TODO: Implement job listing logic
-    - Apply filters
-    - Apply search
-    - Apply sorting
-    - Apply pagination
+    채용공고 목록 조회 (키셋 페이지네이션)
+
+    - posted_at 최신순(동일 시 id 역순)으로 정렬
+    - 다음 페이지는 응답의 next_cursor를 cursor로 전달하여 조회
     """
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="Job listing not implemented yet"
+    after = None
+    if cursor:
+        try:
+            after = _decode_cursor(cursor)
+        except (ValueError, UnicodeDecodeError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+
+    filters = {
+        "search": search,
+        "location": location,
+        "experience_level": experience_level,
+        "employment_type": employment_type,
+        "company_id": company_id,
+    }
+    jobs = JobRepository(db).get_page_after(
+        after=after,
+        limit=limit,
+        is_active=is_active,
+        filters=filters
     )
 
+    return {
+        "items": jobs,
+        "next_cursor": _encode_cursor(jobs[-1]) if len(jobs) == limit else None,
+        "limit": limit,
+    }
+
 
 @router.get("/{job_id}", response_model=JobPostingDetail)
 async def get_job(
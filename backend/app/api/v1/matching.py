@@ -2,12 +2,17 @@
 Matching API Routes - 매칭 API 엔드포인트
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select
+from sqlalchemy.orm import Session, Load
 from uuid import UUID
 from typing import Dict, Any
+from datetime import datetime
 import time
 
 from app.core.database import get_db
+from app.core.cache import get_cache, set_cache
 from app.schemas.matching import SearchJobsRequest, MatchingDetailResponse
 from app.services.matching_service import MatchingService
 from app.repositories.matching_repository import MatchingRepository
@@ -17,28 +22,36 @@ from app.models.resume import Resume
 router = APIRouter()
 
 
+# 등급별 설명 / 추천사항 (요청마다 dict를 새로 만들지 않도록 모듈 레벨로 유지)
+_GRADE_DESCRIPTIONS = {
+    "excellent": "매우 우수한 매칭도입니다. 서류 통과 가능성이 높습니다.",
+    "good": "양호한 매칭도입니다. 지원을 권장합니다.",
+    "fair": "보통 수준의 매칭도입니다. 일부 조건을 보완하면 좋겠습니다.",
+    "caution": "매칭도가 낮습니다. 조건을 충분히 검토해보세요.",
+    "poor": "매칭도가 매우 낮습니다. 지원을 신중히 고려하세요."
+}
+
+_RECOMMENDATIONS = {
+    "excellent": "지원을 적극 권장합니다.",
+    "good": "지원을 적극 권장합니다.",
+    "fair": "지원 가능하지만 부족한 부분을 보완하면 더 좋겠습니다.",
+    "caution": "신중히 검토 후 지원 여부를 결정하세요.",
+}
+_DEFAULT_RECOMMENDATION = "현재 상태로는 지원이 어려울 수 있습니다."
+
+
 def _get_grade_description(grade: str) -> str:
     """등급에 대한 사용자 친화적 설명"""
-    descriptions = {
-        "excellent": "매우 우수한 매칭도입니다. 서류 통과 가능성이 높습니다.",
-        "good": "양호한 매칭도입니다. 지원을 권장합니다.",
-        "fair": "보통 수준의 매칭도입니다. 일부 조건을 보완하면 좋겠습니다.",
-        "caution": "매칭도가 낮습니다. 조건을 충분히 검토해보세요.",
-        "poor": "매칭도가 매우 낮습니다. 지원을 신중히 고려하세요."
-    }
-    return descriptions.get(grade, "평가 결과를 확인해주세요.")
+    return _GRADE_DESCRIPTIONS.get(grade, "평가 결과를 확인해주세요.")
 
 
 def _get_recommendation(grade: str, score: float) -> str:
     """등급과 점수 기반 추천사항"""
-    if grade in ["excellent", "good"]:
-        return "지원을 적극 권장합니다."
-    elif grade == "fair":
-        return "지원 가능하지만 부족한 부분을 보완하면 더 좋겠습니다."
-    elif grade == "caution":
-        return "신중히 검토 후 지원 여부를 결정하세요."
-    else:
-        return "현재 상태로는 지원이 어려울 수 있습니다."
+    return _RECOMMENDATIONS.get(grade, _DEFAULT_RECOMMENDATION)
+
+
+# 누락 키 기본값용 공유 빈 dict (읽기 전용, 절대 변경하지 않음)
+_EMPTY: dict = {}
 
 
 def _extract_strengths(evidence: dict) -> list:
@@ -46,18 +59,15 @@ def _extract_strengths(evidence: dict) -> list:
     strengths = []
     
     # 필수 조건 매칭
-    required_matched = evidence.get('required_skills', {}).get('matched', [])
-    if required_matched:
-        strengths.append(f"필수 조건 {len(required_matched)}개 충족")
+    if (matched := (evidence.get('required_skills') or _EMPTY).get('matched')):
+        strengths.append(f"필수 조건 {len(matched)}개 충족")
     
     # 우대 조건 매칭
-    preferred_matched = evidence.get('preferred_skills', {}).get('matched', [])
-    if preferred_matched:
-        strengths.append(f"우대 조건 {len(preferred_matched)}개 충족")
+    if (matched := (evidence.get('preferred_skills') or _EMPTY).get('matched')):
+        strengths.append(f"우대 조건 {len(matched)}개 충족")
     
     # 경력 레벨 매칭
-    exp_evidence = evidence.get('experience_evidence', {})
-    if exp_evidence.get('level_match', False):
+    if (evidence.get('experience_evidence') or _EMPTY).get('level_match'):
         strengths.append("경력 레벨 적합")
     
     return strengths
@@ -68,14 +78,12 @@ def _extract_improvement_areas(evidence: dict, penalties: dict) -> list:
     areas = []
     
     # 부족한 필수 스킬
-    required_missing = evidence.get('required_skills', {}).get('missing', [])
-    if required_missing:
-        areas.append(f"필수 스킬 부족: {', '.join(required_missing[:3])}")
+    if (missing := (evidence.get('required_skills') or _EMPTY).get('missing')):
+        areas.append(f"필수 스킬 부족: {', '.join(missing[:3])}")
     
     # 부족한 우대 스킬
-    preferred_missing = evidence.get('preferred_skills', {}).get('missing', [])
-    if preferred_missing:
-        areas.append(f"우대 스킬 부족: {', '.join(preferred_missing[:2])}")
+    if (missing := (evidence.get('preferred_skills') or _EMPTY).get('missing')):
+        areas.append(f"우대 스킬 부족: {', '.join(missing[:2])}")
     
     # 경력 부족
     if penalties.get('experience_significantly_lacking'):
@@ -84,11 +92,135 @@ def _extract_improvement_areas(evidence: dict, penalties: dict) -> list:
     return areas
 
 
-@router.post("/search-jobs")
+def _get_job_and_resume(
+    db: Session,
+    job_id: UUID,
+    resume_id: UUID
+):
+    """채용공고와 이력서를 한 번의 쿼리(1 RTT)로 조회. 없으면 (None, None)
+
+    동기 Session을 사용하므로 async 핸들러에서는 run_in_threadpool로 호출해
+    이벤트 루프가 DB 대기로 막히지 않도록 한다.
+    """
+    stmt = (
+        select(JobPosting, Resume)
+        .where(JobPosting.id == job_id, Resume.id == resume_id)
+        .options(Load(JobPosting).raiseload("*"), Load(Resume).raiseload("*"))
+    )
+    row = db.execute(stmt).first()
+    if row is None:
+        return None, None
+    return row[0], row[1]
+
+
+# 매칭 상세 응답 캐시 유지 시간 (초)
+MATCHING_CACHE_TTL = 3600
+
+
+def _active_config_stamp(db: Session) -> str:
+    """활성 매칭 설정 식별자 (id + 수정 시각, 설정 변경 NOTIFY 시 프로세스 캐시가 무효화되어 새 값)"""
+    config = MatchingRepository(db).get_active_config()
+    if config is None:
+        return "default"
+    config_ts = config.updated_at.timestamp() if config.updated_at else 0
+    return f"{config.id}:{config_ts}"
+
+
+def _matching_cache_key(job: JobPosting, resume: Resume, config_stamp: str, include_feedback: bool) -> str:
+    """매칭 상세 응답 캐시 키 (공고/이력서/활성 설정 수정 시각 포함 → 바뀌면 자동 무효화)"""
+    job_ts = job.updated_at.timestamp() if job.updated_at else 0
+    resume_ts = resume.updated_at.timestamp() if resume.updated_at else 0
+    fb = 1 if include_feedback else 0
+    return f"match:{job.id}:{resume.id}:{job_ts}:{resume_ts}:{config_stamp}:{fb}"
+
+
+def _build_matching_response(
+    matching_id: str,
+    job: JobPosting,
+    resume: Resume,
+    result,
+    *,
+    include_feedback: bool
+) -> Dict[str, Any]:
+    """매칭 상세 응답 구성 (상세 조회/피드백 API 공용)"""
+    evidence = result.matching_evidence
+    category_scores = result.category_scores
+    required = evidence.get('required_skills', {})
+    preferred = evidence.get('preferred_skills', {})
+    experience = evidence.get('experience_evidence', {})
+    overall_score = float(result.overall_score)
+
+    response = {
+        "matching_id": matching_id,
+        "job": {
+            "id": str(job.id),
+            "title": job.title,
+            "company": job.company_name or "Unknown Company",
+            "location": job.location,
+            "experience_level": job.experience_level,
+            "employment_type": job.employment_type,
+            "salary_range": f"{job.salary_min}-{job.salary_max} {job.salary_currency}" if job.salary_min and job.salary_max else None,
+            "posted_at": job.posted_at.isoformat() if job.posted_at else None
+        },
+        "resume": {
+            "id": str(resume.id),
+            "candidate_name": resume.candidate_name or 'Unknown'
+        },
+        "overall_assessment": {
+            "score": round(overall_score * 100, 1),  # 백분율로 변환
+            "grade": result.grade,
+            "description": _get_grade_description(result.grade),
+            "recommendation": _get_recommendation(result.grade, overall_score)
+        },
+        "detailed_analysis": {
+            "required_qualifications": {
+                "score": round(category_scores.get('required_match', {}).get('score', 0) * 100, 1),
+                "matched_skills": required.get('matched', []),
+                "missing_skills": required.get('missing', []),
+                "match_rate": required.get('match_rate', '0/0'),
+                "detailed_analysis": required.get('detailed_analysis', [])
+            },
+            "preferred_qualifications": {
+                "score": round(category_scores.get('preferred_match', {}).get('score', 0) * 100, 1),
+                "matched_skills": preferred.get('matched', []),
+                "missing_skills": preferred.get('missing', []),
+                "detailed_analysis": preferred.get('detailed_analysis', [])
+            },
+            "experience_fit": {
+                "score": round(category_scores.get('experience_match', {}).get('score', 0) * 100, 1),
+                "required_years": experience.get('required_years', 0),
+                "candidate_years": experience.get('candidate_years', 0),
+                "level_match": experience.get('level_match', False),
+                "details": experience.get('details', '')
+            },
+            "overall_similarity": {
+                "score": round(category_scores.get('overall_similarity', {}).get('score', 0) * 100, 1),
+                "description": "전체적인 프로필과의 유사도"
+            }
+        },
+        "strengths": _extract_strengths(evidence),
+        "improvement_areas": _extract_improvement_areas(evidence, result.penalties),
+    }
+
+    if include_feedback:
+        response["ai_feedback"] = {
+            "personalized_advice": evidence.get('ai_feedback', ''),
+            "generated_at": datetime.utcnow().isoformat()
+        }
+
+    response["technical_details"] = {
+        "algorithm_version": "v2.0-sectional",
+        "calculation_time_ms": result.calculation_time_ms,
+        "penalties_applied": result.penalties
+    }
+    return response
+
+
+@router.post("/search-jobs", response_class=ORJSONResponse)
 async def search_jobs_for_resume(
     request: SearchJobsRequest,
     db: Session = Depends(get_db)
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     이력서 기반 채용공고 매칭 검색
     
@@ -99,26 +231,28 @@ async def search_jobs_for_resume(
         매칭된 채용공고 목록
     """
     try:
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # 매칭 서비스 초기화
         matching_service = MatchingService(db)
         
         # 채용공고 검색 및 매칭 (검색 단계: 피드백 비활성)
-        results = matching_service.search_jobs_for_resume(
+        results = await run_in_threadpool(
+            matching_service.search_jobs_for_resume,
             resume_id=request.resume_id,
-            filters=request.filters.dict() if request.filters else None,
+            filters=request.filters,
             limit=request.limit
         )
         
-        processing_time = int((time.time() - start_time) * 1000)
+        processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
         
-        return {
-            "resume_id": str(request.resume_id),
+        # jsonable_encoder를 거치지 않고 orjson으로 바로 직렬화 (UUID/numpy 네이티브 지원)
+        return ORJSONResponse({
+            "resume_id": request.resume_id,
             "matches": results,
             "total_count": len(results),
             "processing_time_ms": processing_time
-        }
+        })
         
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -142,75 +276,28 @@ async def get_matching_detail_by_token(
     """
     try:
         svc = MatchingService(db)
-        ids = svc.decode_matching_id(matching_id)
-        if not ids.get("resume_id") or not ids.get("job_id"):
+        resume_id, job_id = svc.decode_matching_id(matching_id)
+        if not resume_id or not job_id:
             raise HTTPException(status_code=404, detail="Invalid matching_id")
 
-        job = db.query(JobPosting).filter(JobPosting.id == ids["job_id"]).first()
-        resume = db.query(Resume).filter(Resume.id == ids["resume_id"]).first()
+        job, resume = await run_in_threadpool(_get_job_and_resume, db, UUID(job_id), UUID(resume_id))
         if not job or not resume:
             raise HTTPException(status_code=404, detail="Job or Resume not found")
 
+        # 동일 공고/이력서/설정 버전이면 캐시된 응답 반환 (재계산 생략)
+        config_stamp = await run_in_threadpool(_active_config_stamp, db)
+        cache_key = _matching_cache_key(job, resume, config_stamp, include_feedback=False)
+        cached = await get_cache(cache_key)
+        if cached is not None:
+            return cached
+
         # Bi-encoder만 사용 (Cross-encoder 제거됨)
-        result = svc.calculate_matching_score(job, resume, generate_feedback=False)
+        result = await run_in_threadpool(svc.calculate_matching_score, job, resume, generate_feedback=False)
 
         # 사용자 친화적인 응답 구조로 변환
-        return {
-            "matching_id": matching_id,
-            "job": {
-                "id": str(job.id),
-                "title": job.title,
-                "company": job.company.name if job.company else "Unknown Company",
-                "location": job.location,
-                "experience_level": job.experience_level,
-                "employment_type": getattr(job, 'employment_type', None),
-                "salary_range": f"{job.salary_min}-{job.salary_max} {job.salary_currency}" if job.salary_min and job.salary_max else None,
-                "posted_at": job.posted_at.isoformat() if job.posted_at else None
-            },
-            "resume": {
-                "id": str(resume.id),
-                "candidate_name": resume.parsed_data.get('personal_info', {}).get('name', 'Unknown') if resume.parsed_data else 'Unknown'
-            },
-            "overall_assessment": {
-                "score": round(float(result.overall_score) * 100, 1),  # 백분율로 변환
-                "grade": result.grade,
-                "description": _get_grade_description(result.grade),
-                "recommendation": _get_recommendation(result.grade, result.overall_score)
-            },
-            "detailed_analysis": {
-                "required_qualifications": {
-                    "score": round(result.category_scores.get('required_match', {}).get('score', 0) * 100, 1),
-                    "matched_skills": result.matching_evidence.get('required_skills', {}).get('matched', []),
-                    "missing_skills": result.matching_evidence.get('required_skills', {}).get('missing', []),
-                    "match_rate": result.matching_evidence.get('required_skills', {}).get('match_rate', '0/0'),
-                    "detailed_analysis": result.matching_evidence.get('required_skills', {}).get('detailed_analysis', [])
-                },
-                "preferred_qualifications": {
-                    "score": round(result.category_scores.get('preferred_match', {}).get('score', 0) * 100, 1),
-                    "matched_skills": result.matching_evidence.get('preferred_skills', {}).get('matched', []),
-                    "missing_skills": result.matching_evidence.get('preferred_skills', {}).get('missing', []),
-                    "detailed_analysis": result.matching_evidence.get('preferred_skills', {}).get('detailed_analysis', [])
-                },
-                "experience_fit": {
-                    "score": round(result.category_scores.get('experience_match', {}).get('score', 0) * 100, 1),
-                    "required_years": result.matching_evidence.get('experience_evidence', {}).get('required_years', 0),
-                    "candidate_years": result.matching_evidence.get('experience_evidence', {}).get('candidate_years', 0),
-                    "level_match": result.matching_evidence.get('experience_evidence', {}).get('level_match', False),
-                    "details": result.matching_evidence.get('experience_evidence', {}).get('details', '')
-                },
-                "overall_similarity": {
-                    "score": round(result.category_scores.get('overall_similarity', {}).get('score', 0) * 100, 1),
-                    "description": "전체적인 프로필과의 유사도"
-                }
-            },
-            "strengths": _extract_strengths(result.matching_evidence),
-            "improvement_areas": _extract_improvement_areas(result.matching_evidence, result.penalties),
-            "technical_details": {
-                "algorithm_version": "v2.0-sectional",
-                "calculation_time_ms": result.calculation_time_ms,
-                "penalties_applied": result.penalties
-            }
-        }
+        response = _build_matching_response(matching_id, job, resume, result, include_feedback=False)
+        await set_cache(cache_key, response, expire=MATCHING_CACHE_TTL)
+        return response
     except HTTPException:
         raise
     except Exception as e:
@@ -228,79 +315,28 @@ async def generate_feedback_on_demand(
     """
     try:
         svc = MatchingService(db)
-        ids = svc.decode_matching_id(matching_id)
-        if not ids.get("resume_id") or not ids.get("job_id"):
+        resume_id, job_id = svc.decode_matching_id(matching_id)
+        if not resume_id or not job_id:
             raise HTTPException(status_code=404, detail="Invalid matching_id")
 
-        job = db.query(JobPosting).filter(JobPosting.id == ids["job_id"]).first()
-        resume = db.query(Resume).filter(Resume.id == ids["resume_id"]).first()
+        job, resume = await run_in_threadpool(_get_job_and_resume, db, UUID(job_id), UUID(resume_id))
         if not job or not resume:
             raise HTTPException(status_code=404, detail="Job or Resume not found")
 
+        # 동일 공고/이력서/설정 버전이면 캐시된 응답 반환 (재계산 생략)
+        config_stamp = await run_in_threadpool(_active_config_stamp, db)
+        cache_key = _matching_cache_key(job, resume, config_stamp, include_feedback=True)
+        cached = await get_cache(cache_key)
+        if cached is not None:
+            return cached
+
         # 피드백 활성화하여 재계산
-        result = svc.calculate_matching_score(job, resume, generate_feedback=True)
+        result = await run_in_threadpool(svc.calculate_matching_score, job, resume, generate_feedback=True)
 
         # 사용자 친화적인 응답 구조로 변환 (피드백 포함)
-        return {
-            "matching_id": matching_id,
-            "job": {
-                "id": str(job.id),
-                "title": job.title,
-                "company": job.company.name if job.company else "Unknown Company",
-                "location": job.location,
-                "experience_level": job.experience_level,
-                "employment_type": getattr(job, 'employment_type', None),
-                "salary_range": f"{job.salary_min}-{job.salary_max} {job.salary_currency}" if job.salary_min and job.salary_max else None,
-                "posted_at": job.posted_at.isoformat() if job.posted_at else None
-            },
-            "resume": {
-                "id": str(resume.id),
-                "candidate_name": resume.parsed_data.get('personal_info', {}).get('name', 'Unknown') if resume.parsed_data else 'Unknown'
-            },
-            "overall_assessment": {
-                "score": round(float(result.overall_score) * 100, 1),  # 백분율로 변환
-                "grade": result.grade,
-                "description": _get_grade_description(result.grade),
-                "recommendation": _get_recommendation(result.grade, result.overall_score)
-            },
-            "detailed_analysis": {
-                "required_qualifications": {
-                    "score": round(result.category_scores.get('required_match', {}).get('score', 0) * 100, 1),
-                    "matched_skills": result.matching_evidence.get('required_skills', {}).get('matched', []),
-                    "missing_skills": result.matching_evidence.get('required_skills', {}).get('missing', []),
-                    "match_rate": result.matching_evidence.get('required_skills', {}).get('match_rate', '0/0'),
-                    "detailed_analysis": result.matching_evidence.get('required_skills', {}).get('detailed_analysis', [])
-                },
-                "preferred_qualifications": {
-                    "score": round(result.category_scores.get('preferred_match', {}).get('score', 0) * 100, 1),
-                    "matched_skills": result.matching_evidence.get('preferred_skills', {}).get('matched', []),
-                    "missing_skills": result.matching_evidence.get('preferred_skills', {}).get('missing', []),
-                    "detailed_analysis": result.matching_evidence.get('preferred_skills', {}).get('detailed_analysis', [])
-                },
-                "experience_fit": {
-                    "score": round(result.category_scores.get('experience_match', {}).get('score', 0) * 100, 1),
-                    "required_years": result.matching_evidence.get('experience_evidence', {}).get('required_years', 0),
-                    "candidate_years": result.matching_evidence.get('experience_evidence', {}).get('candidate_years', 0),
-                    "level_match": result.matching_evidence.get('experience_evidence', {}).get('level_match', False),
-                    "details": result.matching_evidence.get('experience_evidence', {}).get('details', '')
-                },
-                "overall_similarity": {
-                    "score": round(result.category_scores.get('overall_similarity', {}).get('score', 0) * 100, 1),
-                    "description": "전체적인 프로필과의 유사도"
-                }
-            },
-            "strengths": _extract_strengths(result.matching_evidence),
-            "improvement_areas": _extract_improvement_areas(result.matching_evidence, result.penalties),
-            "ai_feedback": {
-                "personalized_advice": result.matching_evidence.get('ai_feedback', ''),
-                "generated_at": result.calculation_time_ms
-            },
-            "technical_details": {
-                "algorithm_version": "v2.0-sectional",
-                "calculation_time_ms": result.calculation_time_ms,
-                "penalties_applied": result.penalties
-            }
-        }
+        response = _build_matching_response(matching_id, job, resume, result, include_feedback=True)
+        await set_cache(cache_key, response, expire=MATCHING_CACHE_TTL)
+        return response
     except HTTPException:
         raise
     except Exception as e:
@@ -318,14 +354,13 @@ async def compare_resume_and_job(
     - 카테고리별 점수, 매칭 근거, LLM 피드백 포함
     """
     try:
-        job = db.query(JobPosting).filter(JobPosting.id == job_id).first()
-        resume = db.query(Resume).filter(Resume.id == resume_id).first()
+        job, resume = await run_in_threadpool(_get_job_and_resume, db, job_id, resume_id)
         if not job or not resume:
             raise HTTPException(status_code=404, detail="Job or Resume not found")
 
         matching_service = MatchingService(db)
         # 상세 단계: 피드백 활성화
-        result = matching_service.calculate_matching_score(job, resume, generate_feedback=True)
+        result = await run_in_threadpool(matching_service.calculate_matching_score, job, resume, generate_feedback=True)
 
         return {
             "job_id": str(job.id),
@@ -356,17 +391,16 @@ async def get_sentence_level_matches(
     """
     try:
         svc = MatchingService(db)
-        ids = svc.decode_matching_id(matching_id)
-        if not ids.get("resume_id") or not ids.get("job_id"):
+        resume_id, job_id = svc.decode_matching_id(matching_id)
+        if not resume_id or not job_id:
             raise HTTPException(status_code=404, detail="Invalid matching_id")
 
-        job = db.query(JobPosting).filter(JobPosting.id == ids["job_id"]).first()
-        resume = db.query(Resume).filter(Resume.id == ids["resume_id"]).first()
+        job, resume = await run_in_threadpool(_get_job_and_resume, db, UUID(job_id), UUID(resume_id))
         if not job or not resume:
             raise HTTPException(status_code=404, detail="Job or Resume not found")
 
         # 문장 단위 매칭 결과 계산
-        result = svc.calculate_matching_score(job, resume, generate_feedback=False)
+        result = await run_in_threadpool(svc.calculate_matching_score, job, resume, generate_feedback=False)
         
         # 문장 단위 매칭 정보 추출
         sentence_matches = {
@@ -375,7 +409,8 @@ async def get_sentence_level_matches(
         }
         
         # Required 조건 분석
-        req_analysis = result.matching_evidence.get('required_skills', {}).get('detailed_analysis', [])
+        req_evidence = result.matching_evidence.get('required_skills') or _EMPTY
+        req_analysis = req_evidence.get('detailed_analysis', [])
         for analysis in req_analysis:
             sentence_matches["required_conditions"].append({
                 "condition": analysis.get('condition', ''),
@@ -387,7 +422,8 @@ async def get_sentence_level_matches(
             })
         
         # Preferred 조건 분석
-        pref_analysis = result.matching_evidence.get('preferred_skills', {}).get('detailed_analysis', [])
+        pref_evidence = result.matching_evidence.get('preferred_skills') or _EMPTY
+        pref_analysis = pref_evidence.get('detailed_analysis', [])
         for analysis in pref_analysis:
             sentence_matches["preferred_conditions"].append({
                 "condition": analysis.get('condition', ''),
@@ -406,10 +442,10 @@ async def get_sentence_level_matches(
             "grade": result.grade,
             "sentence_matches": sentence_matches,
             "summary": {
-                "total_required": len(req_analysis),
-                "matched_required": sum(1 for a in req_analysis if a.get('matched')),
-                "total_preferred": len(pref_analysis),
-                "matched_preferred": sum(1 for a in pref_analysis if a.get('matched'))
+                "total_required": req_evidence.get('total_count', 0),
+                "matched_required": req_evidence.get('matched_count', 0),
+                "total_preferred": pref_evidence.get('total_count', 0),
+                "matched_preferred": pref_evidence.get('matched_count', 0)
             }
         }
         
@@ -440,7 +476,8 @@ async def test_matching(db: Session = Depends(get_db)):
         
         # 매칭 실행
         matching_service = MatchingService(db)
-        results = matching_service.search_jobs_for_resume(
+        results = await run_in_threadpool(
+            matching_service.search_jobs_for_resume,
             resume_id=resume.id,
             limit=10
         )
@@ -1,119 +1,164 @@
 """
 Resume API Routes
 """
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, UploadFile, File, Form
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from uuid import UUID
+from datetime import datetime, timedelta, timezone
 from typing import Optional
+import hashlib
+import io
 import os
-import shutil
 import time
 
-from app.core.database import get_db
-from app.models.resume import Resume
+from app.core.database import get_db, SessionLocal
+from app.models.resume import Resume, EmbeddingModel
 from app.core.config import settings
-from app.services.parsing.pdf_parser import PDFParser
-from app.services.parsing.docx_parser import DOCXParser
-from app.services.parsing.xlsx_parser import XLSXParser
-from app.services.parsing.llm_parser import LLMParser
+from app.services.parsing.text_extraction import extract_text_in_pool
+from app.services.parsing.llm_parser import get_llm_parser
 from app.services.ml.embedding import get_embedding_service
 from app.core.logging import logger
 from app.schemas.resume import (
+    ResumeDetail,
     ResumeUploadResponse,
 )
 
 router = APIRouter()
 
+# 요청 경로에서 반복 조회하지 않도록 설정값을 모듈 상수로 바인딩
+_UPLOAD_DIR = settings.UPLOAD_DIR
+_EMBEDDING_MODEL = settings.EMBEDDING_MODEL
+# INSERT 안에서 모델명 → embedding_model.id로 변환 (별도 조회 왕복 없음)
+_EMBEDDING_MODEL_ID = (
+    select(EmbeddingModel.id).where(EmbeddingModel.name == _EMBEDDING_MODEL).scalar_subquery()
+)
+_MAX_UPLOAD_SIZE = settings.MAX_UPLOAD_SIZE
+_PROCESSING_TIMEOUT = timedelta(minutes=settings.RESUME_PROCESSING_TIMEOUT_MINUTES)
+_ALLOWED_EXTENSIONS = frozenset(
+    e.strip().lower() for e in settings.ALLOWED_EXTENSIONS.split(",") if e.strip()
+)
 
-def _safe_list(value):
-    return value if isinstance(value, list) else []
+# 업로드 디렉토리는 import 시 한 번만 보장
+os.makedirs(_UPLOAD_DIR, exist_ok=True)
 
 
+# 업로드 복사 청크 크기 (1 MiB)
+_COPY_CHUNK_SIZE = 1 << 20
 
 
-@router.post("/upload-and-process", response_model=ResumeUploadResponse, status_code=status.HTTP_201_CREATED)
-def upload_and_process_resume(
-    file: UploadFile = File(...),
-    is_primary: bool = Form(False),
-    db: Session = Depends(get_db)
-):
+def _hash_upload(file: UploadFile) -> str:
+    """업로드 내용의 BLAKE2b 해시 (중복 이력서 판별용, 1 MiB 단위 스트리밍)
+
+    디스크에 쓰기 전 첫 번째 순회이므로 여기서 MAX_UPLOAD_SIZE 초과를 차단한다.
     """
-    이력서 업로드 + 파싱 + 임베딩 생성 + DB 저장
-    - 로컬 저장소에 파일 저장
-    - 파일 타입에 따라 텍스트 추출
-    - LLMParser로 구조화 및 핵심 정보 추출
-    - 전체/섹션 임베딩 생성
-    - Resume 레코드 생성 후 반환
+    src = file.file
+    src.seek(0)
+    h = hashlib.blake2b(digest_size=16)
+    total = 0
+    while chunk := src.read(_COPY_CHUNK_SIZE):
+        total += len(chunk)
+        if total > _MAX_UPLOAD_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"File too large (max {_MAX_UPLOAD_SIZE} bytes)",
+            )
+        h.update(chunk)
+    return h.hexdigest()
+
+
+def _persist_upload(file: UploadFile, disk_path: str) -> int:
+    """업로드 파일을 디스크에 저장하고 저장된 바이트 수 반환
+
+    FastAPI가 이미 SpooledTemporaryFile로 스풀링해 두었으므로, 디스크로 넘어간
+    경우 os.sendfile로 커널 내 복사(zero-copy)하고, 메모리에 있으면 1 MiB 단위로 쓴다.
     """
-    start_time = time.time()
-    try:
-        # 1) 디렉토리 보장
-        os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+    src = file.file
+    src.seek(0)
+    raw = getattr(src, "_file", src)  # SpooledTemporaryFile의 실제 파일 객체
 
-        # 2) 파일 저장
-        original_name = file.filename
-        ext = (os.path.splitext(original_name)[1] or "").lower()
-        safe_name = f"{int(time.time()*1000)}_{original_name}"
-        disk_path = os.path.join(settings.UPLOAD_DIR, safe_name)
-
-        with open(disk_path, "wb") as out:
-            shutil.copyfileobj(file.file, out)
-
-        file_size = os.path.getsize(disk_path)
-        file_type = ext.replace(".", "") or "txt"
-
-        # 3) 텍스트 추출
-        if file_type == "pdf":
-            raw_text = PDFParser().extract_text(disk_path)
-        elif file_type in ("docx", "doc"):
-            raw_text = DOCXParser().extract_text(disk_path)
-        elif file_type in ("xlsx", "xls"):
-            raw_text = XLSXParser().extract_text(disk_path)
-        else:
-            # 기본 텍스트 파일로 처리
-            with open(disk_path, "r", encoding="utf-8", errors="ignore") as f:
-                raw_text = f.read()
-
-        # 4) LLM 파싱 및 핵심 정보 추출
-        # raw_text가 비었거나 매우 짧으면 파싱/임베딩 생략
-        if not raw_text or not raw_text.strip():
-            resume = Resume(
-                user_id=None,
-                file_name=original_name,
-                file_url=disk_path,
-                file_type=file_type,
-                file_size=file_size,
-                raw_text=raw_text or "",
-                parsed_data={},
-                extracted_skills=[],
-                extracted_experience_years=0,
-                extracted_domains=[],
-                extracted_education_level="",
-                embedding=None,
-                embedding_model=settings.EMBEDDING_MODEL,
-                skills_embedding=None,
-                experience_embedding=None,
-                projects_embedding=None,
-                is_primary=is_primary,
-            )
-            db.add(resume)
-            db.commit()
-            db.refresh(resume)
-            processing_time_ms = int((time.time() - start_time) * 1000)
-            return {
-                "resume_id": resume.id,
-                "file_name": resume.file_name,
-                "file_url": resume.file_url,
-                "parsed_data": {},
-                "extracted_skills": [],
-                "extracted_experience_years": 0,
-                "processing_time_ms": processing_time_ms,
-                "message": "empty_text_skipped",
-            }
+    with open(disk_path, "wb") as out:
+        out_fd = out.fileno()
+        try:
+            in_fd = raw.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            in_fd = None
+
+        if in_fd is not None and hasattr(os, "sendfile"):
+            offset = 0
+            while True:
+                sent = os.sendfile(out_fd, in_fd, offset, _COPY_CHUNK_SIZE)
+                if sent == 0:
+                    break
+                offset += sent
+            return offset
+
+        written = 0
+        while chunk := src.read(_COPY_CHUNK_SIZE):
+            written += os.write(out_fd, chunk)
+        return written
+
+
+
+def _needs_reprocessing(resume: Resume) -> bool:
+    """재업로드 시 _finalize_resume을 다시 돌려야 하는지 (failed 또는 타임아웃된 processing)"""
+    if resume.processing_status == "failed":
+        return True
+    if resume.processing_status == "processing":
+        started = resume.updated_at or resume.created_at
+        return started is None or datetime.now(timezone.utc) - started > _PROCESSING_TIMEOUT
+    return False
+
+
+def _reuse_existing_resume(
+    db: Session,
+    existing: Resume,
+    background_tasks: BackgroundTasks,
+    start_time: float,
+    requeue: bool = True,
+) -> dict:
+    """동일 내용 이력서가 이미 있을 때의 응답
+
+    처리 완료된 행은 그대로 재사용하고, 실패했거나 처리 중에 멈춘(타임아웃 초과) 행만
+    재업로드로 복구되도록 같은 id로 _finalize_resume을 다시 예약한다.
+    아직 처리 중인 행은 첫 번째 작업과 동시에 돌지 않도록 재예약하지 않는다.
+    """
+    if requeue and _needs_reprocessing(existing):
+        existing.processing_status = "processing"
+        existing.updated_at = datetime.now(timezone.utc)  # 상태가 같아도 타임아웃 기준 시각은 갱신
+        db.commit()
+        background_tasks.add_task(_finalize_resume, existing.id)
+
+    processing_time_ms = int((time.time() - start_time) * 1000)
+    return {
+        "resume_id": existing.id,
+        "file_name": existing.file_name,
+        "file_url": existing.file_url,
+        "parsed_data": existing.parsed_data or {},
+        "extracted_skills": existing.extracted_skills or [],
+        "extracted_experience_years": existing.extracted_experience_years or 0,
+        "processing_time_ms": processing_time_ms,
+        "processing_status": existing.processing_status,
+    }
+
+
+def _finalize_resume(resume_id: UUID) -> None:
+    """
+    백그라운드 작업: LLM 파싱 + 핵심 정보 추출 + 문장 임베딩 인덱싱
+
+    요청 세션은 응답 후 닫히므로 자체 SessionLocal()을 연다.
+    """
+    db = SessionLocal()
+    try:
+        resume = db.get(Resume, resume_id)
+        if not resume:
+            logger.warning(f"Resume not found for finalize: {resume_id}")
+            return
 
-        llm_parser = LLMParser()
+        llm_parser = get_llm_parser()
         try:
-            parsed = llm_parser.parse_resume(raw_text)
+            parsed = llm_parser.parse_resume(resume.raw_text)
         except Exception:
             parsed = {}
         try:
@@ -126,58 +171,136 @@ def upload_and_process_resume(
                 "extracted_education_level": "",
             }
 
-        # 5) 우선 DB에 저장 (임베딩 없이)
-        resume = Resume(
-            user_id=None,
-            file_name=original_name,
-            file_url=disk_path,
-            file_type=file_type,
-            file_size=file_size,
-            raw_text=raw_text or "",
-            parsed_data=parsed or {},
-            extracted_skills=extracted.get("extracted_skills", []),
-            extracted_experience_years=int(extracted.get("extracted_experience_years", 0) or 0),
-            extracted_domains=extracted.get("extracted_domains", []),
-            extracted_education_level=extracted.get("extracted_education_level", ""),
-            embedding=None,
-            embedding_model=settings.EMBEDDING_MODEL,
-            skills_embedding=None,
-            experience_embedding=None,
-            projects_embedding=None,
-            is_primary=is_primary,
-        )
-        db.add(resume)
+        resume.parsed_data = parsed or {}
+        resume.candidate_name = ((parsed or {}).get("personal_info") or {}).get("name")
+        resume.extracted_skills = extracted.get("extracted_skills", [])
+        resume.extracted_experience_years = int(extracted.get("extracted_experience_years", 0) or 0)
+        resume.extracted_domains = extracted.get("extracted_domains", [])
+        resume.extracted_education_level = extracted.get("extracted_education_level", "")
+        # 파싱 결과는 먼저 확정 (완료 상태는 문장 인덱싱이 끝난 뒤에 기록)
         db.commit()
-        db.refresh(resume)
-
-        # 6) 문장 단위 임베딩만 생성 (최적화)
-        has_sentences = False
 
+        # 문장 단위 임베딩만 생성 (최적화)
+        # 매칭은 문장 임베딩이 있어야 가능하므로 인덱싱까지 성공해야 "completed",
+        # 실패하면 "failed"로 남겨 재업로드 시 다시 처리되도록 한다
         try:
-            # 문장 단위 임베딩 생성 (전체/섹션별 임베딩 제거)
             from app.services.indexing.sentence_indexer import SentenceIndexer
             sentence_indexer = SentenceIndexer(db)
             sentence_count = sentence_indexer.index_resume(resume)
-            has_sentences = sentence_count > 0
             logger.info(f"Indexed {sentence_count} resume sentences (optimized)")
-
-            db.add(resume)
-            db.commit()
-            db.refresh(resume)
+            resume.processing_status = "completed"
         except Exception as sent_err:
+            db.rollback()
             logger.warning(f"Sentence indexing failed: {sent_err}")
-            has_sentences = False
+            resume.processing_status = "failed"
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Resume finalize error ({resume_id}): {e}")
+        resume = db.get(Resume, resume_id)
+        if resume:
+            resume.processing_status = "failed"
+            db.commit()
+    finally:
+        db.close()
+
+
+@router.post("/upload-and-process", response_model=ResumeUploadResponse, status_code=status.HTTP_202_ACCEPTED)
+def upload_and_process_resume(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    is_primary: bool = Form(False),
+    db: Session = Depends(get_db)
+):
+    """
+    이력서 업로드 + 텍스트 추출 + DB 저장 후 즉시 202 반환
+    - 로컬 저장소에 파일 저장
+    - 파일 타입에 따라 텍스트 추출
+    - Resume 레코드 생성 (parsed_data 비어 있음, processing_status="processing")
+    - LLM 파싱/핵심 정보 추출/문장 임베딩은 백그라운드 작업으로 처리
+    - 완료 여부는 GET /resumes/{resume_id}의 processing_status로 확인
+    """
+    start_time = time.time()
+    try:
+        original_name = file.filename
+        ext = (os.path.splitext(original_name)[1] or "").lower()
+        file_type = ext.lstrip(".") or "txt"
+
+        # 디스크 쓰기/해시 계산 전에 확장자와 크기부터 검증
+        if file_type not in _ALLOWED_EXTENSIONS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unsupported file type: {file_type}",
+            )
+        if file.size and file.size > _MAX_UPLOAD_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"File too large (max {_MAX_UPLOAD_SIZE} bytes)",
+            )
+
+        # 0) 동일 내용 이력서가 이미 있으면 저장/파싱/임베딩 전부 생략 (미완료 행은 재처리 예약)
+        content_sha = _hash_upload(file)
+        existing = db.query(Resume).filter(Resume.content_sha == content_sha).first()
+        if existing:
+            return _reuse_existing_resume(db, existing, background_tasks, start_time)
+
+        # 1) 파일 저장 (내용 해시 파일명 → 파일시스템 레벨 중복 제거)
+        disk_path = os.path.join(_UPLOAD_DIR, f"{content_sha}{ext}")
+
+        file_size = _persist_upload(file, disk_path)
+
+        # 2) 텍스트 추출 (CPU 바운드 → 파싱 프로세스 풀로 오프로딩)
+        raw_text = extract_text_in_pool(file_type, disk_path)
+
+        # raw_text가 비었으면 파싱/임베딩 생략
+        has_text = bool(raw_text and raw_text.strip())
+
+        # 3) DB에 저장 (파싱/임베딩 없이) - INSERT ... RETURNING 한 번으로 PK 확보
+        processing_status = "processing" if has_text else "completed"
+        try:
+            resume_id = db.execute(
+                insert(Resume)
+                .values(
+                    user_id=None,
+                    file_name=original_name,
+                    file_url=disk_path,
+                    file_type=file_type,
+                    file_size=file_size,
+                    content_sha=content_sha,
+                    raw_text=raw_text or "",
+                    parsed_data={},
+                    extracted_skills=[],
+                    extracted_experience_years=0,
+                    extracted_domains=[],
+                    extracted_education_level="",
+                    embedding_model_id=_EMBEDDING_MODEL_ID,
+                    is_primary=is_primary,
+                    processing_status=processing_status,
+                )
+                .returning(Resume.id)
+            ).scalar_one()
+            db.commit()
+        except IntegrityError:
+            # 같은 파일이 동시에 업로드되어 다른 요청이 먼저 INSERT한 경우 그 행을 사용
+            # (그 요청이 이미 _finalize_resume을 예약했으므로 재예약하지 않음)
+            db.rollback()
+            existing = db.query(Resume).filter(Resume.content_sha == content_sha).one()
+            return _reuse_existing_resume(db, existing, background_tasks, start_time, requeue=False)
+
+        # 4) LLM 파싱 + 문장 인덱싱은 응답 후 처리
+        if has_text:
+            background_tasks.add_task(_finalize_resume, resume_id)
 
         processing_time_ms = int((time.time() - start_time) * 1000)
         return {
-            "resume_id": resume.id,
-            "file_name": resume.file_name,
-            "file_url": resume.file_url,
-            "parsed_data": parsed,
-            "extracted_skills": resume.extracted_skills,
-            "extracted_experience_years": resume.extracted_experience_years,
+            "resume_id": resume_id,
+            "file_name": original_name,
+            "file_url": disk_path,
+            "parsed_data": {},
+            "extracted_skills": [],
+            "extracted_experience_years": 0,
             "processing_time_ms": processing_time_ms,
-            "has_sentences": has_sentences,
+            "processing_status": processing_status,
         }
 
     except HTTPException:
@@ -187,16 +310,28 @@ def upload_and_process_resume(
         raise HTTPException(status_code=500, detail=f"Upload/process failed: {e}")
 
 
+@router.get("/{resume_id}", response_model=ResumeDetail)
+def get_resume(
+    resume_id: UUID,
+    db: Session = Depends(get_db)
+):
+    """이력서 상세 조회 (업로드 후 processing_status 폴링용)"""
+    resume = db.get(Resume, resume_id)
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    return resume
+
+
 @router.post("/{resume_id}/generate-embeddings")
 async def generate_resume_embeddings(
-    resume_id: str,
+    resume_id: UUID,
     db: Session = Depends(get_db)
 ):
     """
     업로드/파싱된 이력서에 대해 임베딩만 생성/갱신 (전체+섹션)
     """
     try:
-        resume = db.query(Resume).filter(Resume.id == resume_id).first()
+        resume = db.get(Resume, resume_id)
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
 
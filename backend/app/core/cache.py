@@ -2,69 +2,236 @@
 Redis Cache Utilities
 """
 import redis
-from typing import Optional, Any
+import redis.asyncio as aioredis
+from typing import Optional, Any, Dict, List
+import hashlib
+import inspect
 import pickle
+import struct
 from functools import wraps
 
+import numpy as np
+import ormsgpack
+
 from app.core.config import settings
+from app.core.logging import logger
+
+
+# 커넥션 풀 공통 옵션 (hiredis가 설치되어 있으면 redis-py가 자동으로 응답 파서로 사용)
+_POOL_OPTIONS = dict(
+    decode_responses=False,
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+    socket_keepalive=True,
+    health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+)
+
+# 앱 전체가 공유하는 async 커넥션 풀
+redis_pool = aioredis.ConnectionPool.from_url(settings.REDIS_URL, **_POOL_OPTIONS)
+
+# Redis client (async - 이벤트 루프를 막지 않음)
+redis_client = aioredis.Redis(connection_pool=redis_pool)
+
+# 동기 함수용 Redis client (cache_result의 sync 경로 전용)
+sync_redis_client = redis.Redis(
+    connection_pool=redis.ConnectionPool.from_url(settings.REDIS_URL, **_POOL_OPTIONS)
+)
 
+# 직렬화 포맷 마커 (첫 바이트)
+_FMT_MSGPACK = b"M"
+_FMT_PICKLE = b"P"
+_PICKLE_PROTO_PREFIX = 0x80  # 마커 없는 구형 pickle 엔트리
 
-# Redis client
-redis_client = redis.from_url(settings.REDIS_URL, decode_responses=False)
+# msgpack 확장 타입
+_EXT_NDARRAY = 1
+_EXT_PICKLE = 2
+_ND_HEADER = struct.Struct("<H")  # ndarray 메타데이터 길이
 
 
-def get_cache(key: str) -> Optional[Any]:
+def _encode_default(obj: Any) -> ormsgpack.Ext:
+    """msgpack 미지원 객체 인코딩 (ndarray는 raw 버퍼, 그 외는 pickle)"""
+    if isinstance(obj, np.ndarray):
+        meta = ormsgpack.packb([obj.dtype.str, list(obj.shape)])
+        buf = np.ascontiguousarray(obj).tobytes()
+        return ormsgpack.Ext(_EXT_NDARRAY, _ND_HEADER.pack(len(meta)) + meta + buf)
+    return ormsgpack.Ext(_EXT_PICKLE, pickle.dumps(obj, protocol=5))
+
+
+def _decode_ext(tag: int, data: bytes) -> Any:
+    """msgpack 확장 타입 복원 (ndarray는 복사 없이 frombuffer)"""
+    if tag == _EXT_NDARRAY:
+        (meta_len,) = _ND_HEADER.unpack_from(data)
+        start = _ND_HEADER.size + meta_len
+        dtype, shape = ormsgpack.unpackb(data[_ND_HEADER.size:start])
+        return np.frombuffer(data, dtype=np.dtype(dtype), offset=start).reshape(shape)
+    if tag == _EXT_PICKLE:
+        return pickle.loads(data)
+    raise ValueError(f"Unknown cache ext type: {tag}")
+
+
+def _serialize(value: Any) -> bytes:
+    """캐시 값 직렬화 (msgpack 우선, 실패 시 pickle 폴백)"""
+    try:
+        return _FMT_MSGPACK + ormsgpack.packb(value, default=_encode_default)
+    except (ormsgpack.MsgpackEncodeError, TypeError):
+        return _FMT_PICKLE + pickle.dumps(value, protocol=5)
+
+
+def _deserialize(data: bytes) -> Any:
+    """캐시 값 역직렬화"""
+    fmt = data[:1]
+    if fmt == _FMT_MSGPACK:
+        return ormsgpack.unpackb(data[1:], ext_hook=_decode_ext)
+    if fmt == _FMT_PICKLE:
+        return pickle.loads(data[1:])
+    if data[0] == _PICKLE_PROTO_PREFIX:
+        return pickle.loads(data)
+    raise ValueError("Unknown cache format")
+
+
+async def get_cache(key: str) -> Optional[Any]:
     """Get value from cache"""
     try:
-        cached = redis_client.get(key)
+        cached = await redis_client.get(key)
         if cached:
-            return pickle.loads(cached)
+            return _deserialize(cached)
         return None
     except Exception as e:
-        print(f"Cache get error: {e}")
+        logger.warning(f"Cache get error: {e}")
         return None
 
 
-def set_cache(key: str, value: Any, expire: int = 3600) -> bool:
+async def set_cache(key: str, value: Any, expire: int = 3600) -> bool:
     """Set value in cache"""
     try:
-        redis_client.setex(key, expire, pickle.dumps(value))
+        await redis_client.setex(key, expire, _serialize(value))
         return True
     except Exception as e:
-        print(f"Cache set error: {e}")
+        logger.warning(f"Cache set error: {e}")
         return False
 
 
-def delete_cache(key: str) -> bool:
+async def mget_cache(keys: List[str]) -> List[Optional[Any]]:
+    """Get multiple values in one round-trip (MGET)"""
+    if not keys:
+        return []
+    try:
+        values = await redis_client.mget(keys)
+        return [_deserialize(v) if v else None for v in values]
+    except Exception as e:
+        logger.warning(f"Cache mget error: {e}")
+        return [None] * len(keys)
+
+
+async def mset_cache(mapping: Dict[str, Any], expire: int = 3600) -> bool:
+    """Set multiple values with TTL in one round-trip (non-transactional pipeline)"""
+    if not mapping:
+        return True
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.setex(key, expire, _serialize(value))
+            await pipe.execute()
+        return True
+    except Exception as e:
+        logger.warning(f"Cache mset error: {e}")
+        return False
+
+
+def mget_cache_sync(keys: List[str]) -> List[Optional[Any]]:
+    """Get multiple values in one round-trip (MGET, 동기 경로용)"""
+    if not keys:
+        return []
+    try:
+        values = sync_redis_client.mget(keys)
+        return [_deserialize(v) if v else None for v in values]
+    except Exception as e:
+        logger.warning(f"Cache mget error: {e}")
+        return [None] * len(keys)
+
+
+def mset_cache_sync(mapping: Dict[str, Any], expire: int = 3600) -> bool:
+    """Set multiple values with TTL in one round-trip (동기 경로용)"""
+    if not mapping:
+        return True
+    try:
+        with sync_redis_client.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.setex(key, expire, _serialize(value))
+            pipe.execute()
+        return True
+    except Exception as e:
+        logger.warning(f"Cache mset error: {e}")
+        return False
+
+
+async def delete_cache(key: str) -> bool:
     """Delete value from cache"""
     try:
-        redis_client.delete(key)
+        await redis_client.delete(key)
         return True
     except Exception as e:
-        print(f"Cache delete error: {e}")
+        logger.warning(f"Cache delete error: {e}")
         return False
 
 
+def _key_part(value: Any) -> Any:
+    """캐시 키용 인자 표현 (ndarray는 전체 str() 대신 shape/dtype + 전체 버퍼의 BLAKE2b 해시)"""
+    if isinstance(value, np.ndarray):
+        digest = hashlib.blake2b(np.ascontiguousarray(value).tobytes(), digest_size=16).digest()
+        return ("ndarray", value.dtype.str, value.shape, digest)
+    return value
+
+
+def _make_cache_key(func, args: tuple, kwargs: dict) -> str:
+    """프로세스 간에도 동일한 안정적 캐시 키 (salted hash() 대신 BLAKE2b)"""
+    key_bytes = repr((
+        func.__module__,
+        func.__qualname__,
+        tuple(_key_part(a) for a in args),
+        sorted((k, _key_part(v)) for k, v in kwargs.items()),
+    )).encode("utf-8")
+    digest = hashlib.blake2b(key_bytes, digest_size=16).hexdigest()
+    return f"{func.__name__}:{digest}"
+
+
 def cache_result(expire: int = 3600):
-    """Decorator to cache function results"""
+    """Decorator to cache function results (sync/async 함수 모두 지원)"""
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                cache_key = _make_cache_key(func, args, kwargs)
+                
+                # Check cache
+                cached = await get_cache(cache_key)
+                if cached is not None:
+                    return cached
+                
+                # Execute function
+                result = await func(*args, **kwargs)
+                
+                # Store in cache
+                await set_cache(cache_key, result, expire)
+                
+                return result
+            return async_wrapper
+
         @wraps(func)
-        async def wrapper(*args, **kwargs):
-            # Generate cache key
-            cache_key = f"{func.__name__}:{hash(str(args) + str(kwargs))}"
-            
-            # Check cache
-            cached = get_cache(cache_key)
-            if cached is not None:
-                return cached
+        def wrapper(*args, **kwargs):
+            cache_key = _make_cache_key(func, args, kwargs)
             
-            # Execute function
-            result = await func(*args, **kwargs)
-            
-            # Store in cache
-            set_cache(cache_key, result, expire)
+            try:
+                cached = sync_redis_client.get(cache_key)
+                if cached:
+                    return _deserialize(cached)
+            except Exception as e:
+                logger.warning(f"Cache get error: {e}")
             
+            result = func(*args, **kwargs)
+            try:
+                sync_redis_client.setex(cache_key, expire, _serialize(result))
+            except Exception as e:
+                logger.warning(f"Cache set error: {e}")
             return result
         return wrapper
     return decorator
-
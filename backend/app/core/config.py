@@ -26,9 +26,25 @@ class Settings(BaseSettings):
     POSTGRES_USER: str = "postgres"
     POSTGRES_PASSWORD: str = "postgres"
     POSTGRES_DB: str = "auto_match"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # seconds
+    DB_POOL_RECYCLE: int = 3600  # seconds
+    DB_PREPARE_THRESHOLD: int = 1  # 같은 쿼리가 이 횟수만큼 실행되면 서버측 prepared statement로 전환
+    
+    # Scheduler
+    JOB_EXPIRY_INTERVAL_MINUTES: int = 60  # 만료 공고 비활성화 주기
+    MATCHING_PARTITION_MONTHS_AHEAD: int = 3  # matching_result 월 파티션 선생성 개월 수
+    
+    # Matching Config Cache
+    MATCHING_CONFIG_CACHE_TTL: int = 60  # seconds (변경 시 NOTIFY로 즉시 무효화)
     
     # Redis Configuration
     REDIS_URL: str = "redis://localhost:6379/0"
+    REDIS_MAX_CONNECTIONS: int = 64
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30  # seconds
+    LLM_SPLIT_CACHE_TTL: int = 604800  # 7 days (문장 분할 결과, 입력 텍스트 SHA-256 키)
+    SENTENCE_EMBEDDING_CACHE_TTL: int = 2592000  # 30 days (문장 임베딩, 문장 SHA-256 키)
     
     # JWT Configuration
     JWT_SECRET_KEY: str
@@ -42,16 +58,23 @@ class Settings(BaseSettings):
     # ML Models
     EMBEDDING_MODEL: str = "jhgan/ko-sroberta-multitask"
     EMBEDDING_DIMENSION: int = 768
+    EMBEDDING_BATCH_SIZE: int = 256  # /embed/batch 1회 요청당 최대 문장 수
+    JOB_PREFILTER_K: int = 200  # 검색 시 임베딩 유사도로 선별할 후보 공고 수
+    JOB_RERANK_K: int = 50  # 후보 중 상세(섹션/문장) 채점할 공고 수 (limit가 더 크면 limit)
+    MATCHING_SCORE_WORKERS: int = 8  # 후보 공고 상세 채점 병렬 스레드 수 (스레드마다 DB 세션 1개 사용)
     ML_MODELS_PATH: str = "/app/ml_models"
     
     # File Upload
     UPLOAD_DIR: str = "/app/uploads"
     MAX_UPLOAD_SIZE: int = 10485760  # 10MB
-    ALLOWED_EXTENSIONS: str = "pdf,docx,txt"
+    ALLOWED_EXTENSIONS: str = "pdf,docx,doc,xlsx,xls,txt"
+    RESUME_PROCESSING_TIMEOUT_MINUTES: int = 30  # 이 시간 넘게 processing인 이력서는 멈춘 것으로 보고 재업로드 시 재처리
     
     # OpenAI
     OPENAI_API_KEY: Optional[str] = None
     OPENAI_MODEL: str = "gpt-3.5-turbo"
+    LLM_MAX_CONCURRENCY: int = 10  # 프로세스당 동시 LLM 요청 상한 (rate limit 폭주 방지)
+    LLM_MAX_RETRIES: int = 3  # 429/5xx/타임아웃 시 지수 백오프 재시도 횟수
     
     # AWS S3 (optional)
     AWS_ACCESS_KEY_ID: Optional[str] = None
@@ -88,14 +111,7 @@ class Settings(BaseSettings):
         "excellent_match": 0.9,
     }
     
-    # Grade Thresholds (현실적 조정 - 55점 기준)
-    GRADE_THRESHOLDS: dict = {
-        "excellent": 0.85,  # 매우 우수 - 서류 통과 가능성 높음
-        "good": 0.70,       # 양호 - 지원 권장
-        "fair": 0.55,       # 보통 - 일부 조건 보완 필요 (현실적 기준)
-        "caution": 0.40,    # 주의 - 신중히 검토 필요
-        "poor": 0.0,        # 부적합
-    }
+    # 등급 하한은 grade 생성 컬럼과 같아야 하므로 설정이 아닌 app.models.matching.GRADE_THRESHOLDS에 고정
     
     # Default Penalties (합리적으로 조정)
     DEFAULT_PENALTIES: dict = {
@@ -110,6 +126,13 @@ class Settings(BaseSettings):
     # Caps
     EXPERIENCE_PENALTY_CAP: float = 0.15  # 경력 관련 페널티 총합 상한 (최대 15점 감점)
 
+    @property
+    def SQLALCHEMY_DATABASE_URL(self) -> str:
+        """SQLAlchemy 접속 URL (드라이버 미지정 postgresql:// 은 psycopg 3 드라이버로 지정)"""
+        if self.DATABASE_URL.startswith("postgresql://"):
+            return "postgresql+psycopg://" + self.DATABASE_URL[len("postgresql://"):]
+        return self.DATABASE_URL
+
 
 @lru_cache()
 def get_settings() -> Settings:
@@ -0,0 +1,43 @@
+"""
+Matching Config Listener - matching_config 변경 알림(LISTEN/NOTIFY) 수신
+"""
+import threading
+import time
+from typing import Optional
+
+import psycopg
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.repositories.matching_repository import invalidate_config_cache
+
+
+# matching_config 트리거가 NOTIFY하는 채널
+MATCHING_CONFIG_CHANNEL = "matching_config_updated"
+
+_listener_thread: Optional[threading.Thread] = None
+
+
+def _listen_forever() -> None:
+    """알림을 받을 때마다 캐시 무효화 (연결이 끊기면 재접속)"""
+    while True:
+        try:
+            with psycopg.connect(settings.DATABASE_URL, autocommit=True) as conn:
+                conn.execute(f"LISTEN {MATCHING_CONFIG_CHANNEL}")
+                # 재접속 사이에 놓친 변경이 있을 수 있으므로 한 번 비움
+                invalidate_config_cache()
+                for _ in conn.notifies():
+                    invalidate_config_cache()
+        except Exception as e:
+            logger.warning(f"Matching config listener disconnected: {e}")
+            time.sleep(5)
+
+
+def start_config_listener() -> None:
+    """설정 변경 리스너 시작 (워커 프로세스마다 1개, daemon 스레드)"""
+    global _listener_thread
+    if _listener_thread is None:
+        _listener_thread = threading.Thread(
+            target=_listen_forever, name="matching-config-listener", daemon=True
+        )
+        _listener_thread.start()
@@ -2,6 +2,7 @@
 Database Connection and Session Management
 """
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -9,15 +10,36 @@ from app.core.config import settings
 
 
 # Create database engine
+# psycopg 3: 반복 실행되는 쿼리(PK 조회 등)는 커넥션별 서버측 prepared statement로 전환되어
+# 파싱/플래닝을 건너뜀
 engine = create_engine(
-    settings.DATABASE_URL,
+    settings.SQLALCHEMY_DATABASE_URL,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    connect_args={"prepare_threshold": settings.DB_PREPARE_THRESHOLD},
 )
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: 커밋 후 속성 접근 시 행을 다시 SELECT하지 않음
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+# Async engine (psycopg 3 async 드라이버, 동일 URL)
+# async 엔드포인트에서 서로 독립적인 조회를 이벤트 루프를 막지 않고 동시에 실행할 때 사용
+async_engine = create_async_engine(
+    settings.SQLALCHEMY_DATABASE_URL,
+    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    connect_args={"prepare_threshold": settings.DB_PREPARE_THRESHOLD},
+)
+
+# AsyncSession은 동시 사용 불가 → 병렬 조회는 조회마다 세션을 따로 연다
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
 
 # Base class for models
 Base = declarative_base()
@@ -31,3 +53,8 @@ def get_db():
     finally:
         db.close()
 
+
+async def get_async_db():
+    """Get async database session"""
+    async with AsyncSessionLocal() as db:
+        yield db
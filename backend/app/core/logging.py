@@ -2,14 +2,22 @@
 Logging Configuration
 """
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Optional
 
 from app.core.config import settings
 
 
+# 파일 핸들러를 별도 스레드에서 처리하는 리스너 (요청 스레드는 큐에 넣기만 함)
+log_listener: Optional[QueueListener] = None
+
+
 def setup_logging():
     """Setup application logging"""
+    global log_listener
     
     # Create logs directory
     log_dir = Path("logs")
@@ -22,10 +30,21 @@ def setup_logging():
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
     
+    # 파일 쓰기는 QueueListener 스레드에서 수행 (non-blocking)
+    log_queue: queue.Queue = queue.Queue(-1)
+    file_handler = logging.FileHandler(log_dir / "app.log")
+    file_handler.setFormatter(logging.Formatter(log_format, datefmt=date_format))
+    log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    log_listener.start()
+    
+    # QueueHandler는 메시지만 넘기고 포맷은 file_handler가 담당 (중복 포맷 방지)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    
     # Handlers
     handlers = [
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler(log_dir / "app.log"),
+        queue_handler,
     ]
     
     # Basic config
@@ -46,3 +65,10 @@ def setup_logging():
 # Setup logger
 logger = setup_logging()
 
+
+def stop_logging() -> None:
+    """큐에 남은 로그를 파일로 flush하고 리스너 종료"""
+    global log_listener
+    if log_listener is not None:
+        log_listener.stop()
+        log_listener = None
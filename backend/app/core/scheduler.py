@@ -0,0 +1,63 @@
+"""
+Background Scheduler (주기 작업)
+"""
+from datetime import datetime
+
+from apscheduler.schedulers.background import BackgroundScheduler
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.logging import logger
+from app.repositories.job_repository import JobRepository
+from app.repositories.matching_repository import MatchingRepository
+
+
+def deactivate_expired_jobs() -> None:
+    """만료일이 지난 채용공고 일괄 비활성화 (기존 행 단위 트리거 대체)"""
+    db = SessionLocal()
+    try:
+        count = JobRepository(db).deactivate_expired()
+        if count:
+            logger.info(f"Deactivated {count} expired job postings")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to deactivate expired jobs: {e}")
+    finally:
+        db.close()
+
+
+def ensure_matching_partitions() -> None:
+    """matching_result 향후 월 파티션 미리 생성 (기본 파티션으로 새는 행 방지)"""
+    db = SessionLocal()
+    try:
+        count = MatchingRepository(db).ensure_partitions(settings.MATCHING_PARTITION_MONTHS_AHEAD)
+        if count:
+            logger.info(f"Created {count} matching_result partitions")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to create matching_result partitions: {e}")
+    finally:
+        db.close()
+
+
+def create_scheduler() -> BackgroundScheduler:
+    """주기 작업 스케줄러 생성"""
+    scheduler = BackgroundScheduler(timezone="Asia/Seoul")
+    scheduler.add_job(
+        deactivate_expired_jobs,
+        "interval",
+        minutes=settings.JOB_EXPIRY_INTERVAL_MINUTES,
+        id="deactivate_expired_jobs",
+        coalesce=True,
+        max_instances=1,
+    )
+    scheduler.add_job(
+        ensure_matching_partitions,
+        "interval",
+        days=1,
+        next_run_time=datetime.now(),  # 기동 직후 1회 실행
+        id="ensure_matching_partitions",
+        coalesce=True,
+        max_instances=1,
+    )
+    return scheduler
@@ -1,7 +1,6 @@
 """
 File Storage Utilities (Local filesystem for now, S3 later)
 """
-import os
 import uuid
 from pathlib import Path
 from typing import Optional
@@ -11,6 +10,10 @@ from fastapi import UploadFile
 from app.core.config import settings
 
 
+# 업로드 저장 청크 크기 (1 MiB)
+CHUNK_SIZE = 1 << 20
+
+
 class StorageService:
     """File storage service"""
     
@@ -35,12 +38,12 @@ class StorageService:
         
         # Save file
         file_path = save_dir / unique_filename
+        # 1 MiB 청크로 스트리밍 저장 (전체 파일을 메모리에 올리지 않음)
+        file_size = 0
         async with aiofiles.open(file_path, 'wb') as f:
-            content = await file.read()
-            await f.write(content)
-        
-        # Get file size
-        file_size = os.path.getsize(file_path)
+            while chunk := await file.read(CHUNK_SIZE):
+                await f.write(chunk)
+                file_size += len(chunk)
         
         return {
             "file_name": file.filename,
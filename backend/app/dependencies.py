@@ -1,13 +1,12 @@
 """
 Dependency Injection
 """
-from typing import Generator
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from jose import JWTError, jwt
 
-from app.core.database import SessionLocal
+from app.core.database import get_db  # 요청 단위 세션 의존성은 한 곳에서만 정의
 from app.core.config import settings
 from app.models.user import User
 
@@ -16,15 +15,6 @@ from app.models.user import User
 security = HTTPBearer()
 
 
-def get_db() -> Generator:
-    """Get database session"""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
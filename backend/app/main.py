@@ -3,10 +3,15 @@ FastAPI Application Entry Point
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
-from app.core.database import engine
+from app.core.database import engine, async_engine
+from app.core.config_listener import start_config_listener
+from app.core.logging import stop_logging
+from app.core.scheduler import create_scheduler
+from app.services.parsing.text_extraction import shutdown_parser_pool
 from app.api.v1 import resumes, matching
 
 
@@ -19,9 +24,20 @@ async def lifespan(app: FastAPI):
     print(f"🔧 Debug Mode: {settings.DEBUG}")
     print(f"🤖 Embedding Model: {settings.EMBEDDING_MODEL}")
     
+    # 만료 공고 비활성화 등 주기 작업 시작
+    scheduler = create_scheduler()
+    scheduler.start()
+    
+    # 매칭 설정 변경 시 프로세스 내 캐시 무효화
+    start_config_listener()
+    
     yield
     
     # Shutdown
+    scheduler.shutdown(wait=False)
+    shutdown_parser_pool()
+    await async_engine.dispose()
+    stop_logging()
     print("👋 Shutting down Auto-Match Backend...")
 
 
@@ -33,6 +49,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson 기반 응답 직렬화
 )
 
 # CORS Middleware
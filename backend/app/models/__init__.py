@@ -4,7 +4,7 @@ SQLAlchemy Models
 from app.models.user import User
 from app.models.company import Company
 from app.models.job import JobPosting
-from app.models.resume import Resume
+from app.models.resume import Resume, EmbeddingModel
 from app.models.matching import MatchingResult, MatchingConfig
 from app.models.feedback import LLMFeedback, UserFeedback
 from app.models.sentences import ResumeSentence, JobSentence
@@ -14,6 +14,7 @@ __all__ = [
     "Company",
     "JobPosting",
     "Resume",
+    "EmbeddingModel",
     "MatchingResult",
     "MatchingConfig",
     "LLMFeedback",
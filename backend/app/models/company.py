@@ -5,16 +5,16 @@ from sqlalchemy import Column, String, Text, DateTime
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
 from app.core.database import Base
+from app.utils.helpers import uuid7
 
 
 class Company(Base):
     __tablename__ = "company"
     
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     
     # Basic Info
     name = Column(String(255), nullable=False, index=True)
@@ -1,21 +1,22 @@
 """
 Feedback Models
 """
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Text, ARRAY, CheckConstraint
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, ForeignKeyConstraint, Text, ARRAY, CheckConstraint
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
 from app.core.database import Base
+from app.utils.helpers import uuid7
 
 
 class LLMFeedback(Base):
     __tablename__ = "llm_feedback"
     
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    matching_result_id = Column(UUID(as_uuid=True), ForeignKey("matching_result.id", ondelete="CASCADE"), index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    matching_result_id = Column(UUID(as_uuid=True), index=True)
+    matching_result_created_at = Column(DateTime(timezone=True))  # matching_result 파티션 키 (복합 FK)
     resume_id = Column(UUID(as_uuid=True), ForeignKey("resume.id", ondelete="CASCADE"), index=True)
     job_id = Column(UUID(as_uuid=True), ForeignKey("job_posting.id", ondelete="CASCADE"), index=True)
     
@@ -50,15 +51,26 @@ class LLMFeedback(Base):
     matching_result = relationship("MatchingResult", back_populates="llm_feedback")
     resume = relationship("Resume", back_populates="llm_feedbacks")
     job = relationship("JobPosting", back_populates="llm_feedbacks")
+    
+    # matching_result는 파티션 테이블이라 PK (id, created_at) 전체를 참조
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ['matching_result_id', 'matching_result_created_at'],
+            ['matching_result.id', 'matching_result.created_at'],
+            name='llm_feedback_matching_result_id_fkey',
+            ondelete='CASCADE'
+        ),
+    )
 
 
 class UserFeedback(Base):
     __tablename__ = "user_feedback"
     
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("user.id", ondelete="CASCADE"), index=True)
-    matching_result_id = Column(UUID(as_uuid=True), ForeignKey("matching_result.id", ondelete="SET NULL"), index=True)
+    matching_result_id = Column(UUID(as_uuid=True), index=True)
+    matching_result_created_at = Column(DateTime(timezone=True))  # matching_result 파티션 키 (복합 FK)
     
     # Feedback Type
     feedback_type = Column(String(50), index=True)  # rating, report, suggestion
@@ -80,4 +92,14 @@ class UserFeedback(Base):
     # Relationships
     user = relationship("User", back_populates="feedbacks")
     matching_result = relationship("MatchingResult", back_populates="user_feedbacks")
+    
+    # matching_result는 파티션 테이블이라 PK (id, created_at) 전체를 참조
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ['matching_result_id', 'matching_result_created_at'],
+            ['matching_result.id', 'matching_result.created_at'],
+            name='user_feedback_matching_result_id_fkey',
+            ondelete='SET NULL'
+        ),
+    )
 
@@ -1,28 +1,35 @@
 """
 Job Posting Model
 """
-from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, DECIMAL, Date, ForeignKey, ARRAY, Index
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, DECIMAL, Date, ForeignKey, ARRAY, Index, Computed
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from pgvector.sqlalchemy import Vector
-import uuid
 
 from app.core.database import Base
+from app.utils.helpers import uuid7
 
 
 class JobPosting(Base):
     __tablename__ = "job_posting"
     
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     company_id = Column(UUID(as_uuid=True), ForeignKey("company.id", ondelete="CASCADE"))
+    company_name = Column(String(255))  # 비정규화 (company.name, 회사명 변경 시 트리거로 동기화)
     
     # Basic Info
     title = Column(String(500), nullable=False, index=True)
     description = Column(Text, nullable=False)
     raw_text = Column(Text, nullable=False)  # 전체 텍스트
     
+    # Full-text Search (title + description, DB가 자동 계산)
+    search_tsv = Column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(description, ''))", persisted=True)
+    )
+    
     # Structured Data
     requirements = Column(JSONB)  # 필수/우대 조건
     responsibilities = Column(JSONB)  # 업무 내용
@@ -81,5 +88,38 @@ class JobPosting(Base):
             unique=True,
             postgresql_where=Column('external_id').isnot(None)
         ),
+        # 키셋 페이지네이션용 정렬 인덱스 (posted_at DESC NULLS LAST, id DESC)
+        Index(
+            'idx_job_posted_at_id',
+            posted_at.desc().nulls_last(), id.desc()
+        ),
+        # 활성 공고 목록 전용 부분 커버링 인덱스 (index-only scan)
+        Index(
+            'idx_job_active_seek',
+            posted_at.desc().nulls_last(), id.desc(),
+            postgresql_include=['title', 'location', 'experience_level', 'employment_type', 'company_id'],
+            postgresql_where=is_active
+        ),
+        # 만료 공고 배치 비활성화용 부분 인덱스
+        Index(
+            'idx_job_expiring',
+            expires_at,
+            postgresql_where=is_active & expires_at.isnot(None)
+        ),
+        # 활성 공고 전용 ANN 검색용 부분 HNSW 인덱스 (코사인 거리)
+        Index(
+            'ix_job_embedding_hnsw_active',
+            embedding,
+            postgresql_using='hnsw',
+            postgresql_with={'m': 16, 'ef_construction': 64},
+            postgresql_ops={'embedding': 'vector_cosine_ops'},
+            postgresql_where=is_active
+        ),
+        # 제목/설명 전문 검색용 GIN 인덱스
+        Index(
+            'ix_job_search_tsv',
+            search_tsv,
+            postgresql_using='gin'
+        ),
     )
 
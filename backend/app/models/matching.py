@@ -1,26 +1,56 @@
 """
 Matching Models
 """
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, DECIMAL
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, REAL, Index, Computed, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ENUM
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
 from app.core.database import Base
+from app.utils.helpers import uuid7
+
+
+# 매칭 등급 (overall_score 임계치 순서: 높음 → 낮음)
+MATCH_GRADES = ("excellent", "good", "fair", "caution", "poor")
+
+
+# 등급 하한 (고정값, 환경변수로 바꾸지 않음 — 저장된 grade 생성 컬럼과 항상 같은 기준이어야 함)
+GRADE_THRESHOLDS = {
+    "excellent": 0.85,  # 매우 우수 - 서류 통과 가능성 높음
+    "good": 0.70,       # 양호 - 지원 권장
+    "fair": 0.55,       # 보통 - 일부 조건 보완 필요 (현실적 기준)
+    "caution": 0.40,    # 주의 - 신중히 검토 필요
+}
+
+# overall_score → grade 생성 컬럼 식 (모델 Computed와 마이그레이션 3038147b7531이 공유)
+# overall_score는 REAL이고 숫자 리터럴은 numeric이라 PostgreSQL은 float8로 올려 비교한다
+# (Python 쪽 _grade_index도 float32로 반올림한 점수를 float64 하한과 비교)
+GRADE_EXPRESSION = (
+    "CASE "
+    + " ".join(
+        f"WHEN overall_score >= {GRADE_THRESHOLDS[grade]} THEN '{grade}'::match_grade"
+        for grade in MATCH_GRADES[:-1]
+    )
+    + f" ELSE '{MATCH_GRADES[-1]}'::match_grade END"
+)
 
 
 class MatchingResult(Base):
     __tablename__ = "matching_result"
     
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    job_id = Column(UUID(as_uuid=True), ForeignKey("job_posting.id", ondelete="CASCADE"), index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    job_id = Column(UUID(as_uuid=True), ForeignKey("job_posting.id", ondelete="CASCADE"))  # ix_matching_job_resume_created가 선두 컬럼으로 커버
     resume_id = Column(UUID(as_uuid=True), ForeignKey("resume.id", ondelete="CASCADE"), index=True)
     
     # Score Info
-    overall_score = Column(DECIMAL(5, 4), nullable=False, index=True)  # 0.0000 ~ 1.0000
-    grade = Column(String(50), index=True)  # excellent, good, fair, caution, poor
+    overall_score = Column(REAL, nullable=False, index=True)  # 0.0 ~ 1.0 (float4)
+    # excellent, good, fair, caution, poor - DB가 overall_score로부터 계산 (INSERT 대상 아님)
+    grade = Column(
+        ENUM(*MATCH_GRADES, name="match_grade"),
+        Computed(GRADE_EXPRESSION, persisted=True),
+        index=True
+    )
     
     # Category Scores
     category_scores = Column(JSONB, nullable=False)
@@ -62,21 +92,62 @@ class MatchingResult(Base):
     is_applied = Column(Boolean, default=False)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    # created_at: 월 단위 RANGE 파티션 키 → PK (id, created_at)에 포함
+    created_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
+    # 피드백은 (id, created_at) 복합 FK로 참조 — 삭제 시 CASCADE/SET NULL은 DB가 처리 (passive_deletes)
     job = relationship("JobPosting", back_populates="matching_results")
     resume = relationship("Resume", back_populates="matching_results")
-    llm_feedback = relationship("LLMFeedback", back_populates="matching_result", uselist=False)
-    user_feedbacks = relationship("UserFeedback", back_populates="matching_result")
+    llm_feedback = relationship(
+        "LLMFeedback",
+        back_populates="matching_result",
+        uselist=False,
+        passive_deletes=True
+    )
+    user_feedbacks = relationship(
+        "UserFeedback",
+        back_populates="matching_result",
+        passive_deletes=True
+    )
+    
+    # INSERT/UPDATE 시 서버 default(created_at, updated_at)를 RETURNING으로 함께 가져옴
+    __mapper_args__ = {"eager_defaults": True}
+    
+    # Table Arguments (Indexes)
+    __table_args__ = (
+        # get_by_job_and_resume 전용 복합 커버링 인덱스 (정렬 없이 최신 1건)
+        Index(
+            'ix_matching_job_resume_created',
+            'job_id', 'resume_id', 'created_at',
+            postgresql_ops={'created_at': 'DESC'},
+            postgresql_include=['overall_score', 'grade']
+        ),
+        # 공고별 상위 매칭(excellent) 조회용 부분 인덱스
+        Index(
+            'ix_match_excellent',
+            'job_id', 'overall_score',
+            postgresql_ops={'overall_score': 'DESC'},
+            postgresql_where=text("grade = 'excellent'")
+        ),
+        # 시간 범위 스캔용 BRIN (파티션별 btree ix_matching_result_created_at와 병행)
+        Index(
+            'ix_matching_result_created_at_brin',
+            'created_at',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32}
+        ),
+        # 월 파티션은 create_matching_result_partitions()로 생성 (스케줄러가 미리 확보)
+        {'postgresql_partition_by': 'RANGE (created_at)'},
+    )
 
 
 class MatchingConfig(Base):
     __tablename__ = "matching_config"
     
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String(100), unique=True, nullable=False)
     version = Column(String(50), nullable=False)
     
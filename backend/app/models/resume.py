@@ -1,21 +1,29 @@
 """
 Resume Model
 """
-from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, ForeignKey, ARRAY
+from sqlalchemy import Column, String, CHAR, Text, Integer, SmallInteger, Boolean, DateTime, ForeignKey, ARRAY, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from pgvector.sqlalchemy import Vector
-import uuid
+from pgvector.sqlalchemy import HALFVEC
 
 from app.core.database import Base
+from app.utils.helpers import uuid7
+
+
+class EmbeddingModel(Base):
+    """임베딩 모델 이름 룩업 (resume 행마다 모델명 문자열을 반복 저장하지 않도록 분리)"""
+    __tablename__ = "embedding_model"
+    
+    id = Column(SmallInteger, primary_key=True)  # smallserial
+    name = Column(String(100), unique=True, nullable=False)  # jhgan/ko-sroberta-multitask
 
 
 class Resume(Base):
     __tablename__ = "resume"
     
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("user.id", ondelete="CASCADE"), index=True)
     
     # File Info
@@ -23,6 +31,7 @@ class Resume(Base):
     file_url = Column(String(500), nullable=False)
     file_type = Column(String(50))  # pdf, docx, txt
     file_size = Column(Integer)
+    content_sha = Column(CHAR(32), unique=True, index=True)  # BLAKE2b-128 hex (중복 업로드 판별)
     
     # Text Info
     raw_text = Column(Text, nullable=False)
@@ -47,20 +56,22 @@ class Resume(Base):
     extracted_experience_years = Column(Integer)
     extracted_domains = Column(ARRAY(Text))
     extracted_education_level = Column(String(50))
+    candidate_name = Column(String(255))  # 비정규화 (parsed_data.personal_info.name)
     
     # AI Related
-    embedding = Column(Vector(768))  # pgvector (전체 텍스트)
-    embedding_model = Column(String(100), default="jhgan/ko-sroberta-multitask")
+    embedding = Column(HALFVEC(768))  # pgvector (전체 텍스트)
+    embedding_model_id = Column(SmallInteger, ForeignKey("embedding_model.id"))  # → EmbeddingModel.name
     
     # Sectional Embeddings (섹션별 임베딩)
-    skills_embedding = Column(Vector(768))  # 스킬 섹션 임베딩
-    experience_embedding = Column(Vector(768))  # 경력 섹션 임베딩
-    projects_embedding = Column(Vector(768))  # 프로젝트 섹션 임베딩
+    skills_embedding = Column(HALFVEC(768))  # 스킬 섹션 임베딩
+    experience_embedding = Column(HALFVEC(768))  # 경력 섹션 임베딩
+    projects_embedding = Column(HALFVEC(768))  # 프로젝트 섹션 임베딩
     
     # Meta Info
     is_primary = Column(Boolean, default=False)
     version = Column(Integer, default=1)
     is_public = Column(Boolean, default=False)
+    processing_status = Column(String(20), default="completed")  # processing, completed, failed
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
@@ -68,6 +79,39 @@ class Resume(Base):
     
     # Relationships
     user = relationship("User", back_populates="resumes")
+    embedding_model = relationship("EmbeddingModel")  # 모델명이 필요한 조회에서만 joinedload
     matching_results = relationship("MatchingResult", back_populates="resume", cascade="all, delete-orphan")
     llm_feedbacks = relationship("LLMFeedback", back_populates="resume", cascade="all, delete-orphan")
-
+    
+    # Table Arguments (Indexes)
+    # 코사인 거리(<=>) 기반 ANN 검색용 HNSW 인덱스
+    __table_args__ = (
+        Index(
+            'ix_resume_embedding_hnsw',
+            embedding,
+            postgresql_using='hnsw',
+            postgresql_with={'m': 16, 'ef_construction': 64},
+            postgresql_ops={'embedding': 'halfvec_cosine_ops'},
+        ),
+        Index(
+            'ix_resume_skills_embedding_hnsw',
+            skills_embedding,
+            postgresql_using='hnsw',
+            postgresql_with={'m': 16, 'ef_construction': 64},
+            postgresql_ops={'skills_embedding': 'halfvec_cosine_ops'},
+        ),
+        Index(
+            'ix_resume_experience_embedding_hnsw',
+            experience_embedding,
+            postgresql_using='hnsw',
+            postgresql_with={'m': 16, 'ef_construction': 64},
+            postgresql_ops={'experience_embedding': 'halfvec_cosine_ops'},
+        ),
+        Index(
+            'ix_resume_projects_embedding_hnsw',
+            projects_embedding,
+            postgresql_using='hnsw',
+            postgresql_with={'m': 16, 'ef_construction': 64},
+            postgresql_ops={'projects_embedding': 'halfvec_cosine_ops'},
+        ),
+    )
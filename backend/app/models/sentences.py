@@ -1,40 +1,60 @@
 """
 Sentence-level embeddings for resumes and jobs
 """
-from sqlalchemy import Column, String, Integer, ForeignKey, Text
+from sqlalchemy import Column, String, Integer, ForeignKey, Text, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from pgvector.sqlalchemy import Vector
-import uuid
+from pgvector.sqlalchemy import HALFVEC
 
 from app.core.database import Base
+from app.utils.helpers import uuid7
 
 
 class ResumeSentence(Base):
     __tablename__ = "resume_sentence"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     resume_id = Column(UUID(as_uuid=True), ForeignKey("resume.id", ondelete="CASCADE"), index=True, nullable=False)
     section = Column(String(50), index=True)
     idx = Column(Integer, default=0)
     text = Column(Text, nullable=False)
-    embedding = Column(Vector(768))
+    embedding = Column(HALFVEC(768))
 
     # relationships
     resume = relationship("Resume", backref="sentences")
 
+    # 코사인 거리(<=>) 기반 ANN 검색용 HNSW 인덱스
+    __table_args__ = (
+        Index(
+            'ix_resume_sentence_embedding_hnsw',
+            'embedding',
+            postgresql_using='hnsw',
+            postgresql_with={'m': 16, 'ef_construction': 64},
+            postgresql_ops={'embedding': 'halfvec_cosine_ops'},
+        ),
+    )
+
 
 class JobSentence(Base):
     __tablename__ = "job_sentence"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     job_id = Column(UUID(as_uuid=True), ForeignKey("job_posting.id", ondelete="CASCADE"), index=True, nullable=False)
     section = Column(String(50), index=True)  # required, preferred, description, etc.
     idx = Column(Integer, default=0)
     text = Column(Text, nullable=False)
-    embedding = Column(Vector(768))
+    embedding = Column(HALFVEC(768))
 
     # relationships
     job = relationship("JobPosting", backref="sentences")
 
-
+    # 코사인 거리(<=>) 기반 ANN 검색용 HNSW 인덱스
+    __table_args__ = (
+        Index(
+            'ix_job_sentence_embedding_hnsw',
+            'embedding',
+            postgresql_using='hnsw',
+            postgresql_with={'m': 16, 'ef_construction': 64},
+            postgresql_ops={'embedding': 'halfvec_cosine_ops'},
+        ),
+    )
@@ -5,16 +5,16 @@ from sqlalchemy import Column, String, Boolean, DateTime, Text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
 from app.core.database import Base
+from app.utils.helpers import uuid7
 
 
 class User(Base):
     __tablename__ = "user"
     
     # Primary Key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     
     # Authentication
     email = Column(String(255), unique=True, nullable=False, index=True)
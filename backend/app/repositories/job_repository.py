@@ -1,12 +1,20 @@
 """
 Job Repository - 채용공고 데이터 액세스
 """
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from typing import List, Optional, Dict, Any
+from sqlalchemy.orm import Session, joinedload, selectinload, raiseload
+from sqlalchemy import or_, tuple_, update, func, select, lambda_stmt
+from sqlalchemy.dialects.postgresql import insert
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import date
 from uuid import UUID
+import numpy as np
 
 from app.models.job import JobPosting
+from app.models.company import Company
+
+
+# 검색어에 포함되면 ILIKE 패턴 검색으로 처리하는 와일드카드 문자
+_GLOB_CHARS = ("*", "?", "%", "_")
 
 
 class JobRepository:
@@ -15,8 +23,38 @@ class JobRepository:
     def __init__(self, db: Session):
         self.db = db
     
+    def _get_company_name(self, company_id: Optional[UUID]) -> Optional[str]:
+        """비정규화 company_name 채우기용 회사명 조회"""
+        if company_id is None:
+            return None
+        return self.db.execute(
+            select(Company.name).where(Company.id == company_id)
+        ).scalar_one_or_none()
+
+    @staticmethod
+    def _apply_search(query, term: str):
+        """
+        제목/설명 검색 조건 적용
+
+        기본은 search_tsv GIN 인덱스를 타는 전문 검색(plainto_tsquery)이고,
+        검색어에 와일드카드(*, ?, %, _)가 있을 때만 ILIKE 패턴 검색으로 처리한다.
+        """
+        if any(ch in term for ch in _GLOB_CHARS):
+            pattern = f"%{term.replace('*', '%').replace('?', '_')}%"
+            return query.filter(
+                or_(
+                    JobPosting.title.ilike(pattern),
+                    JobPosting.description.ilike(pattern)
+                )
+            )
+        return query.filter(
+            JobPosting.search_tsv.op('@@')(func.plainto_tsquery('simple', term))
+        )
+
     def create(self, job: JobPosting) -> JobPosting:
         """채용공고 생성"""
+        if job.company_name is None:
+            job.company_name = self._get_company_name(job.company_id)
         self.db.add(job)
         self.db.commit()
         self.db.refresh(job)
@@ -26,47 +64,188 @@ class JobRepository:
         """채용공고 ID로 조회"""
         return self.db.query(JobPosting).filter(JobPosting.id == job_id).first()
     
+    def get_by_id_full(self, job_id: UUID) -> Optional[JobPosting]:
+        """
+        채용공고 ID로 조회 (문장/회사 즉시 로딩)
+        
+        관계를 쓰지 않는 경로는 get_by_id를 사용한다.
+        """
+        return self.db.query(JobPosting).options(
+            selectinload(JobPosting.sentences),
+            joinedload(JobPosting.company),
+            raiseload('*')
+        ).filter(JobPosting.id == job_id).first()
+    
+    def get_embeddings_by_ids(self, job_ids: List[UUID]) -> Dict[UUID, np.ndarray]:
+        """
+        여러 채용공고의 전체 임베딩을 한 번의 쿼리로 조회 (id = ANY(...))
+        
+        Returns:
+            {job_id: float32 임베딩} (임베딩이 없는 공고는 제외)
+        """
+        if not job_ids:
+            return {}
+        rows = self.db.execute(
+            select(JobPosting.id, JobPosting.embedding).where(
+                JobPosting.id.in_(job_ids),
+                JobPosting.embedding.isnot(None)
+            )
+        ).all()
+        return {row.id: np.asarray(row.embedding, dtype=np.float32) for row in rows}
+    
     def get_all(
         self,
         skip: int = 0,
         limit: int = 20,
         filters: Optional[Dict[str, Any]] = None
     ) -> List[JobPosting]:
-        """채용공고 목록 조회 (필터 적용)"""
-        query = self.db.query(JobPosting)
-        
+        """
+        채용공고 목록 조회 (필터 적용)
+
+        lambda_stmt로 구성하므로 같은 필터 조합(문장 형태)은 컴파일된 SQL을 재사용하고,
+        필터 값은 클로저 변수에서 바인드 파라미터로 추출된다.
+        """
+        filters = filters or {}
+
         # 기본적으로 활성화된 공고만
-        query = query.filter(JobPosting.is_active == True)
-        
+        stmt = lambda_stmt(lambda: select(JobPosting).where(JobPosting.is_active == True))
+
+        # 필터 적용
+        if filters.get("location"):
+            location_pattern = f"%{filters['location']}%"
+            stmt += lambda s: s.where(JobPosting.location.ilike(location_pattern))
+
+        if filters.get("experience_level"):
+            experience_level = filters["experience_level"]
+            stmt += lambda s: s.where(JobPosting.experience_level == experience_level)
+
+        if filters.get("employment_type"):
+            employment_type = filters["employment_type"]
+            stmt += lambda s: s.where(JobPosting.employment_type == employment_type)
+
+        if filters.get("search"):
+            term = filters["search"]
+            if any(ch in term for ch in _GLOB_CHARS):
+                search_pattern = f"%{term.replace('*', '%').replace('?', '_')}%"
+                stmt += lambda s: s.where(
+                    or_(
+                        JobPosting.title.ilike(search_pattern),
+                        JobPosting.description.ilike(search_pattern)
+                    )
+                )
+            else:
+                stmt += lambda s: s.where(
+                    JobPosting.search_tsv.op('@@')(func.plainto_tsquery('simple', term))
+                )
+
+        # 정렬 및 페이징
+        stmt += lambda s: s.order_by(JobPosting.posted_at.desc()).offset(skip).limit(limit)
+
+        return self.db.execute(stmt).scalars().all()
+
+    def get_page_after(
+        self,
+        after: Optional[Tuple[Optional[date], UUID]] = None,
+        limit: int = 20,
+        is_active: bool = True,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[JobPosting]:
+        """
+        채용공고 목록 키셋(seek) 페이지 조회
+
+        (posted_at DESC NULLS LAST, id DESC) 순서로 정렬하고, 직전 페이지의
+        마지막 행(after) 이후부터 limit개를 가져온다. OFFSET을 쓰지 않으므로
+        페이지 깊이와 무관하게 idx_job_posted_at_id 인덱스로 처리된다.
+        """
+        query = self.db.query(JobPosting).options(joinedload(JobPosting.company))
+        query = query.filter(JobPosting.is_active == is_active)
+
         # 필터 적용
         if filters:
+            if filters.get("company_id"):
+                query = query.filter(JobPosting.company_id == filters["company_id"])
+
             if filters.get("location"):
                 query = query.filter(JobPosting.location.ilike(f"%{filters['location']}%"))
-            
+
             if filters.get("experience_level"):
                 query = query.filter(JobPosting.experience_level == filters["experience_level"])
-            
+
             if filters.get("employment_type"):
                 query = query.filter(JobPosting.employment_type == filters["employment_type"])
-            
+
             if filters.get("search"):
-                search_term = f"%{filters['search']}%"
+                query = self._apply_search(query, filters["search"])
+
+        # 키셋 조건: posted_at이 NULL인 행은 정렬상 맨 뒤에 위치
+        if after is not None:
+            after_posted_at, after_id = after
+            if after_posted_at is None:
+                query = query.filter(
+                    JobPosting.posted_at.is_(None),
+                    JobPosting.id < after_id
+                )
+            else:
                 query = query.filter(
                     or_(
-                        JobPosting.title.ilike(search_term),
-                        JobPosting.description.ilike(search_term)
+                        tuple_(JobPosting.posted_at, JobPosting.id) < tuple_(after_posted_at, after_id),
+                        JobPosting.posted_at.is_(None)
                     )
                 )
-        
-        # 정렬 및 페이징
-        query = query.order_by(JobPosting.posted_at.desc())
-        
-        return query.offset(skip).limit(limit).all()
-    
+
+        query = query.order_by(
+            JobPosting.posted_at.desc().nulls_last(),
+            JobPosting.id.desc()
+        )
+
+        return query.limit(limit).all()
+
+    def upsert_by_external_id(self, job_data: Dict[str, Any]) -> UUID:
+        """
+        크롤링 공고 upsert (source + external_id 기준)
+
+        idx_job_unique는 external_id IS NOT NULL 조건의 부분 UNIQUE 인덱스이므로
+        ON CONFLICT에도 동일한 WHERE 조건을 명시해야 Postgres가 해당 인덱스를
+        충돌 대상(arbiter)으로 인식한다.
+        """
+        if "company_name" not in job_data:
+            job_data = {**job_data, "company_name": self._get_company_name(job_data.get("company_id"))}
+
+        stmt = insert(JobPosting).values(**job_data)
+        update_cols = {
+            key: stmt.excluded[key]
+            for key in job_data
+            if key not in ("id", "source", "external_id", "created_at")
+        }
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[JobPosting.source, JobPosting.external_id],
+            index_where=JobPosting.external_id.isnot(None),
+            set_=update_cols
+        ).returning(JobPosting.id)
+
+        job_id = self.db.execute(stmt).scalar_one()
+        self.db.commit()
+        return job_id
+
+    def deactivate_expired(self) -> int:
+        """만료일이 지난 활성 공고 일괄 비활성화 (idx_job_expiring 사용)"""
+        result = self.db.execute(
+            update(JobPosting)
+            .where(
+                JobPosting.is_active,
+                JobPosting.expires_at.isnot(None),
+                JobPosting.expires_at < func.current_date()
+            )
+            .values(is_active=False)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount
+
     def update(self, job: JobPosting) -> JobPosting:
         """채용공고 업데이트"""
+        # 호출자가 이미 최신 객체를 들고 있으므로 refresh(재조회) 생략
         self.db.commit()
-        self.db.refresh(job)
         return job
     
     def delete(self, job_id: UUID) -> bool:
@@ -1,11 +1,27 @@
 """
 Matching Repository - 매칭 결과 데이터 액세스
 """
+from sqlalchemy import text
 from sqlalchemy.orm import Session
-from typing import Optional
+from sqlalchemy.orm.attributes import set_committed_value
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
+import time
 
+from app.core.config import settings
 from app.models.matching import MatchingResult, MatchingConfig
+from app.utils.helpers import uuid7
+
+
+# 활성 매칭 설정 프로세스 내 캐시: (config, 조회 시각 monotonic)
+# TTL 만료 또는 matching_config 변경 NOTIFY 수신 시 다시 조회
+_CONFIG_CACHE: Tuple[Optional[MatchingConfig], float] = (None, 0.0)
+
+
+def invalidate_config_cache() -> None:
+    """활성 매칭 설정 캐시 무효화"""
+    global _CONFIG_CACHE
+    _CONFIG_CACHE = (None, 0.0)
 
 
 class MatchingRepository:
@@ -15,12 +31,31 @@ class MatchingRepository:
         self.db = db
     
     def create(self, matching_result: MatchingResult) -> MatchingResult:
-        """매칭 결과 생성"""
+        """매칭 결과 생성 (서버 default는 INSERT ... RETURNING으로 채워지므로 refresh 불필요)"""
+        # grade는 DB 생성 컬럼: 계산용으로 채워 둔 값은 INSERT에서 제외하고 RETURNING 값으로 대체
+        set_committed_value(matching_result, "grade", None)
         self.db.add(matching_result)
         self.db.commit()
-        self.db.refresh(matching_result)
         return matching_result
     
+    def bulk_create(self, rows: List[Dict[str, Any]]) -> List[UUID]:
+        """
+        매칭 결과 일괄 생성 (다중 행 INSERT + 커밋 1회)
+        
+        bulk_insert_mappings는 컬럼 default를 실행하지 않으므로 id(uuid7)를 미리 생성해 채운다.
+        
+        Returns:
+            생성된 매칭 결과 ID 리스트 (rows 순서와 동일)
+        """
+        if not rows:
+            return []
+        for row in rows:
+            row.setdefault("id", uuid7())
+            row.pop("grade", None)  # DB 생성 컬럼
+        self.db.bulk_insert_mappings(MatchingResult, rows)
+        self.db.commit()
+        return [row["id"] for row in rows]
+    
     def get_by_id(self, matching_id: UUID) -> Optional[MatchingResult]:
         """매칭 결과 ID로 조회"""
         return self.db.query(MatchingResult).filter(
@@ -40,8 +75,33 @@ class MatchingRepository:
             MatchingResult.created_at.desc()
         ).first()
     
+    def ensure_partitions(self, months_ahead: int) -> int:
+        """
+        matching_result 월 파티션 확보 (현재 달 ~ months_ahead 개월 후, 없는 것만 생성)
+        
+        Returns:
+            새로 생성된 파티션 수
+        """
+        created = self.db.execute(
+            text("SELECT create_matching_result_partitions(now(), :months_ahead)"),
+            {"months_ahead": months_ahead}
+        ).scalar_one()
+        self.db.commit()
+        return created
+    
     def get_active_config(self) -> Optional[MatchingConfig]:
-        """활성화된 매칭 설정 조회"""
-        return self.db.query(MatchingConfig).filter(
+        """활성화된 매칭 설정 조회 (TTL 캐시, 세션과 분리된 객체 반환)"""
+        global _CONFIG_CACHE
+        config, fetched_at = _CONFIG_CACHE
+        now = time.monotonic()
+        if fetched_at and now - fetched_at < settings.MATCHING_CONFIG_CACHE_TTL:
+            return config
+        
+        config = self.db.query(MatchingConfig).filter(
             MatchingConfig.is_active == True
         ).first()
+        if config is not None:
+            # 요청 세션 종료 후에도 캐시된 객체를 읽을 수 있도록 분리
+            self.db.expunge(config)
+        _CONFIG_CACHE = (config, now)
+        return config
@@ -1,11 +1,25 @@
 """
 Resume Repository - 이력서 데이터 액세스
 """
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy.orm import Session, selectinload, joinedload, raiseload
+from sqlalchemy import select, text
+from psycopg.types.json import Jsonb
+from typing import Any, Dict, Iterable, List, Optional
 from uuid import UUID
+import numpy as np
 
+from app.core.config import settings
 from app.models.resume import Resume
+from app.utils.helpers import uuid7
+
+
+# bulk_copy가 채우는 컬럼 (나머지는 서버 default)
+_BULK_COPY_COLUMNS = (
+    "id", "user_id", "file_name", "file_url", "file_type", "file_size", "content_sha",
+    "raw_text", "parsed_data", "extracted_skills", "extracted_experience_years",
+    "extracted_domains", "extracted_education_level", "candidate_name",
+    "embedding", "is_primary", "processing_status",
+)
 
 
 class ResumeRepository:
@@ -21,10 +35,100 @@ class ResumeRepository:
         self.db.refresh(resume)
         return resume
     
+    def bulk_copy(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        이력서 대량 적재 (COPY → 임시 스테이징 테이블 → INSERT ... SELECT, 커밋 1회)
+        
+        행을 하나씩 INSERT하지 않고 COPY로 스트리밍한 뒤 한 문장으로 옮긴다.
+        id가 충돌하는 행은 건너뛴다 (ON CONFLICT DO NOTHING).
+        
+        Args:
+            rows: Resume 컬럼명을 키로 하는 dict 이터러블 (embedding은 768차원 시퀀스 또는 None)
+            
+        Returns:
+            실제로 삽입된 이력서 수
+        """
+        columns = ", ".join(_BULK_COPY_COLUMNS)
+        # 모델명은 스테이징에만 문자열로 두고 적재 시 embedding_model.id로 변환
+        self.db.execute(text(
+            "CREATE TEMP TABLE resume_stage (LIKE resume INCLUDING DEFAULTS, embedding_model text) "
+            "ON COMMIT DROP"
+        ))
+        raw_conn = self.db.connection().connection  # 세션 트랜잭션의 DBAPI 커넥션
+        with raw_conn.cursor() as cur:
+            with cur.copy(f"COPY resume_stage ({columns}, embedding_model) FROM STDIN") as copy:
+                for row in rows:
+                    embedding = row.get("embedding")
+                    copy.write_row((
+                        row.get("id") or uuid7(),
+                        row.get("user_id"),
+                        row["file_name"],
+                        row["file_url"],
+                        row.get("file_type"),
+                        row.get("file_size"),
+                        row.get("content_sha"),
+                        row.get("raw_text") or "",
+                        Jsonb(row.get("parsed_data") or {}),
+                        row.get("extracted_skills") or [],
+                        row.get("extracted_experience_years") or 0,
+                        row.get("extracted_domains") or [],
+                        row.get("extracted_education_level") or "",
+                        row.get("candidate_name"),
+                        "[" + ",".join(map(repr, map(float, embedding))) + "]" if embedding is not None else None,
+                        bool(row.get("is_primary", False)),
+                        row.get("processing_status") or "completed",
+                        row.get("embedding_model") or settings.EMBEDDING_MODEL,
+                    ))
+        self.db.execute(text(
+            "INSERT INTO embedding_model (name) SELECT DISTINCT embedding_model FROM resume_stage "
+            "ON CONFLICT (name) DO NOTHING"
+        ))
+        result = self.db.execute(text(
+            f"INSERT INTO resume ({columns}, embedding_model_id) "
+            f"SELECT {', '.join('s.' + c for c in _BULK_COPY_COLUMNS)}, m.id FROM resume_stage s "
+            f"JOIN embedding_model m ON m.name = s.embedding_model "
+            f"ON CONFLICT DO NOTHING"
+        ))
+        self.db.commit()
+        return result.rowcount
+    
     def get_by_id(self, resume_id: UUID) -> Optional[Resume]:
         """이력서 ID로 조회"""
         return self.db.query(Resume).filter(Resume.id == resume_id).first()
     
+    def get_by_id_full(self, resume_id: UUID) -> Optional[Resume]:
+        """
+        이력서 ID로 조회 (문장/매칭 결과/사용자 즉시 로딩)
+        
+        자식 컬렉션은 selectinload로 한 번에 가져오고, 나머지 관계는 raiseload로
+        막아 의도치 않은 지연 로딩(N+1)을 바로 드러낸다.
+        관계를 쓰지 않는 경로는 get_by_id를 사용한다.
+        """
+        return self.db.query(Resume).options(
+            selectinload(Resume.sentences),
+            selectinload(Resume.matching_results),
+            joinedload(Resume.user),
+            raiseload('*')
+        ).filter(Resume.id == resume_id).first()
+    
+    def get_embeddings_by_ids(self, resume_ids: List[UUID]) -> Dict[UUID, np.ndarray]:
+        """
+        여러 이력서의 전체 임베딩을 한 번의 쿼리로 조회 (id = ANY(...))
+        
+        Returns:
+            {resume_id: float32 임베딩} (임베딩이 없는 이력서는 제외)
+        """
+        if not resume_ids:
+            return {}
+        rows = self.db.execute(
+            select(Resume.id, Resume.embedding).where(
+                Resume.id.in_(resume_ids),
+                Resume.embedding.isnot(None)
+            )
+        ).all()
+        # halfvec 컬럼은 HalfVector로 반환되므로 float32로 변환
+        return {row.id: row.embedding.to_numpy().astype(np.float32) for row in rows}
+    
     def get_by_user(
         self,
         user_id: UUID,
@@ -40,8 +144,8 @@ class ResumeRepository:
     
     def update(self, resume: Resume) -> Resume:
         """이력서 업데이트"""
+        # 호출자가 이미 최신 객체를 들고 있으므로 refresh(재조회) 생략
         self.db.commit()
-        self.db.refresh(resume)
         return resume
     
     def delete(self, resume_id: UUID) -> bool:
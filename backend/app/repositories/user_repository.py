@@ -2,6 +2,7 @@
 User Repository
 """
 from sqlalchemy.orm import Session
+from sqlalchemy import select, Row
 from typing import Optional
 from uuid import UUID
 
@@ -23,8 +24,24 @@ class UserRepository:
         raise NotImplementedError("get_by_id not implemented")
     
     def get_by_email(self, email: str) -> Optional[User]:
-        """Get user by email"""
-        raise NotImplementedError("get_by_email not implemented")
+        """Get full user entity by email (profile pages)"""
+        return self.db.execute(
+            select(User).where(User.email == email)
+        ).scalar_one_or_none()
+    
+    def get_auth_by_email(self, email: str) -> Optional[Row]:
+        """
+        Get only the columns needed for authentication by email
+        
+        Skips bio/preferences/notification_settings so the login path
+        never detoasts profile data. Uses the unique index on email.
+        
+        Returns:
+            Row(id, password_hash, is_active) or None
+        """
+        return self.db.execute(
+            select(User.id, User.password_hash, User.is_active).where(User.email == email)
+        ).first()
     
     def update(self, user: User) -> User:
         """Update user"""
@@ -88,9 +88,8 @@ class JobPostingDetail(JobPostingResponse):
 
 
 class JobListResponse(BaseModel):
-    """Job list response schema"""
+    """Job list response schema (keyset pagination)"""
     items: List[JobPostingResponse]
-    total: int
-    page: int
-    page_size: int
+    next_cursor: Optional[str] = None
+    limit: int
 
@@ -48,7 +48,7 @@ class MatchingEvidence(BaseModel):
 
 class MatchingResultBase(BaseModel):
     """Matching result base schema"""
-    overall_score: Decimal
+    overall_score: float
     grade: str
     category_scores: dict
     matching_evidence: Optional[dict] = None
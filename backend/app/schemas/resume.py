@@ -35,6 +35,7 @@ class ResumeResponse(BaseModel):
     extracted_skills: Optional[List[str]] = None
     extracted_experience_years: Optional[int] = None
     is_primary: bool
+    processing_status: Optional[str] = None
     created_at: datetime
 
 
@@ -57,6 +58,7 @@ class ResumeUploadResponse(BaseModel):
     extracted_skills: Optional[List[str]] = None
     extracted_experience_years: Optional[int] = None
     processing_time_ms: int
+    processing_status: Optional[str] = None
 
 
 class ResumeListResponse(BaseModel):
@@ -1,11 +1,25 @@
 """
 Feedback Service
 """
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
 from typing import Dict, Any
 from uuid import UUID
+import asyncio
 
+from app.core.database import AsyncSessionLocal
 from app.models.feedback import LLMFeedback, UserFeedback
+from app.models.job import JobPosting
+from app.models.matching import MatchingConfig, MatchingResult
+from app.models.resume import Resume
+
+
+async def _fetch_one(stmt: Select) -> Any:
+    """조회 1건을 전용 AsyncSession으로 실행 (AsyncSession은 동시 쿼리를 지원하지 않음)"""
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(stmt)
+        return result.scalars().first()
 
 
 class FeedbackService:
@@ -14,6 +28,38 @@ class FeedbackService:
     def __init__(self, db: Session):
         self.db = db
     
+    async def load_feedback_context(
+        self,
+        resume_id: UUID,
+        job_id: UUID
+    ) -> Dict[str, Any]:
+        """
+        LLM 호출 전 필요한 독립 조회 4건을 동시에 실행
+        
+        이력서 / 채용공고 / 활성 매칭 설정 / 최신 매칭 결과를 각각 별도 커넥션에서
+        asyncio.gather로 발행하여 왕복 지연을 4×RTT → 1×RTT로 줄인다.
+        
+        Returns:
+            {"resume", "job", "config", "matching_result"} (없으면 None)
+        """
+        resume, job, config, matching_result = await asyncio.gather(
+            _fetch_one(select(Resume).where(Resume.id == resume_id)),
+            _fetch_one(select(JobPosting).where(JobPosting.id == job_id)),
+            _fetch_one(select(MatchingConfig).where(MatchingConfig.is_active.is_(True))),
+            _fetch_one(
+                select(MatchingResult)
+                .where(MatchingResult.job_id == job_id, MatchingResult.resume_id == resume_id)
+                .order_by(MatchingResult.created_at.desc())
+                .limit(1)
+            ),
+        )
+        return {
+            "resume": resume,
+            "job": job,
+            "config": config,
+            "matching_result": matching_result,
+        }
+    
     async def generate_llm_feedback(
         self,
         resume_id: UUID,
@@ -23,7 +69,7 @@ class FeedbackService:
         Generate LLM feedback for resume-job match
         
         TODO: Implement LLM feedback generation
-        - Get resume and job details
+        - Get resume and job details (load_feedback_context)
         - Calculate or retrieve matching result
         - Build prompt for LLM
         - Call OpenAI API
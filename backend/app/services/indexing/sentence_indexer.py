@@ -2,65 +2,184 @@
 SentenceIndexer: Use GPT-5 (LLMParser) to split text into high-quality sentences,
 then store sentence-level embeddings for resumes and jobs.
 """
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
+import hashlib
+import re
+import numpy as np
 
+from app.core.cache import mget_cache_sync, mset_cache_sync
+from app.core.config import settings
 from app.core.logging import logger
 from app.models.resume import Resume
 from app.models.job import JobPosting
 from app.models.sentences import ResumeSentence, JobSentence
-from app.services.ml.embedding import EmbeddingService
+from app.services.ml.embedding import get_embedding_service
+from app.utils.helpers import uuid7
+
+
+# Fallback sentence boundary: whitespace after terminal punctuation or a newline
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?\n])\s+")
+
+
+def job_overall_text(job: JobPosting) -> str:
+    """Whole-posting text used for the overall (document-level) embedding."""
+    return f"{job.title} {job.description or ''} {job.requirements or ''} {job.qualifications or ''}"
+
+
+def resume_overall_text(resume: Resume) -> str:
+    """Whole-resume text (from parsed_data) used for the overall embedding."""
+    parsed_data = resume.parsed_data or {}
+    return f"{parsed_data.get('summary', '')} {parsed_data.get('work_experience', '')} {parsed_data.get('skills', '')} {parsed_data.get('projects', '')}"
 
 
 class SentenceIndexer:
     def __init__(self, db: Session) -> None:
         self.db = db
-        self.embedding = EmbeddingService()
+        self.embedding = get_embedding_service()
 
     def _llm_split_sentences(self, text: str) -> List[str]:
         """Prefer GPT-5 parsing; fallback to simple rules if LLM unavailable."""
-        if not text:
-            return []
+        return self._llm_split_many([text])[0]
+
+    def _llm_split_many(self, texts: List[str]) -> List[List[str]]:
+        """Split several texts with concurrent LLM calls; each falls back independently."""
+        results: List[List[str]] = [[] for _ in texts]
+        pending = [i for i, t in enumerate(texts) if t]
+        if not pending:
+            return results
         try:
             # Lazy import to avoid hard dependency here
-            from app.services.parsing.llm_parser import LLMParser
-            parser = LLMParser()
-            # Expect LLM to return { "sentences": ["..."] }
-            res = parser.extract_sentences(text)
-            sentences = [s.strip() for s in (res.get("sentences") or []) if isinstance(s, str) and s.strip()]
-            if sentences:
-                return sentences
+            from app.services.parsing.llm_parser import get_llm_parser
+            parser = get_llm_parser()
+            # Expect LLM to return { "sentences": ["..."] } per text
+            responses = parser.extract_sentences_many([texts[i] for i in pending])
+            for i, res in zip(pending, responses):
+                results[i] = [s.strip() for s in (res.get("sentences") or []) if isinstance(s, str) and s.strip()]
         except Exception as e:
             logger.warning(f"LLM sentence split failed, using fallback: {e}")
+        for i in pending:
+            if not results[i]:
+                results[i] = self._fallback_split(texts[i])
+        return results
 
-        # Fallback: naive split by punctuation and newlines
-        import re
-        raw = re.split(r"(?<=[.!?\n])\s+", text)
-        sentences: List[str] = []
-        for s in raw:
-            s = " ".join(s.strip().split())
-            if 20 <= len(s) <= 300 and " " in s and "_" not in s:
-                sentences.append(s)
-        return sentences
-
-    def index_resume(self, resume: Resume) -> int:
-        """Split resume into sentences and persist embeddings. Returns count."""
-        text = resume.raw_text or ""
-        sentences = self._llm_split_sentences(text)
-        count = 0
-        for idx, s in enumerate(sentences):
+    @staticmethod
+    def _fallback_split(text: str) -> List[str]:
+        """Naive split by punctuation and newlines."""
+        return [
+            s for raw in _SENT_SPLIT_RE.split(text)
+            if 20 <= len(s := " ".join(raw.split())) <= 300 and " " in s and "_" not in s
+        ]
+
+    def _embed_sentences(self, sentences: List[str], batch_size: Optional[int] = None) -> List[Optional[List[float]]]:
+        """Embed sentences in batches via /embed/batch. Failed sentences map to None.
+
+        Sentences are deduplicated by SHA-256 and looked up in the shared
+        Redis sentence-embedding cache first, so boilerplate repeated across
+        resumes/jobs is embedded once. Only novel sentences are sent, chunked
+        at EMBEDDING_BATCH_SIZE.
+        """
+        batch_size = batch_size or settings.EMBEDDING_BATCH_SIZE
+        keys = [self._sentence_cache_key(s) for s in sentences]
+        unique_keys = list(dict.fromkeys(keys))
+        by_key = dict(zip(keys, sentences))
+        found = {
+            key: emb
+            for key, emb in zip(unique_keys, mget_cache_sync(unique_keys))
+            if emb is not None
+        }
+
+        novel = [key for key in unique_keys if key not in found]
+        fresh = {}
+        for start in range(0, len(novel), batch_size):
+            chunk = novel[start:start + batch_size]
             try:
-                emb = self.embedding.generate_embedding(s)
-                self.db.add(ResumeSentence(resume_id=resume.id, section=None, idx=idx, text=s, embedding=emb))
-                count += 1
+                embs = self.embedding.generate_embeddings_batch([by_key[key] for key in chunk])
             except Exception as e:
-                logger.warning(f"Failed to embed resume sentence: {e}")
+                logger.warning(f"Failed to embed sentence batch: {e}")
                 continue
+            for key, emb in zip(chunk, embs):
+                # Batch fallback fills failed items with zero vectors
+                if np.any(emb):
+                    fresh[key] = np.asarray(emb, dtype=np.float32)
+        mset_cache_sync(fresh, expire=settings.SENTENCE_EMBEDDING_CACHE_TTL)
+        found.update(fresh)
+
+        return [found[key].tolist() if key in found else None for key in keys]
+
+    @staticmethod
+    def _sentence_cache_key(sentence: str) -> str:
+        """Content-addressed cache key (model + SHA-256 of the sentence)."""
+        digest = hashlib.sha256(sentence.encode("utf-8")).hexdigest()
+        return f"sent_emb:{settings.EMBEDDING_MODEL}:{digest}"
+
+    def _bulk_insert_sentences(self, table: str, owner_column: str, rows: List[tuple]) -> None:
+        """COPY rows (id, owner_id, section, idx, text, embedding) in one round-trip.
+
+        Rows are written with psycopg's COPY row writer in text format;
+        pgvector parses the '[x,y,...]' text form of each embedding.
+        """
+        if not rows:
+            return
+        raw_conn = self.db.connection().connection  # DBAPI connection in the session's transaction
+        with raw_conn.cursor() as cur:
+            with cur.copy(
+                f"COPY {table} (id, {owner_column}, section, idx, text, embedding) FROM STDIN"
+            ) as copy:
+                for row_id, owner_id, section, idx, text, emb in rows:
+                    copy.write_row((row_id, owner_id, section, idx, text, "[" + ",".join(map(repr, emb)) + "]"))
+
+    def _embed_overall(self, text: str) -> Optional[np.ndarray]:
+        """Embed a whole-document text and L2-normalize it (None on failure)."""
+        try:
+            vec = np.asarray(self.embedding.generate_embedding(text), dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"Overall embedding failed: {e}")
+            return None
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm > 0 else None
+
+    def index_overall(self, target) -> bool:
+        """Store the normalized overall embedding on a JobPosting/Resume (caller commits)."""
+        if isinstance(target, JobPosting):
+            text = job_overall_text(target)
+        else:
+            text = resume_overall_text(target)
+        overall = self._embed_overall(text)
+        if overall is None:
+            return False
+        target.embedding = overall
+        return True
+
+    def index_resume(self, resume: Resume, batch_size: Optional[int] = None) -> int:
+        """Split resume into sentences and persist embeddings. Returns count.
+
+        Also stores the normalized overall embedding on resume.embedding so
+        matching can read it instead of embedding the resume text per match.
+        Existing sentences are replaced in the same transaction, so re-running
+        (retry or re-index) never duplicates rows.
+        """
+        self.index_overall(resume)
+        text = resume.raw_text or ""
+        sentences = self._llm_split_sentences(text)
+        embeddings = self._embed_sentences(sentences, batch_size)
+        rows = [
+            (uuid7(), resume.id, None, idx, s, emb)
+            for idx, (s, emb) in enumerate(zip(sentences, embeddings))
+            if emb is not None
+        ]
+        self.db.execute(delete(ResumeSentence).where(ResumeSentence.resume_id == resume.id))
+        self._bulk_insert_sentences(ResumeSentence.__tablename__, "resume_id", rows)
         self.db.commit()
-        return count
+        return len(rows)
 
-    def index_job(self, job: JobPosting) -> Tuple[int, int]:
-        """Split job required/preferred sentences and persist embeddings. Returns (req_count, pref_count)."""
+    def index_job(self, job: JobPosting, batch_size: Optional[int] = None) -> Tuple[int, int]:
+        """Split job required/preferred sentences and persist embeddings. Returns (req_count, pref_count).
+
+        Also stores the normalized overall embedding on job.embedding.
+        """
+        self.index_overall(job)
         req_sentences: List[str] = []
         pref_sentences: List[str] = []
         try:
@@ -70,28 +189,28 @@ class SentenceIndexer:
             # If items are long paragraphs, split via LLM; else use as-is
             req_joined = "\n".join(str(x) for x in req_src)
             pref_joined = "\n".join(str(x) for x in pref_src)
-            req_sentences = self._llm_split_sentences(req_joined) if req_joined else []
-            pref_sentences = self._llm_split_sentences(pref_joined) if pref_joined else []
+            # Both sections are split concurrently (one LLM round-trip instead of two)
+            req_sentences, pref_sentences = self._llm_split_many([req_joined, pref_joined])
         except Exception as e:
             logger.warning(f"Job requirements access failed: {e}")
 
-        r_count = 0
-        p_count = 0
-        for idx, s in enumerate(req_sentences):
-            try:
-                emb = self.embedding.generate_embedding(s)
-                self.db.add(JobSentence(job_id=job.id, section="required", idx=idx, text=s, embedding=emb))
-                r_count += 1
-            except Exception as e:
-                logger.warning(f"Failed to embed job required sentence: {e}")
-        for idx, s in enumerate(pref_sentences):
-            try:
-                emb = self.embedding.generate_embedding(s)
-                self.db.add(JobSentence(job_id=job.id, section="preferred", idx=idx, text=s, embedding=emb))
-                p_count += 1
-            except Exception as e:
-                logger.warning(f"Failed to embed job preferred sentence: {e}")
+        # Embed both sections in one batched pass
+        embeddings = self._embed_sentences(req_sentences + pref_sentences, batch_size)
+        req_embs = embeddings[:len(req_sentences)]
+        pref_embs = embeddings[len(req_sentences):]
+
+        rows = [
+            (uuid7(), job.id, "required", idx, s, emb)
+            for idx, (s, emb) in enumerate(zip(req_sentences, req_embs))
+            if emb is not None
+        ]
+        r_count = len(rows)
+        rows.extend(
+            (uuid7(), job.id, "preferred", idx, s, emb)
+            for idx, (s, emb) in enumerate(zip(pref_sentences, pref_embs))
+            if emb is not None
+        )
+        p_count = len(rows) - r_count
+        self._bulk_insert_sentences(JobSentence.__tablename__, "job_id", rows)
         self.db.commit()
         return r_count, p_count
-
-
@@ -1,23 +1,40 @@
 """
 OpenAI Client
 """
-from openai import OpenAI
-from typing import Dict, Any
+import asyncio
+import json
+from typing import Dict, Any, List
+
+import httpx
+from openai import AsyncOpenAI
 
 from app.core.config import settings
+from app.services.llm.prompt_templates import FEEDBACK_SYSTEM
+
+
+# 프로세스 전체 동시 피드백 요청 상한 (TPM/RPM 제한 대응)
+_FEEDBACK_SEMAPHORE = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
 
 
 class OpenAIClient:
     """OpenAI API client for LLM feedback generation"""
-    
+
     def __init__(self):
         self.api_key = settings.OPENAI_API_KEY
         self.model = settings.OPENAI_MODEL
         self.client = None
-        
+
         if self.api_key:
-            self.client = OpenAI(api_key=self.api_key)
-    
+            # 이벤트 루프를 막지 않는 AsyncOpenAI + keep-alive 커넥션 풀 재사용 (요청마다 TLS 핸드셰이크 없음)
+            self.client = AsyncOpenAI(
+                api_key=self.api_key,
+                max_retries=settings.LLM_MAX_RETRIES,
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                    timeout=httpx.Timeout(60.0, connect=5.0),
+                ),
+            )
+
     async def generate_feedback(
         self,
         prompt: str,
@@ -26,12 +43,37 @@ class OpenAIClient:
     ) -> Dict[str, Any]:
         """
         Generate feedback using OpenAI API
-        
-        TODO: Implement OpenAI API call
-        - Build messages
-        - Call API
-        - Parse response
-        - Return structured feedback
+
+        Args:
+            prompt: FEEDBACK_USER 형식의 가변 프롬프트 (고정 지시문은 system 메시지로 전달)
+
+        Returns:
+            JSON 응답을 파싱한 dict
         """
-        raise NotImplementedError("generate_feedback not implemented")
+        if self.client is None:
+            raise RuntimeError("OPENAI_API_KEY is not configured")
+        async with _FEEDBACK_SEMAPHORE:
+            resp = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": FEEDBACK_SYSTEM},
+                    {"role": "user", "content": prompt},
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format={"type": "json_object"},
+            )
+        return json.loads(resp.choices[0].message.content or "{}")
+
+    async def generate_feedback_many(self, prompts: List[str], **kwargs) -> List[Dict[str, Any]]:
+        """여러 프롬프트를 동시에 요청 (세마포어로 동시 요청 수 제한, 실패 항목은 빈 dict)"""
+        results = await asyncio.gather(
+            *(self.generate_feedback(prompt, **kwargs) for prompt in prompts),
+            return_exceptions=True,
+        )
+        return [{} if isinstance(result, Exception) else result for result in results]
 
+    async def aclose(self) -> None:
+        """커넥션 풀 정리"""
+        if self.client is not None:
+            await self.client.close()
@@ -22,19 +22,10 @@ def build_feedback_prompt(
 
 
 # Prompt template examples
-FEEDBACK_TEMPLATE = """
-당신은 취업 컨설턴트입니다. 다음 이력서와 채용공고의 매칭 결과를 분석하고 피드백을 제공하세요.
-
-## 이력서 정보
-{resume_info}
-
-## 채용공고 정보
-{job_info}
-
-## 매칭 점수
-- 전체 점수: {overall_score}
-- 기술 스킬: {technical_score}
-- 경험: {experience_score}
+# 프롬프트 캐싱은 공통 프리픽스만 재사용 → 고정 지시문은 system, 가변 정보는 user 메시지에
+# 재사용 빈도 순(공고 → 이력서 → 점수)으로 배치
+FEEDBACK_SYSTEM = """
+당신은 취업 컨설턴트입니다. 주어진 채용공고와 이력서의 매칭 결과를 분석하고 피드백을 제공하세요.
 
 ## 요청사항
 1. 강점 3가지
@@ -45,3 +36,15 @@ FEEDBACK_TEMPLATE = """
 JSON 형식으로 응답해주세요.
 """
 
+FEEDBACK_USER = """
+## 채용공고 정보
+{job_info}
+
+## 이력서 정보
+{resume_info}
+
+## 매칭 점수
+- 전체 점수: {overall_score}
+- 기술 스킬: {technical_score}
+- 경험: {experience_score}
+"""
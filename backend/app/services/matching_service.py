@@ -1,33 +1,173 @@
 """
 Matching Service - 핵심 매칭 알고리즘
 """
+from sqlalchemy import select, text
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+from functools import lru_cache
+from bisect import bisect_right
 from uuid import UUID
-from decimal import Decimal
 from datetime import datetime
+import re
 import time
 import uuid
 import base64
+import binascii
 import hmac
-import hashlib
 import json
 
 from app.models.job import JobPosting
 from app.models.resume import Resume
-from app.models.matching import MatchingResult
-from app.services.ml.vector_search import VectorSearchService
+from app.models.matching import MatchingResult, MATCH_GRADES, GRADE_THRESHOLDS
+from app.schemas.matching import MatchingFilters
+from app.services.ml.vector_search import VectorSearchService, get_job_embedding_cache
 from app.services.ml.scoring import ScoringService
 from app.core.config import settings
+from app.core.database import SessionLocal
 from app.services.ml.penalties import PenaltyService
 from app.services.ml.feedback_generator import FeedbackGenerator
 from app.services.ml.sectional_scoring import SectionalScoringService
-from app.services.ml.embedding import EmbeddingService
+from app.services.ml.embedding import EmbeddingService, get_embedding_service
+from app.services.indexing.sentence_indexer import job_overall_text, resume_overall_text
 # Cross-encoder 제거됨
 from app.core.logging import logger
 import numpy as np
 
 
+# 기술 스택별 세분화된 조건 매칭 임계값 (실제 테스트 결과 기반 최적화)
+_TECH_THRESHOLDS = {
+    # 백엔드 기술 스택 (충돌 방지 - 매우 엄격)
+    'java': 0.75, 'kotlin': 0.75, 'spring': 0.75,
+    'python': 0.62, 'fastapi': 0.62, 'django': 0.62,  # 약간 완화
+    'node.js': 0.70, 'express': 0.70,
+    
+    # 프론트엔드 기술 스택 (충돌 방지 - 매우 엄격)
+    'react': 0.75, 'next.js': 0.75, 'typescript': 0.75,
+    'vue.js': 0.70, 'angular': 0.70,
+    'flutter': 0.70,
+    
+    # 모바일 개발 (충돌 방지 - 매우 엄격)
+    'android': 0.75, 'ios': 0.75,
+    
+    # 데이터베이스 (더 완화)
+    'mysql': 0.55, 'postgresql': 0.55, 'mongodb': 0.55,
+    
+    # 클라우드/인프라 (현재 적절)
+    'aws': 0.65, 'gcp': 0.65, 'azure': 0.65,
+    'docker': 0.65, 'kubernetes': 0.70,
+    
+    # AI/ML (완화)
+    'tensorflow': 0.62, 'pytorch': 0.62, 'opencv': 0.62,
+    'langchain': 0.62, 'langgraph': 0.62
+}
+
+# 키워드 전체를 한 번에 찾는 정규식 (기존 `tech in condition` 부분 문자열 검사와 동일하게
+# 겹치는 위치도 모두 잡도록 전방탐색으로 감쌈, 긴 키워드 우선)
+_TECH_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(t) for t in sorted(_TECH_THRESHOLDS, key=len, reverse=True)) + "))"
+)
+
+
+# 후보 공고 상세 채점 공유 스레드 풀 (문장 조회 DB I/O와 임베딩 HTTP 대기를 겹침)
+_SCORING_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.MATCHING_SCORE_WORKERS,
+    thread_name_prefix="match-score",
+)
+
+
+# 매칭 토큰 서명 키 (호출마다 encode하지 않도록 한 번만 bytes로 변환)
+_TOKEN_KEY = (getattr(settings, "JWT_SECRET_KEY", "dev")).encode("utf-8")
+
+# 표준 base64 → base64url 문자 치환표
+_B64URL_TABLE = bytes.maketrans(b"+/", b"-_")
+
+
+def _sign_token(message: bytes) -> bytes:
+    """토큰 서명 (HMAC-SHA256, HMAC 객체 생성 없이 OpenSSL one-shot 경로)"""
+    return hmac.digest(_TOKEN_KEY, message, "sha256")
+
+
+def _b64url(data: bytes) -> bytes:
+    """패딩 없는 base64url 인코딩 (urlsafe_b64encode의 중간 b64encode 래핑 없이 바로 인코딩 후 치환)"""
+    return binascii.b2a_base64(data, newline=False).translate(_B64URL_TABLE).rstrip(b"=")
+
+
+@lru_cache(maxsize=4096)
+def _decode_matching_id(token: str) -> Tuple[str, str]:
+    """토큰에서 (resume_id, job_id) 복호화 및 서명 검증. 구형(uuid5)도 허용하지 않음.
+    토큰은 불변이므로 결과를 캐시 (상세 화면 폴링 시 재검증/디코딩 생략)
+    """
+    # <version>.<b64>.<sig> 형태만 지원
+    # v2: payload = resume_id.bytes + job_id.bytes (32바이트 고정)
+    # v1: payload = JSON {"resume_id","job_id"} (이미 공유된 링크 호환용, 발급은 중단)
+    parts = token.split(".")
+    if len(parts) != 3 or parts[0] not in ("v1", "v2"):
+        raise ValueError("invalid token format")
+    version, b64, sig = parts
+    expected = _sign_token(f"{version}.{b64}".encode("utf-8"))
+    expected_b64 = _b64url(expected)
+    if not hmac.compare_digest(expected_b64, sig.encode("utf-8")):
+        raise ValueError("invalid signature")
+    pad = '=' * (-len(b64) % 4)
+    payload_bytes = base64.urlsafe_b64decode(b64 + pad)
+    if version == "v2":
+        if len(payload_bytes) != 32:
+            raise ValueError("invalid token payload")
+        return str(uuid.UUID(bytes=payload_bytes[:16])), str(uuid.UUID(bytes=payload_bytes[16:]))
+    payload = json.loads(payload_bytes.decode("utf-8"))
+    return payload.get("resume_id"), payload.get("job_id")
+
+
+@lru_cache(maxsize=1024)
+def _embed_overall_text(text: str) -> np.ndarray:
+    """전체 유사도용 텍스트 임베딩 → 정규화 float32 (같은 텍스트는 임베딩 서비스 재호출 없음)
+    캐시된 배열은 호출 간 공유되므로 읽기 전용으로 반환
+    """
+    vec = np.asarray(get_embedding_service().generate_embedding(text), dtype=np.float32)
+    norm = np.linalg.norm(vec)
+    if norm > 0:
+        vec = vec / norm
+    vec.flags.writeable = False
+    return vec
+
+
+def _score_and_grade(
+    scores: List[float],
+    weights: List[float],
+    penalty_sum: float,
+    edges: Tuple[float, ...],
+    scale: float = 1.0
+) -> Tuple[float, int]:
+    """
+    가중합 → (배율) → 페널티 차감 → 등급 인덱스
+    
+    Args:
+        scores / weights: 고정 순서로 펼친 카테고리 점수와 가중치
+        penalty_sum: 페널티 합계
+        edges: 등급 하한 오름차순 (caution → excellent)
+        scale: 가중합에 곱할 배율 (자격요건 미달 감점 등)
+        
+    Returns:
+        (final_score, MATCH_GRADES 인덱스)
+    """
+    weighted_sum = 0.0
+    for score, weight in zip(scores, weights):
+        weighted_sum += score * weight
+    final_score = max(0.0, weighted_sum * scale - penalty_sum)
+    return final_score, _grade_index(final_score, edges)
+
+
+def _grade_index(score: float, edges: Tuple[float, ...]) -> int:
+    """점수 → MATCH_GRADES 인덱스 (edges: 오름차순 등급 하한, 이진 탐색)
+
+    overall_score는 REAL로 저장되고 DB grade 생성 컬럼은 그 값을 float8로 올려 하한과 비교하므로,
+    같은 등급이 나오도록 점수를 float32로 반올림한 뒤 비교한다 (경계값 0.8499999 등).
+    """
+    # bisect_right = score 이하인 하한 개수 (score >= cutoff 와 동일) → 높은 등급부터인 MATCH_GRADES 인덱스로 뒤집음
+    return len(edges) - bisect_right(edges, float(np.float32(score)))
+
+
 class MatchingService:
     """매칭 서비스 - 이력서와 채용공고 매칭"""
     
@@ -42,44 +182,28 @@ class MatchingService:
         # 섹션별 문장 단위 매칭 가중치 (config에서 가져오기)
         self.weights = settings.SECTIONAL_WEIGHTS
         self.thresholds = settings.DEFAULT_THRESHOLDS
-        self.grade_thresholds = settings.GRADE_THRESHOLDS
+        self.grade_thresholds = GRADE_THRESHOLDS
+        # 등급 하한을 오름차순 튜플로 미리 펼쳐 둠 (caution → excellent, bisect로 등급 조회)
+        self._grade_edges = tuple(self.grade_thresholds[g] for g in reversed(MATCH_GRADES[:-1]))
         self.use_sectional = True  # 섹션별 문장 단위 매칭 활성화
     
-    def _generate_matching_id(self, resume_id: str, job_id: str) -> str:
+    def _generate_matching_id(self, resume_id: UUID, job_id: UUID) -> str:
         """결정적 토큰 생성 (DB 저장 없이 식별/복호화 가능)
-        포맷: v1.<base64url(payload)>.<base64url(hmac)>
-        payload: {"resume_id":..., "job_id":...}
+        포맷: v2.<base64url(payload)>.<base64url(hmac)>
+        payload: resume_id.bytes + job_id.bytes (32바이트, JSON 직렬화 없음)
         """
-        payload = {"resume_id": resume_id, "job_id": job_id}
-        payload_bytes = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
-        b64 = base64.urlsafe_b64encode(payload_bytes).rstrip(b"=")
-        secret = (getattr(settings, "JWT_SECRET_KEY", "dev")).encode("utf-8")
-        sig = hmac.new(secret, b"v1." + b64, hashlib.sha256).digest()
-        sig_b64 = base64.urlsafe_b64encode(sig).rstrip(b"=")
-        return f"v1.{b64.decode()}.{sig_b64.decode()}"
-
-    def decode_matching_id(self, token: str) -> Dict[str, str]:
-        """토큰에서 resume_id, job_id 복호화 및 서명 검증. 구형(uuid5)도 허용하지 않음."""
-        # v1.<b64>.<sig> 형태만 지원
-        parts = token.split(".")
-        if len(parts) != 3 or parts[0] != "v1":
-            raise ValueError("invalid token format")
-        b64 = parts[1]
-        sig = parts[2]
-        secret = (getattr(settings, "JWT_SECRET_KEY", "dev")).encode("utf-8")
-        expected = hmac.new(secret, ("v1." + b64).encode("utf-8"), hashlib.sha256).digest()
-        expected_b64 = base64.urlsafe_b64encode(expected).rstrip(b"=")
-        if not hmac.compare_digest(expected_b64, sig.encode("utf-8")):
-            raise ValueError("invalid signature")
-        pad = '=' * (-len(b64) % 4)
-        payload_bytes = base64.urlsafe_b64decode(b64 + pad)
-        payload = json.loads(payload_bytes.decode("utf-8"))
-        return {"resume_id": payload.get("resume_id"), "job_id": payload.get("job_id")}
+        b64 = _b64url(resume_id.bytes + job_id.bytes)
+        sig_b64 = _b64url(_sign_token(b"v2." + b64))
+        return f"v2.{b64.decode()}.{sig_b64.decode()}"
+
+    def decode_matching_id(self, token: str) -> Tuple[str, str]:
+        """토큰에서 (resume_id, job_id) 복호화 및 서명 검증 (결과는 모듈 레벨에서 메모이즈)"""
+        return _decode_matching_id(token)
 
     def search_jobs_for_resume(
         self,
         resume_id: UUID,
-        filters: Optional[Dict[str, Any]] = None,
+        filters: Optional[MatchingFilters] = None,
         limit: int = 50
     ) -> List[Dict[str, Any]]:
         """
@@ -93,7 +217,7 @@ class MatchingService:
         Returns:
             매칭 결과 리스트
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # 1. 이력서 조회
         resume = self.db.query(Resume).filter(Resume.id == resume_id).first()
@@ -108,60 +232,95 @@ class MatchingService:
         
         logger.info(f"Searching jobs for resume: {resume.file_name}")
         
-        # 2. 모든 활성 공고 대상으로 매칭 (검색 단계: 전체 스캔)
-        try:
-            # is_active 컬럼이 있으면 필터, 없으면 전체
-            q = self.db.query(JobPosting)
-            if hasattr(JobPosting, "is_active"):
-                q = q.filter(JobPosting.is_active == True)
-            all_jobs = q.all()
-        except Exception:
-            all_jobs = self.db.query(JobPosting).all()
-
-        logger.info(f"Scanning all jobs for matching: count={len(all_jobs)}")
-
-        # 3. 각 채용공고에 대해 상세 매칭 점수 계산 (피드백 비활성)
-        results = []
-        for job in all_jobs:
-            try:
-                # 매칭 점수 계산
-                matching_result = self.calculate_matching_score(job, resume, generate_feedback=False)
-                
-                # 결과에 벡터 유사도 포함
-                result_dict = {
-                    "matching_id": self._generate_matching_id(str(resume.id), str(job.id)),
-                    "job_id": str(job.id),
-                    "job_title": job.title,
-                    "company_name": job.company.name if job.company else None,
-                    "location": job.location,
-                    "experience_level": job.experience_level,
-                    "overall_score": round(float(matching_result.overall_score) * 100, 1),  # 백분율로 변환
-                    "grade": matching_result.grade,
-                    "category_scores": self._convert_category_scores_to_percentage(matching_result.category_scores),
-                    "matching_evidence": matching_result.matching_evidence,
-                    "penalties": matching_result.penalties
-                }
-                
-                results.append(result_dict)
-                
-            except Exception as e:
-                logger.error(f"Error calculating match for job {job.id}: {e}")
-                continue
+        # 2. 후보 선별: 저장된 임베딩이 있는 공고는 pgvector HNSW(ANN) top-k,
+        #    아직 임베딩이 없는 공고만 프로세스 내 임베딩 캐시로 스캔 → 후보 본문만 조회
+        q = self.db.query(JobPosting).filter(JobPosting.is_active)
+        # 필터 적용 (Pydantic 모델 속성 직접 참조, dict 변환 없음)
+        if filters is not None:
+            if filters.location:
+                q = q.filter(JobPosting.location.ilike(f"%{filters.location}%"))
+            if filters.employment_type:
+                q = q.filter(JobPosting.employment_type == filters.employment_type)
+            if filters.experience_level:
+                q = q.filter(JobPosting.experience_level == filters.experience_level)
+
+        candidates = self._shortlist_jobs(q, resume, settings.JOB_PREFILTER_K)
+        logger.info(f"Shortlisted {len(candidates)} active jobs for matching")
+
+        # 3. 유사도 상위 후보만 상세 매칭 점수 계산 (2단계 캐스케이드, 피드백 비활성)
+        # 상세 점수로 재정렬되므로 limit보다 넉넉히(JOB_RERANK_K) 채점 후 limit개 반환
+        rerank_k = max(limit, settings.JOB_RERANK_K)
+        # 이력서 문장/정규화 임베딩 행렬은 요청 세션으로 먼저 채워 둠 (워커 스레드는 캐시만 읽음)
+        self.scoring._get_resume_matrix(resume)
+        # 후보 공고 문장은 IN 조회 한 번으로 미리 묶어 둠 (공고 × 섹션마다 SELECT 하지 않음)
+        candidates = candidates[:rerank_k]
+        job_sentences = self._prefetch_job_sentences([job.id for job, _ in candidates])
+        scored = _SCORING_EXECUTOR.map(
+            lambda candidate: self._score_candidate(candidate[0], resume, candidate[1], job_sentences),
+            candidates,
+        )
+        results = [result for result in scored if result is not None]
         
         # 4. 전체 점수로 재정렬
         results.sort(key=lambda x: x["overall_score"], reverse=True)
+        results = results[:limit]
         
-        processing_time = int((time.time() - start_time) * 1000)
+        processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
         logger.info(f"Matching completed in {processing_time}ms")
         
         return results
     
+    def _score_candidate(
+        self,
+        job: JobPosting,
+        resume: Resume,
+        overall_similarity: float,
+        job_sentences: Optional[Dict[Tuple[UUID, str], Tuple[list, list]]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        후보 공고 1건 상세 채점 → 검색 결과 dict (실패 시 None)
+        
+        워커 스레드에서 실행되므로 Session을 공유하지 않는다. 공고를 스레드 전용 세션에
+        merge(load=False)해 문장 조회가 그 세션으로 나가게 하고, 이력서는 이미 로드된
+        속성과 문장 캐시만 읽는다.
+        """
+        db = SessionLocal()
+        try:
+            job = db.merge(job, load=False)
+            # 매칭 점수 계산
+            matching_result = self.calculate_matching_score(
+                job, resume, generate_feedback=False, overall_similarity=overall_similarity,
+                job_sentences=job_sentences
+            )
+            
+            # 결과에 벡터 유사도 포함
+            return {
+                "matching_id": self._generate_matching_id(resume.id, job.id),
+                "job_id": str(job.id),
+                "job_title": job.title,
+                "company_name": job.company_name,
+                "location": job.location,
+                "experience_level": job.experience_level,
+                "overall_score": round(float(matching_result.overall_score) * 100, 1),  # 백분율로 변환
+                "grade": matching_result.grade,
+                "category_scores": self._convert_category_scores_to_percentage(matching_result.category_scores),
+                "matching_evidence": matching_result.matching_evidence,
+                "penalties": matching_result.penalties
+            }
+        except Exception as e:
+            logger.error(f"Error calculating match for job {job.id}: {e}")
+            return None
+        finally:
+            db.close()
+    
     def calculate_matching_score(
         self,
         job: JobPosting,
         resume: Resume,
         generate_feedback: bool = True,
-        use_cross_encoder: bool = False  # Cross-encoder 제거됨 (사용하지 않음)
+        use_cross_encoder: bool = False,  # Cross-encoder 제거됨 (사용하지 않음)
+        overall_similarity: Optional[float] = None,
+        job_sentences: Optional[Dict[Tuple[UUID, str], Tuple[list, list]]] = None
     ) -> MatchingResult:
         """
         채용공고와 이력서 간의 상세 매칭 점수 계산
@@ -173,32 +332,37 @@ class MatchingService:
             resume: 이력서
             generate_feedback: AI 피드백 생성 여부
             use_cross_encoder: Cross-encoder 제거됨 (사용하지 않음)
+            overall_similarity: 미리 계산된 전체 텍스트 유사도 (없으면 여기서 계산)
+            job_sentences: _prefetch_job_sentences 결과 (없으면 섹션마다 조회)
         
         Returns:
             MatchingResult 객체
         """
-        start_time = time.time()
-        
         # Cross-encoder 제거됨 - 항상 Bi-encoder 사용
         # 섹션별 문장 단위 매칭 사용 (자격요건 중심)
-        return self._calculate_matching_score_sectional_sentences(job, resume, generate_feedback)
+        return self._calculate_matching_score_sectional_sentences(
+            job, resume, generate_feedback, overall_similarity, job_sentences
+        )
     
     def _calculate_matching_score_sectional_sentences(
         self,
         job: JobPosting,
         resume: Resume,
-        generate_feedback: bool
+        generate_feedback: bool,
+        overall_similarity: Optional[float] = None,
+        job_sentences: Optional[Dict[Tuple[UUID, str], Tuple[list, list]]] = None
     ) -> MatchingResult:
         """섹션별 문장 단위 매칭 (자격요건 중심)"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # 1. 문장 단위 매칭으로 섹션별 점수 계산
-        required_score = self._calculate_section_score_by_sentences(job, resume, "required")
-        preferred_score = self._calculate_section_score_by_sentences(job, resume, "preferred")
-        experience_score = self._calculate_section_score_by_sentences(job, resume, "experience")
+        required_score = self._calculate_section_score_by_sentences(job, resume, "required", job_sentences)
+        preferred_score = self._calculate_section_score_by_sentences(job, resume, "preferred", job_sentences)
+        experience_score = self._calculate_section_score_by_sentences(job, resume, "experience", job_sentences)
         
-        # 2. 전체 유사도 계산 (전체 텍스트 임베딩 기반)
-        overall_similarity = self._calculate_overall_similarity(job, resume)
+        # 2. 전체 유사도 계산 (전체 텍스트 임베딩 기반, 검색 경로에서는 일괄 계산값 사용)
+        if overall_similarity is None:
+            overall_similarity = self._calculate_overall_similarity(job, resume)
         
         # 3. 기존 카테고리 점수도 계산 (학력, 자격증 등)
         education_score = self.scoring.calculate_education_score(job, resume)
@@ -240,23 +404,17 @@ class MatchingService:
             }
         }
         
-        # 5. 가중 평균 계산
-        weighted_sum = sum(
-            cat["score"] * cat["weight"] 
-            for cat in category_scores.values()
-        )
-        
-        # 6. 자격요건 매칭 실패 시 50% 감점 (엄격성 강화)
-        if required_score["score"] < 0.5:  # 50% 미만이면 실패로 간주
-            weighted_sum *= 0.5  # 50% 감점
-        
-        # 7. 페널티 계산
+        # 5~8. 가중 평균 → 자격요건 실패 감점 → 페널티 → 등급
+        # 자격요건 매칭 50% 미만이면 실패로 간주하여 50% 감점 (엄격성 강화)
         penalties = self.penalty.calculate_penalties(job, resume)
-        penalty_sum = sum(penalties.values())
-        final_score = max(0.0, weighted_sum - penalty_sum)
-        
-        # 8. 등급 부여
-        grade = self._assign_grade(final_score)
+        final_score, grade_idx = _score_and_grade(
+            [cat["score"] for cat in category_scores.values()],
+            [cat["weight"] for cat in category_scores.values()],
+            sum(penalties.values()),
+            self._grade_edges,
+            scale=0.5 if required_score["score"] < 0.5 else 1.0,
+        )
+        grade = MATCH_GRADES[grade_idx]
         
         # 9. 매칭 근거 생성 (섹션별 문장 단위 매칭 결과 사용)
         matching_evidence = {
@@ -280,12 +438,12 @@ class MatchingService:
                 matching_evidence["ai_feedback"] = "피드백 생성 중 오류가 발생했습니다."
         
         # 11. 결과 생성
-        calculation_time_ms = int((time.time() - start_time) * 1000)
+        calculation_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         
         matching_result = MatchingResult(
             job_id=job.id,
             resume_id=resume.id,
-            overall_score=Decimal(str(final_score)),
+            overall_score=final_score,
             grade=grade,
             category_scores=category_scores,
             matching_evidence=matching_evidence,
@@ -296,67 +454,170 @@ class MatchingService:
         
         return matching_result
 
+    @staticmethod
+    def _job_overall_text(job: JobPosting) -> str:
+        """전체 유사도용 공고 텍스트 (인덱싱 시 job.embedding과 같은 텍스트)"""
+        return job_overall_text(job)
+
+    @staticmethod
+    def _resume_overall_text(resume: Resume) -> str:
+        """전체 유사도용 이력서 텍스트 (인덱싱 시 resume.embedding과 같은 텍스트)"""
+        return resume_overall_text(resume)
+
+    def _resume_overall_vector(self, resume: Resume) -> np.ndarray:
+        """이력서 전체 임베딩 (인덱싱 때 저장된 resume.embedding 우선, 없으면 텍스트 임베딩)"""
+        if resume.embedding is not None:
+            vec = np.asarray(resume.embedding.to_numpy(), dtype=np.float32)
+            norm = np.linalg.norm(vec)
+            if norm > 0:
+                return vec / norm
+        return _embed_overall_text(self._resume_overall_text(resume))
+
+    def _cache_job_embeddings(self, jobs: List[JobPosting]) -> None:
+        """공고 임베딩 캐시 적재 (저장된 job.embedding은 그대로, 없는 공고만 배치 임베딩)"""
+        cache = get_job_embedding_cache()
+        stored = [job for job in jobs if job.embedding is not None]
+        if stored:
+            cache.put(stored, np.asarray([job.embedding for job in stored], dtype=np.float32))
+        pending = [job for job in jobs if job.embedding is None]
+        if pending:
+            cache.put(pending, self._embed_overall_texts([self._job_overall_text(job) for job in pending]))
+
+    def _embed_overall_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        전체 유사도용 텍스트 일괄 임베딩 → (N, D) float32
+        
+        max_chars를 넘는 텍스트는 generate_embedding과 같은 청크 평균 임베딩을 위해 단건 호출.
+        """
+        max_chars = self.embedding_service.max_chars
+        vectors = np.zeros((len(texts), self.embedding_service.dimension), dtype=np.float32)
+        short_idx = [i for i, t in enumerate(texts) if len(t) <= max_chars]
+        batch_size = settings.EMBEDDING_BATCH_SIZE
+        for start in range(0, len(short_idx), batch_size):
+            chunk = short_idx[start:start + batch_size]
+            vectors[chunk] = self.embedding_service.generate_embeddings_batch([texts[i] for i in chunk])
+        for i, t in enumerate(texts):
+            if len(t) > max_chars:
+                vectors[i] = self.embedding_service.generate_embedding(t)
+        return vectors
+
+    def _ann_shortlist(self, job_query, resume_vector: np.ndarray, k: int) -> List[Tuple[UUID, float]]:
+        """
+        저장된 job.embedding 대상 pgvector ANN top-k (ix_job_embedding_hnsw_active)
+        
+        Returns:
+            (job_id, cosine_similarity) 리스트 (유사도 내림차순)
+        """
+        # HNSW는 ef_search개까지만 후보를 돌려주므로 k 이상으로 올림 (현재 트랜잭션 한정)
+        self.db.execute(text(f"SET LOCAL hnsw.ef_search = {min(max(int(k), 40), 1000)}"))
+        distance = JobPosting.embedding.cosine_distance(resume_vector.tolist())
+        rows = (
+            job_query.filter(JobPosting.embedding.isnot(None))
+            .with_entities(JobPosting.id, distance.label("distance"))
+            .order_by(distance)
+            .limit(k)
+            .all()
+        )
+        return [(row.id, 1.0 - float(row.distance)) for row in rows]
+
+    def _scan_shortlist(self, job_keys: list, resume_vector: np.ndarray, k: int) -> List[Tuple[UUID, float]]:
+        """
+        프로세스 내 임베딩 캐시(JobEmbeddingCache) top-k (float32 행렬-벡터 내적)
+        
+        캐시에 없거나 수정된 공고만 서버측 커서로 EMBEDDING_BATCH_SIZE개씩 스트리밍해
+        청크마다 캐시에 적재 후 버린다 (콜드 캐시에서도 ORM 객체는 청크 하나만 메모리에 유지).
+        
+        Args:
+            job_keys: (id, updated_at) 행 리스트
+        """
+        cache = get_job_embedding_cache()
+        missing_ids = [key.id for key in cache.missing(job_keys)]
+        if missing_ids:
+            stream = self.db.execute(
+                select(JobPosting)
+                .where(JobPosting.id.in_(missing_ids))
+                .execution_options(yield_per=settings.EMBEDDING_BATCH_SIZE)
+            ).scalars()
+            for chunk in stream.partitions():
+                self._cache_job_embeddings(chunk)
+        idx, sims = cache.top_k(job_keys, resume_vector, k)
+        return [(job_keys[i].id, sim) for i, sim in zip(idx.tolist(), sims.tolist())]
+
+    def _shortlist_jobs(self, job_query, resume: Resume, k: int) -> List[Tuple[JobPosting, float]]:
+        """
+        전체 텍스트 유사도 상위 k개 공고 선별
+        
+        인덱싱 때 job.embedding이 저장된 공고는 DB의 HNSW 인덱스로 ANN 검색하고,
+        아직 임베딩이 없는 공고(또는 ANN 실패 시 전체)만 프로세스 내 캐시로 스캔해 합친다.
+        상세 채점할 후보의 본문만 마지막에 조회한다.
+        
+        Args:
+            job_query: 필터 적용된 활성 공고 Query[JobPosting]
+            
+        Returns:
+            (JobPosting, overall_similarity) 리스트 (유사도 내림차순)
+        """
+        try:
+            resume_vector = self._resume_overall_vector(resume)
+            scored: Dict[UUID, float] = {}
+            ann_failed = False
+            try:
+                scored.update(self._ann_shortlist(job_query, resume_vector, k))
+            except Exception as e:
+                # 조회 전용 구간이므로 롤백해 중단된 트랜잭션만 정리
+                logger.warning(f"ANN job shortlist failed, scanning in-process: {e}")
+                self.db.rollback()
+                ann_failed = True
+            scan_query = job_query if ann_failed else job_query.filter(JobPosting.embedding.is_(None))
+            job_keys = scan_query.with_entities(JobPosting.id, JobPosting.updated_at).all()
+            if job_keys:
+                scored.update(self._scan_shortlist(job_keys, resume_vector, k))
+            top = sorted(scored.items(), key=lambda item: item[1], reverse=True)[:k]
+            candidate_ids = [jid for jid, _ in top]
+            sims = [sim for _, sim in top]
+        except Exception as e:
+            # 임베딩 실패 시 유사도 0으로 앞쪽 k개만 상세 채점
+            logger.warning(f"Job shortlist embedding failed: {e}")
+            candidate_ids = [row.id for row in job_query.with_entities(JobPosting.id).limit(k).all()]
+            sims = [0.0] * len(candidate_ids)
+        loaded = {
+            job.id: job
+            for job in (
+                self.db.query(JobPosting).filter(JobPosting.id.in_(candidate_ids)).all() if candidate_ids else []
+            )
+        }
+        return [
+            (loaded[jid], min(max(float(sim), 0.0), 1.0))
+            for jid, sim in zip(candidate_ids, sims)
+            if jid in loaded
+        ]
+
     def _calculate_overall_similarity(self, job: JobPosting, resume: Resume) -> float:
-        """전체 텍스트 유사도 계산"""
+        """
+        전체 텍스트 유사도 계산
+        
+        공고 벡터는 검색 경로와 같은 JobEmbeddingCache에서, 이력서 벡터는 저장된 resume.embedding
+        (없으면 텍스트 단위 LRU)에서 가져오므로 채점 시점에 임베딩 모델을 거의 호출하지 않는다.
+        """
         try:
-            # 전체 텍스트 임베딩 생성
-            job_text = f"{job.title} {job.description or ''} {job.requirements or ''} {job.qualifications or ''}"
-            
-            # 이력서 텍스트 구성 (parsed_data에서 추출)
-            parsed_data = resume.parsed_data or {}
-            resume_text = f"{parsed_data.get('summary', '')} {parsed_data.get('work_experience', '')} {parsed_data.get('skills', '')} {parsed_data.get('projects', '')}"
+            cache = get_job_embedding_cache()
+            if cache.missing([job]):
+                self._cache_job_embeddings([job])
+            job_embedding = cache.matrix_for([job])[0]
+            resume_embedding = self._resume_overall_vector(resume)
             
-            # 임베딩 생성
-            job_embedding = self.embedding_service.generate_embedding(job_text)
-            resume_embedding = self.embedding_service.generate_embedding(resume_text)
-            
-            # 코사인 유사도 계산
-            similarity = self.embedding_service.cosine_similarity(job_embedding, resume_embedding)
-            return float(similarity)
+            # 둘 다 정규화되어 있으므로 내적 = 코사인 유사도
+            return float(job_embedding @ resume_embedding)
             
         except Exception as e:
             logger.warning(f"Overall similarity calculation failed: {e}")
             return 0.0
 
     def _get_dynamic_threshold(self, condition: str, section: str) -> float:
-        """조건별 동적 임계값 설정"""
-        condition_lower = condition.lower()
-        
-        # 기술 스택별 세분화된 임계값 (실제 테스트 결과 기반 최적화)
-        tech_thresholds = {
-            # 백엔드 기술 스택 (충돌 방지 - 매우 엄격)
-            'java': 0.75, 'kotlin': 0.75, 'spring': 0.75,
-            'python': 0.62, 'fastapi': 0.62, 'django': 0.62,  # 약간 완화
-            'node.js': 0.70, 'express': 0.70,
-            
-            # 프론트엔드 기술 스택 (충돌 방지 - 매우 엄격)
-            'react': 0.75, 'next.js': 0.75, 'typescript': 0.75,
-            'vue.js': 0.70, 'angular': 0.70,
-            'flutter': 0.70,
-            
-            # 모바일 개발 (충돌 방지 - 매우 엄격)
-            'android': 0.75, 'ios': 0.75,
-            
-            # 데이터베이스 (더 완화)
-            'mysql': 0.55, 'postgresql': 0.55, 'mongodb': 0.55,
-            
-            # 클라우드/인프라 (현재 적절)
-            'aws': 0.65, 'gcp': 0.65, 'azure': 0.65,
-            'docker': 0.65, 'kubernetes': 0.70,
-            
-            # AI/ML (완화)
-            'tensorflow': 0.62, 'pytorch': 0.62, 'opencv': 0.62,
-            'langchain': 0.62, 'langgraph': 0.62
-        }
-        
+        """조건별 동적 임계값 설정 (기술 키워드는 미리 컴파일한 정규식 한 번의 스캔으로 검출)"""
         # 가장 높은 임계값 찾기
-        max_threshold = 0.60  # 기본값
-        matched_techs = []
-        
-        for tech, threshold in tech_thresholds.items():
-            if tech in condition_lower:
-                max_threshold = max(max_threshold, threshold)
-                matched_techs.append(tech)
+        matched_techs = list(dict.fromkeys(m.group(1) for m in _TECH_PATTERN.finditer(condition.lower())))
+        max_threshold = max([0.60] + [_TECH_THRESHOLDS[tech] for tech in matched_techs])  # 기본값 0.60
         
         # 로깅
         if matched_techs:
@@ -364,25 +625,38 @@ class MatchingService:
         
         return max_threshold
     
-    def _calculate_section_score_by_sentences(self, job: JobPosting, resume: Resume, section: str) -> dict:
-        """섹션별 문장 단위 매칭 점수 계산"""
+    def _calculate_section_score_by_sentences(
+        self,
+        job: JobPosting,
+        resume: Resume,
+        section: str,
+        prefetched: Optional[Dict[Tuple[UUID, str], Tuple[list, list]]] = None
+    ) -> dict:
+        """섹션별 문장 단위 매칭 점수 계산 (prefetched가 있으면 DB 조회 없이 사용)"""
         try:
             # 공고의 해당 섹션 문장들 가져오기
-            job_sentences = self._get_job_sentences_by_section(job, section)
+            if prefetched is not None:
+                job_sentences, job_embeddings = prefetched.get((job.id, section), ([], []))
+            else:
+                job_sentences, job_embeddings = self._get_job_sentences_by_section(job, section)
             if not job_sentences:
-                return {"score": 0.0, "evidence": {"matched": [], "missing": [], "detailed_analysis": []}}
+                return {"score": 0.0, "evidence": {"matched": [], "missing": [], "detailed_analysis": [], "matched_count": 0, "total_count": 0}}
             
-            # 이력서 문장들 가져오기
-            resume_sentences, resume_embeddings, resume_sections = self.scoring._get_cached_sentences(resume)
+            # 이력서 문장들 가져오기 (공고 N건 × 섹션 3개가 공유하는 정규화 행렬)
+            resume_sentences, resume_sections, resume_matrix, resume_valid = self.scoring._get_resume_matrix(resume)
             
             # 문장 단위 매칭 분석
             detailed_analysis = []
             matched_conditions = []
             missing_conditions = []
             
-            for condition in job_sentences:
-                best_sim, best_sentence = self.scoring._best_sentence_match(condition, resume_sentences, resume_embeddings)
-                
+            # 조건(M) × 이력서 문장(N) 유사도를 행렬곱 한 번으로 계산 (저장된 공고 문장 임베딩 재사용)
+            best_matches = self.scoring._best_sentence_matches(
+                job_sentences, resume_sentences, None,
+                condition_embeddings=job_embeddings, resume_matrix=(resume_matrix, resume_valid)
+            )
+            
+            for condition, (best_sim, best_sentence, best_idx) in zip(job_sentences, best_matches):
                 # 임계값 설정 (조건별 세분화)
                 threshold = self._get_dynamic_threshold(condition, section)
                 
@@ -392,7 +666,7 @@ class MatchingService:
                     'matched': matched,
                     'similarity_score': best_sim,
                     'matched_sentence': best_sentence,
-                    'matched_section': resume_sections[resume_sentences.index(best_sentence)] if best_sentence in resume_sentences else 'unknown',
+                    'matched_section': resume_sections[best_idx] if best_idx >= 0 else 'unknown',
                     'match_type': 'semantic' if matched else 'none',
                     'threshold_used': threshold
                 }
@@ -435,43 +709,84 @@ class MatchingService:
                     "matched": matched_conditions,
                     "missing": missing_conditions,
                     "detailed_analysis": detailed_analysis,
-                    "match_rate": f"{len(matched_conditions)}/{len(job_sentences)}"
+                    "match_rate": f"{len(matched_conditions)}/{len(job_sentences)}",
+                    # 요약 집계는 계산 시점에 함께 저장 (응답 단계에서 재순회 불필요)
+                    "matched_count": len(matched_conditions),
+                    "total_count": len(job_sentences)
                 }
             }
             
         except Exception as e:
             logger.error(f"Section score calculation failed for {section}: {e}")
-            return {"score": 0.0, "evidence": {"matched": [], "missing": [], "detailed_analysis": []}}
+            return {"score": 0.0, "evidence": {"matched": [], "missing": [], "detailed_analysis": [], "matched_count": 0, "total_count": 0}}
     
-    def _get_job_sentences_by_section(self, job: JobPosting, section: str) -> list:
-        """공고의 특정 섹션 문장들 가져오기"""
+    def _prefetch_job_sentences(self, job_ids: List[UUID]) -> Optional[Dict[Tuple[UUID, str], Tuple[list, list]]]:
+        """
+        후보 공고들의 섹션 문장/임베딩을 한 번에 조회
+        
+        Returns:
+            {(job_id, section): (texts, embeddings)} — 문장 idx 순, 임베딩 없으면 None
+            (조회 실패 시 None → 섹션별 개별 조회로 폴백)
+        """
+        from app.models.sentences import JobSentence
+        grouped: Dict[Tuple[UUID, str], Tuple[list, list]] = {}
+        if not job_ids:
+            return grouped
+        try:
+            rows = self.db.query(
+                JobSentence.job_id, JobSentence.section, JobSentence.text, JobSentence.embedding
+            ).filter(
+                JobSentence.job_id.in_(job_ids),
+                JobSentence.section.in_(("required", "preferred", "experience"))
+            ).order_by(JobSentence.job_id, JobSentence.section, JobSentence.idx.asc()).all()
+        except Exception as e:
+            logger.warning(f"Failed to prefetch job sentences: {e}")
+            return None
+        for row in rows:
+            texts, embeddings = grouped.setdefault((row.job_id, row.section), ([], []))
+            texts.append(row.text)
+            embeddings.append(row.embedding.to_numpy() if row.embedding is not None else None)
+        return grouped
+
+    def _get_job_sentences_by_section(self, job: JobPosting, section: str) -> Tuple[list, list]:
+        """공고의 특정 섹션 문장들과 저장된 임베딩 가져오기 (임베딩 없으면 None)"""
         try:
             from app.models.sentences import JobSentence
             db = job._sa_instance_state.session
             if not db:
-                return []
+                return [], []
             
-            rows = db.query(JobSentence).filter(
+            rows = db.query(JobSentence.text, JobSentence.embedding).filter(
                 JobSentence.job_id == job.id,
                 JobSentence.section == section
             ).order_by(JobSentence.idx.asc()).all()
             
-            return [row.text for row in rows]
+            texts = [row.text for row in rows]
+            embeddings = [
+                row.embedding.to_numpy() if row.embedding is not None else None
+                for row in rows
+            ]
+            return texts, embeddings
         except Exception as e:
             logger.warning(f"Failed to get job sentences for section {section}: {e}")
-            return []
+            return [], []
     
     def _calculate_matching_score_sectional(
         self,
         job: JobPosting,
         resume: Resume,
-        generate_feedback: bool
+        generate_feedback: bool,
+        resume_vectors: Optional[Dict[str, Optional[np.ndarray]]] = None
     ) -> MatchingResult:
-        """섹션별 임베딩 방식 (개선 버전)"""
-        start_time = time.time()
+        """섹션별 임베딩 방식 (개선 버전)
+        
+        resume_vectors: SectionalScoringService.prepare_resume_vectors 결과
+            (여러 공고를 채점할 때 호출 측에서 한 번만 계산해 전달)
+        """
+        start_ns = time.perf_counter_ns()
         
         # 1. 섹션별 점수 계산
-        sectional_scores = self.sectional_scoring.calculate_sectional_score(job, resume)
+        sectional_scores = self.sectional_scoring.calculate_sectional_score(job, resume, resume_vectors)
         
         # 2. 기존 카테고리 점수도 계산 (학력, 자격증 등)
         education_score = self.scoring.calculate_education_score(job, resume)
@@ -510,21 +825,15 @@ class MatchingService:
             }
         }
         
-        # 4. 가중 평균 계산
-        weighted_sum = sum(
-            cat["score"] * cat["weight"] 
-            for cat in category_scores.values()
-        )
-        
-        # 5. 페널티 계산
+        # 4~7. 가중 평균 → 페널티 적용 → 등급
         penalties = self.penalty.calculate_penalties(job, resume)
-        
-        # 6. 페널티 적용
-        penalty_sum = sum(penalties.values())
-        final_score = max(0.0, weighted_sum - penalty_sum)
-        
-        # 7. 등급 부여
-        grade = self._assign_grade(final_score)
+        final_score, grade_idx = _score_and_grade(
+            [cat["score"] for cat in category_scores.values()],
+            [cat["weight"] for cat in category_scores.values()],
+            sum(penalties.values()),
+            self._grade_edges,
+        )
+        grade = MATCH_GRADES[grade_idx]
         
         # 8. 상세 매칭 분석
         required_conditions = job.requirements.get('required', []) if job.requirements else []
@@ -572,13 +881,13 @@ class MatchingService:
             matching_evidence["feedback"] = feedback
         
         # 10. 계산 시간
-        calculation_time = int((time.time() - start_time) * 1000)
+        calculation_time = (time.perf_counter_ns() - start_ns) // 1_000_000
         
         # 11. MatchingResult 객체 생성
         matching_result = MatchingResult(
             job_id=job.id,
             resume_id=resume.id,
-            overall_score=Decimal(str(round(final_score, 4))),
+            overall_score=round(final_score, 4),
             grade=grade,
             category_scores=category_scores,
             matching_evidence=matching_evidence,
@@ -594,17 +903,13 @@ class MatchingService:
         return matching_result
     
     def _convert_category_scores_to_percentage(self, category_scores: dict) -> dict:
-        """카테고리 점수들을 백분율로 변환"""
-        converted = {}
-        for key, value in category_scores.items():
-            if isinstance(value, dict) and 'score' in value:
-                converted[key] = {
-                    'score': round(value['score'] * 100, 1),
-                    'weight': value.get('weight', 0)
-                }
-            else:
-                converted[key] = value
-        return converted
+        """카테고리 점수들을 백분율로 변환
+        category_scores는 위 두 스코어링 경로에서만 만들어지며 항목마다 score/weight가 항상 있음 → 타입 검사 생략
+        """
+        return {
+            key: {'score': round(value['score'] * 100, 1), 'weight': value['weight']}
+            for key, value in category_scores.items()
+        }
 
     def _assign_grade(self, overall_score: float) -> str:
         """
@@ -616,15 +921,4 @@ class MatchingService:
         Returns:
             excellent | good | fair | caution | poor
         """
-        thresholds = self.grade_thresholds
-        
-        if overall_score >= thresholds["excellent"]:
-            return "excellent"
-        elif overall_score >= thresholds["good"]:
-            return "good"
-        elif overall_score >= thresholds["fair"]:
-            return "fair"
-        elif overall_score >= thresholds["caution"]:
-            return "caution"
-        else:
-            return "poor"
+        return MATCH_GRADES[_grade_index(overall_score, self._grade_edges)]
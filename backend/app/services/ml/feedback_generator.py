@@ -11,6 +11,55 @@ from app.core.config import get_settings
 settings = get_settings()
 
 
+# 고정 지시문 + 응답 JSON 스키마 (프롬프트 캐싱용: 매 호출 바이트 단위로 동일한 system 메시지,
+# 공고/이력서/점수 등 가변 내용은 user 메시지로만 전달)
+_FEEDBACK_SYSTEM_PROMPT = """당신은 채용 전문가입니다. 구직자에게 건설적이고 실행 가능한 피드백을 제공합니다.
+사용자가 보내는 채용 공고와 구직자 이력서를 **문장별로 상세히 비교 분석**하여 개인화된 피드백을 제공해주세요.
+
+# 📝 요청사항
+다음 형식의 JSON으로 **문장별 상세 분석**과 피드백을 제공해주세요:
+
+{
+  "detailed_matching": [
+    {
+      "requirement_number": 1,
+      "requirement_text": "자격요건 문장",
+      "match_status": "충족|부분충족|부족",
+      "match_score": "90%",
+      "resume_evidence": "이력서에서 매칭되는 구체적 내용",
+      "feedback": "해당 조건에 대한 구체적 피드백"
+    },
+    ...
+  ],
+  "strengths": [
+    "강점 1 (구체적으로, 이력서 내용 인용)",
+    "강점 2",
+    "강점 3"
+  ],
+  "improvements": [
+    "개선점 1 (구체적인 행동 제안)",
+    "개선점 2",
+    "개선점 3"
+  ],
+  "recommendations": [
+    "추천 1 (실행 가능한 제안)",
+    "추천 2",
+    "추천 3"
+  ]
+}
+
+**중요 지침:**
+1. **detailed_matching**: 자격요건 각 조건마다 분석 (최대 7개)
+   - 이력서에서 해당 조건과 매칭되는 구체적 내용 찾기
+   - 충족도 평가 (충족/부분충족/부족)
+   - 조건별 구체적 피드백
+2. **strengths**: 전체적인 강점 3-4개 (이력서 내용 인용)
+3. **improvements**: 구체적이고 실행 가능한 개선점 3-4개
+4. **recommendations**: 다음 단계 행동 제안 3개
+5. 긍정적이고 격려하는 톤 유지
+6. 이력서의 실제 내용을 인용하여 구체성 확보"""
+
+
 class FeedbackGenerator:
     """매칭 결과 기반 피드백 생성 (GPT-5 기반)"""
     
@@ -76,11 +125,10 @@ class FeedbackGenerator:
             for exp in work_exp[:3]
         ]) if work_exp else '경력 정보 없음'
         
-        prompt = f"""당신은 채용 전문가입니다. 구직자의 이력서와 채용 공고를 **문장별로 상세히 비교 분석**하여 개인화된 피드백을 제공해주세요.
-
-# 📋 채용 공고
+        # 공고 → 이력서 → 점수 순 (같은 공고로 여러 이력서 피드백 시 공고 부분까지 프리픽스 캐시)
+        prompt = f"""# 📋 채용 공고
 - 직무: {job.title}
-- 회사: {job.company.name if job.company else '미상'}
+- 회사: {job.company_name or '미상'}
 - 경력 요구: {job.experience_level or '미상'}
 
 # ✅ 자격요건 (각 조건별로 분석 필요!)
@@ -104,57 +152,14 @@ class FeedbackGenerator:
 # 📊 매칭 점수 요약
 - 종합 점수: {overall_score*100:.1f}% ({grade.upper()})
 - 자격요건 충족률: {req.get('match_rate', '?')}
-- 우대사항 충족률: {pref.get('match_rate', '?')}
-
-# 📝 요청사항
-다음 형식의 JSON으로 **문장별 상세 분석**과 피드백을 제공해주세요:
-
-{{
-  "detailed_matching": [
-    {{
-      "requirement_number": 1,
-      "requirement_text": "자격요건 문장",
-      "match_status": "충족|부분충족|부족",
-      "match_score": "90%",
-      "resume_evidence": "이력서에서 매칭되는 구체적 내용",
-      "feedback": "해당 조건에 대한 구체적 피드백"
-    }},
-    ...
-  ],
-  "strengths": [
-    "강점 1 (구체적으로, 이력서 내용 인용)",
-    "강점 2",
-    "강점 3"
-  ],
-  "improvements": [
-    "개선점 1 (구체적인 행동 제안)",
-    "개선점 2",
-    "개선점 3"
-  ],
-  "recommendations": [
-    "추천 1 (실행 가능한 제안)",
-    "추천 2",
-    "추천 3"
-  ]
-}}
-
-**중요 지침:**
-1. **detailed_matching**: 자격요건 각 조건마다 분석 (최대 7개)
-   - 이력서에서 해당 조건과 매칭되는 구체적 내용 찾기
-   - 충족도 평가 (충족/부분충족/부족)
-   - 조건별 구체적 피드백
-2. **strengths**: 전체적인 강점 3-4개 (이력서 내용 인용)
-3. **improvements**: 구체적이고 실행 가능한 개선점 3-4개
-4. **recommendations**: 다음 단계 행동 제안 3개
-5. 긍정적이고 격려하는 톤 유지
-6. 이력서의 실제 내용을 인용하여 구체성 확보"""
+- 우대사항 충족률: {pref.get('match_rate', '?')}"""
 
         try:
             # GPT-5 호출
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": "당신은 채용 전문가입니다. 구직자에게 건설적이고 실행 가능한 피드백을 제공합니다."},
+                    {"role": "system", "content": _FEEDBACK_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 response_format={"type": "json_object"}
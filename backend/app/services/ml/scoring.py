@@ -1,7 +1,8 @@
 """
 Scoring Service - 카테고리별 매칭 점수 계산
 """
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Optional, Set, Tuple
+import numpy as np
 from sqlalchemy.orm import Session
 from app.models.job import JobPosting
 from app.models.resume import Resume
@@ -9,11 +10,20 @@ from app.core.config import settings
 from app.core.logging import logger
 
 
+def _l2_normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """행 단위 L2 정규화 (in-place, 0벡터 행은 0으로 유지)"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix /= norms
+    return matrix
+
+
 class ScoringService:
     """점수 계산 서비스"""
     def __init__(self, db: Session = None):
         self.db = db
-        # 간단한 프로세스 내 캐시: resume_id -> { 'lines': [...], 'embs': [...], 'sections': [...] }
+        # 간단한 프로세스 내 캐시: resume_id -> { 'lines': [...], 'embs': [...], 'sections': [...],
+        #   'matrix': (정규화된 (V,768) float32 연속 행렬, 임베딩이 있는 문장 인덱스) }
         self._resume_sentence_cache: dict = {}
     
     def calculate_skill_score(
@@ -62,10 +72,9 @@ class ScoringService:
             required_skills = self._extract_skills_from_conditions(required_conditions)
             required_skills.update({s.lower() for s in job_skills})
             if required_conditions:
-                required_per_scores = [
-                    self._condition_soft_score(cond, sent_lines, sent_embeddings, section="required", resume_skills_lower=resume_skills_lower)
-                    for cond in required_conditions
-                ]
+                required_per_scores = self._condition_soft_scores(
+                    required_conditions, sent_lines, sent_embeddings, section="required"
+                )
                 keyword_required = 0.0
                 if required_skills:
                     matched_required_kw = required_skills & resume_skills_lower
@@ -77,10 +86,9 @@ class ScoringService:
             # 3) 우대 조건: 소프트 점수 평균 + 키워드 보조
             preferred_skills = self._extract_skills_from_conditions(preferred_conditions)
             if preferred_conditions:
-                preferred_per_scores = [
-                    self._condition_soft_score(cond, sent_lines, sent_embeddings, section="preferred", resume_skills_lower=resume_skills_lower)
-                    for cond in preferred_conditions
-                ]
+                preferred_per_scores = self._condition_soft_scores(
+                    preferred_conditions, sent_lines, sent_embeddings, section="preferred"
+                )
                 keyword_preferred = 0.0
                 if preferred_skills:
                     matched_preferred_kw = preferred_skills & resume_skills_lower
@@ -639,75 +647,159 @@ class ScoringService:
         cached = self._resume_sentence_cache.get(key)
         if cached:
             return cached['lines'], cached['embs'], cached['sections']
-        # Prefer DB-stored sentences if available
-        db_lines, db_secs = self._load_resume_sentences(resume)
+        # Prefer DB-stored sentences (and their indexed embeddings) if available
+        db_lines, db_secs, db_embs = self._load_resume_sentences(resume)
         if db_lines:
-            lines, sections = db_lines, db_secs
+            lines, sections, embs = db_lines, db_secs, db_embs
         else:
             lines, sections = self._collect_resume_sentences_with_sections(resume)
-        embs = self._embed_texts(lines)
+            embs = [None] * len(lines)
+        # 저장된 임베딩이 없는 문장만 배치로 임베딩
+        missing = [i for i, e in enumerate(embs) if e is None]
+        if missing:
+            for i, emb in zip(missing, self._embed_texts([lines[i] for i in missing])):
+                embs[i] = emb
         self._resume_sentence_cache[key] = { 'lines': lines, 'embs': embs, 'sections': sections }
         return lines, embs, sections
 
-    def _load_resume_sentences(self, resume: Resume) -> (List[str], List[str]):
+    def _get_resume_matrix(self, resume: Resume) -> Tuple[List[str], List[str], np.ndarray, List[int]]:
+        """
+        이력서 문장 임베딩을 L2 정규화된 연속 float32 행렬로 한 번만 만들어 캐시
+        
+        공고 N건 × 섹션 3개 비교가 같은 행렬을 공유하므로 코사인 = 내적 (호출마다 스택/정규화 없음).
+        
+        Returns:
+            (lines, sections, R (V,768), valid) — valid[j]는 R의 j번째 행에 해당하는 문장 인덱스
+        """
+        lines, embs, sections = self._get_cached_sentences(resume)
+        cached = self._resume_sentence_cache[str(resume.id)]
+        if 'matrix' not in cached:
+            valid = [i for i, e in enumerate(embs) if e is not None]
+            if valid:
+                R = _l2_normalize_rows(np.ascontiguousarray([embs[i] for i in valid], dtype=np.float32))
+            else:
+                R = np.empty((0, 0), dtype=np.float32)
+            cached['matrix'] = (R, valid)
+        R, valid = cached['matrix']
+        return lines, sections, R, valid
+
+    def _load_resume_sentences(self, resume: Resume) -> (List[str], List[str], List[Optional[np.ndarray]]):
         try:
             from app.models.sentences import ResumeSentence
             if not self.db:
-                return [], []
-            rows = self.db.query(ResumeSentence).filter(ResumeSentence.resume_id == resume.id).order_by(ResumeSentence.idx.asc()).all()
+                return [], [], []
+            rows = self.db.query(
+                ResumeSentence.text, ResumeSentence.section, ResumeSentence.embedding
+            ).filter(ResumeSentence.resume_id == resume.id).order_by(ResumeSentence.idx.asc()).all()
             if not rows:
-                return [], []
-            return [r.text for r in rows], [r.section or 'raw' for r in rows]
+                return [], [], []
+            return (
+                [r.text for r in rows],
+                [r.section or 'raw' for r in rows],
+                [r.embedding.to_numpy() if r.embedding is not None else None for r in rows],
+            )
         except Exception as e:
             logger.warning(f"Failed to load resume sentences: {e}")
-            return [], []
+            return [], [], []
 
-    def _embed_texts(self, texts: List[str]) -> List[list]:
+    def _embed_texts(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """문장 임베딩 (EMBEDDING_BATCH_SIZE 단위 배치 호출, 배치 실패 시 해당 청크만 단건 호출)"""
         try:
-            from app.services.ml.embedding import EmbeddingService
-            emb = EmbeddingService()
-            out = []
-            for t in texts:
-                try:
-                    out.append(emb.generate_embedding(t))
-                except Exception:
-                    out.append(None)
-            return out
+            from app.services.ml.embedding import get_embedding_service
+            emb = get_embedding_service()
         except Exception:
             return [None for _ in texts]
+        out: List[Optional[np.ndarray]] = []
+        batch_size = settings.EMBEDDING_BATCH_SIZE
+        for start in range(0, len(texts), batch_size):
+            chunk = texts[start:start + batch_size]
+            try:
+                vectors = emb.generate_embeddings_batch(chunk)
+                if len(vectors) != len(chunk):
+                    raise ValueError("embedding batch size mismatch")
+                out.extend(np.asarray(v, dtype=np.float32) for v in vectors)
+            except Exception:
+                for t in chunk:
+                    try:
+                        out.append(np.asarray(emb.generate_embedding(t), dtype=np.float32))
+                    except Exception:
+                        out.append(None)
+        return out
+
+    def _best_sentence_matches(
+        self,
+        conditions: List[str],
+        sent_lines: List[str],
+        sent_embeddings: List[list],
+        condition_embeddings: Optional[List[Any]] = None,
+        resume_matrix: Optional[Tuple[np.ndarray, List[int]]] = None
+    ) -> List[Tuple[float, str, int]]:
+        """
+        조건 M개 × 이력서 문장 N개 코사인 유사도를 행렬곱 한 번으로 계산
+
+        이력서 문장 (N,768)과 조건 (M,768)을 각각 float32 행렬로 쌓아 L2 정규화한 뒤
+        C @ R.T (M,N)에서 조건별 최고 유사도 문장을 고른다.
+        condition_embeddings가 주어지면(예: DB에 저장된 JobSentence 임베딩) 그대로 쓰고,
+        비어 있는 조건만 배치로 임베딩한다.
+        resume_matrix((R, valid), _get_resume_matrix 결과)가 주어지면 이력서 쪽 스택/정규화를 생략한다.
+
+        Returns:
+            조건 순서대로 (best_sim, best_sentence, sentence_index) 리스트
+            (매칭 문장이 없으면 (0.0, "", -1))
+        """
+        empty = [(0.0, "", -1) for _ in conditions]
+        if not conditions:
+            return []
+        if resume_matrix is not None:
+            R, valid = resume_matrix
+        else:
+            valid = [i for i, e in enumerate(sent_embeddings or []) if e is not None]
+            R = None
+        if not valid:
+            return empty
+
+        cond_vecs = list(condition_embeddings) if condition_embeddings is not None else [None] * len(conditions)
+        missing = [i for i, v in enumerate(cond_vecs) if v is None]
+        if missing:
+            try:
+                from app.services.ml.embedding import get_embedding_service
+                embs = get_embedding_service().generate_embeddings_batch([conditions[i] for i in missing])
+            except Exception:
+                return empty
+            if len(embs) != len(missing):
+                return empty
+            for i, emb in zip(missing, embs):
+                cond_vecs[i] = emb
+
+        if R is None:
+            R = _l2_normalize_rows(np.asarray([sent_embeddings[i] for i in valid], dtype=np.float32))
+        C = _l2_normalize_rows(np.asarray(cond_vecs, dtype=np.float32))
+        sims = C @ R.T
+        best_cols = sims.argmax(axis=1)
+        best_sims = sims[np.arange(len(conditions)), best_cols]
+
+        results = []
+        for sim, col in zip(best_sims.tolist(), best_cols.tolist()):
+            idx = valid[col]
+            results.append((max(sim, 0.0), sent_lines[idx], idx))
+        return results
 
     def _best_sentence_match(self, condition: str, sent_lines: List[str], sent_embeddings: List[list]) -> (float, str):
-        try:
-            from app.services.ml.embedding import EmbeddingService
-            emb = EmbeddingService()
-            cond_emb = emb.generate_embedding(condition)
-        except Exception:
-            return 0.0, ""
-        import numpy as np
-        best_sim = -1.0
-        best_sent = ""
-        for s, se in zip(sent_lines, sent_embeddings):
-            if se is None:
-                continue
-            a = np.array(se, dtype='float32')
-            b = np.array(cond_emb, dtype='float32')
-            na = np.linalg.norm(a)
-            nb = np.linalg.norm(b)
-            if na == 0 or nb == 0:
-                sim = 0.0
-            else:
-                sim = float((a @ b) / (na * nb))
-            if sim > best_sim:
-                best_sim = sim
-                best_sent = s
-        if best_sim < 0:
-            best_sim = 0.0
+        best_sim, best_sent, _ = self._best_sentence_matches([condition], sent_lines, sent_embeddings)[0]
         return best_sim, best_sent
 
     def _condition_soft_score(self, condition: str, sent_lines: List[str], sent_embeddings: List[list], section: str, resume_skills_lower: Set[str]) -> float:
+        best_sim, _ = self._best_sentence_match(condition, sent_lines, sent_embeddings)
+        return self._soft_score_from_similarity(best_sim, section)
+
+    def _condition_soft_scores(self, conditions: List[str], sent_lines: List[str], sent_embeddings: List[list], section: str) -> List[float]:
+        """_condition_soft_score의 배치 버전 (조건 전체를 행렬곱 한 번으로 계산)"""
+        matches = self._best_sentence_matches(conditions, sent_lines, sent_embeddings)
+        return [self._soft_score_from_similarity(best_sim, section) for best_sim, _, _ in matches]
+
+    def _soft_score_from_similarity(self, best_sim: float, section: str) -> float:
         thr = 0.70 if section == "required" else 0.60
         floor = 0.50 if section == "required" else 0.50
-        best_sim, _ = self._best_sentence_match(condition, sent_lines, sent_embeddings)
         if best_sim >= thr:
             return 1.0
         if best_sim <= floor:
@@ -2,27 +2,68 @@
 Sectional Scoring Service - 섹션별 임베딩 기반 점수 계산
 """
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from app.models.job import JobPosting
 from app.models.resume import Resume
 from app.core.config import settings
 from app.core.logging import logger
 
 
+def _as_float32(value) -> np.ndarray:
+    """halfvec 컬럼 값(HalfVector)을 float32 배열로 변환 (연산 정밀도는 float32 유지)"""
+    if hasattr(value, "to_numpy"):
+        value = value.to_numpy()
+    return np.asarray(value, dtype=np.float32)
+
+
+def _unit(value) -> Optional[np.ndarray]:
+    """임베딩 컬럼 값 → L2 정규화된 float32 벡터 (값이 없으면 None)"""
+    if value is None:
+        return None
+    vec = _as_float32(value)
+    norm = np.linalg.norm(vec)
+    return vec / norm if norm > 0 else vec
+
+
+def _cosine_to_unit(job_value: bytes, resume_unit: np.ndarray) -> float:
+    """공고 임베딩(bytes)과 정규화된 이력서 벡터의 코사인 유사도 (이력서 쪽 norm 재계산 없음)"""
+    job_emb = np.frombuffer(job_value, dtype=np.float32)
+    return float(np.dot(job_emb, resume_unit) / np.linalg.norm(job_emb))
+
+
 class SectionalScoringService:
     """섹션별 임베딩 기반 점수 계산 서비스"""
     
     def __init__(self):
         self.weights = settings.SECTIONAL_WEIGHTS
     
+    @staticmethod
+    def prepare_resume_vectors(resume: Resume) -> Dict[str, Optional[np.ndarray]]:
+        """
+        이력서 섹션 임베딩을 한 번만 디코딩/정규화 (공고 N건 채점 시 재사용)
+        
+        Returns:
+            {"skills", "experience", "projects", "overall"} → 정규화 벡터 또는 None
+        """
+        return {
+            "skills": _unit(resume.skills_embedding),
+            "experience": _unit(resume.experience_embedding),
+            "projects": _unit(resume.projects_embedding),
+            "overall": _unit(resume.embedding),
+        }
+    
     def calculate_sectional_score(
         self,
         job: JobPosting,
-        resume: Resume
+        resume: Resume,
+        resume_vectors: Optional[Dict[str, Optional[np.ndarray]]] = None
     ) -> Dict[str, Any]:
         """
         섹션별 임베딩을 사용한 상세 점수 계산
         
+        Args:
+            resume_vectors: prepare_resume_vectors 결과 (없으면 여기서 한 번 계산)
+        
         Returns:
             {
                 "required_match": 0.85,  # 자격요건 매칭
@@ -34,21 +75,25 @@ class SectionalScoringService:
         """
         try:
             scores = {}
+            if resume_vectors is None:
+                resume_vectors = self.prepare_resume_vectors(resume)
             
             # 1. 자격요건 매칭 (가장 중요!)
-            required_score = self._calculate_required_match(job, resume)
+            required_score = self._calculate_required_match(job, resume, resume_vectors["skills"])
             scores['required_match'] = required_score
             
             # 2. 우대조건 매칭
-            preferred_score = self._calculate_preferred_match(job, resume)
+            preferred_score = self._calculate_preferred_match(job, resume, resume_vectors["skills"])
             scores['preferred_match'] = preferred_score
             
             # 3. 경력/프로젝트 매칭
-            experience_score = self._calculate_experience_match(job, resume)
+            experience_score = self._calculate_experience_match(
+                job, resume_vectors["experience"], resume_vectors["projects"]
+            )
             scores['experience_match'] = experience_score
             
             # 4. 전체 유사도 (기존 방식)
-            overall_score = self._calculate_overall_similarity(job, resume)
+            overall_score = self._calculate_overall_similarity(job, resume_vectors["overall"])
             scores['overall_similarity'] = overall_score
             
             # 5. 최종 점수 계산 (튜닝된 가중치 사용)
@@ -81,19 +126,15 @@ class SectionalScoringService:
     def _calculate_required_match(
         self,
         job: JobPosting,
-        resume: Resume
+        resume: Resume,
+        resume_skills: Optional[np.ndarray]
     ) -> float:
         """자격요건 매칭 점수 - 순수 임베딩 기반"""
         try:
             # 임베딩이 있으면 사용
-            if job.required_embedding is not None and resume.skills_embedding is not None:
-                job_req_emb = np.frombuffer(job.required_embedding, dtype=np.float32)
-                resume_skills_emb = np.frombuffer(resume.skills_embedding, dtype=np.float32)
-                
+            if job.required_embedding is not None and resume_skills is not None:
                 # 코사인 유사도 (순수 임베딩 기반)
-                similarity = np.dot(job_req_emb, resume_skills_emb) / (
-                    np.linalg.norm(job_req_emb) * np.linalg.norm(resume_skills_emb)
-                )
+                similarity = _cosine_to_unit(job.required_embedding, resume_skills)
                 
                 # 키워드 매칭도 함께 고려 (보조 역할)
                 keyword_score = self._keyword_match(
@@ -121,17 +162,13 @@ class SectionalScoringService:
     def _calculate_preferred_match(
         self,
         job: JobPosting,
-        resume: Resume
+        resume: Resume,
+        resume_skills: Optional[np.ndarray]
     ) -> float:
         """우대조건 매칭 점수 - 순수 임베딩 기반"""
         try:
-            if job.preferred_embedding is not None and resume.skills_embedding is not None:
-                job_pref_emb = np.frombuffer(job.preferred_embedding, dtype=np.float32)
-                resume_skills_emb = np.frombuffer(resume.skills_embedding, dtype=np.float32)
-                
-                similarity = np.dot(job_pref_emb, resume_skills_emb) / (
-                    np.linalg.norm(job_pref_emb) * np.linalg.norm(resume_skills_emb)
-                )
+            if job.preferred_embedding is not None and resume_skills is not None:
+                similarity = _cosine_to_unit(job.preferred_embedding, resume_skills)
                 
                 keyword_score = self._keyword_match(
                     job.requirements.get('preferred', []) if job.requirements else [],
@@ -156,26 +193,19 @@ class SectionalScoringService:
     def _calculate_experience_match(
         self,
         job: JobPosting,
-        resume: Resume
+        resume_experience: Optional[np.ndarray],
+        resume_projects: Optional[np.ndarray]
     ) -> float:
         """경력/프로젝트 매칭 점수"""
         try:
             if job.description_embedding is not None:
                 # 경력 임베딩이 있으면 사용
-                if resume.experience_embedding is not None:
-                    job_desc_emb = np.frombuffer(job.description_embedding, dtype=np.float32)
-                    resume_exp_emb = np.frombuffer(resume.experience_embedding, dtype=np.float32)
-                    
-                    exp_similarity = np.dot(job_desc_emb, resume_exp_emb) / (
-                        np.linalg.norm(job_desc_emb) * np.linalg.norm(resume_exp_emb)
-                    )
+                if resume_experience is not None:
+                    exp_similarity = _cosine_to_unit(job.description_embedding, resume_experience)
                     
                     # 프로젝트 임베딩도 고려
-                    if resume.projects_embedding is not None:
-                        resume_proj_emb = np.frombuffer(resume.projects_embedding, dtype=np.float32)
-                        proj_similarity = np.dot(job_desc_emb, resume_proj_emb) / (
-                            np.linalg.norm(job_desc_emb) * np.linalg.norm(resume_proj_emb)
-                        )
+                    if resume_projects is not None:
+                        proj_similarity = _cosine_to_unit(job.description_embedding, resume_projects)
                         
                         # 경력(70%) + 프로젝트(30%)
                         return float(exp_similarity * 0.7 + proj_similarity * 0.3)
@@ -183,15 +213,8 @@ class SectionalScoringService:
                     return float(exp_similarity)
                 
                 # 프로젝트만 있는 경우
-                elif resume.projects_embedding is not None:
-                    job_desc_emb = np.frombuffer(job.description_embedding, dtype=np.float32)
-                    resume_proj_emb = np.frombuffer(resume.projects_embedding, dtype=np.float32)
-                    
-                    proj_similarity = np.dot(job_desc_emb, resume_proj_emb) / (
-                        np.linalg.norm(job_desc_emb) * np.linalg.norm(resume_proj_emb)
-                    )
-                    
-                    return float(proj_similarity)
+                elif resume_projects is not None:
+                    return _cosine_to_unit(job.description_embedding, resume_projects)
             
             # 임베딩이 없으면 기본값
             return 0.5
@@ -203,19 +226,12 @@ class SectionalScoringService:
     def _calculate_overall_similarity(
         self,
         job: JobPosting,
-        resume: Resume
+        resume_overall: Optional[np.ndarray]
     ) -> float:
         """전체 유사도 (기존 방식)"""
         try:
-            if job.embedding is not None and resume.embedding is not None:
-                job_emb = np.frombuffer(job.embedding, dtype=np.float32)
-                resume_emb = np.frombuffer(resume.embedding, dtype=np.float32)
-                
-                similarity = np.dot(job_emb, resume_emb) / (
-                    np.linalg.norm(job_emb) * np.linalg.norm(resume_emb)
-                )
-                
-                return float(similarity)
+            if job.embedding is not None and resume_overall is not None:
+                return _cosine_to_unit(job.embedding, resume_overall)
             
             return 0.5
             
@@ -3,14 +3,128 @@ Vector Search Service - pgvector를 사용한 유사도 검색
 """
 from sqlalchemy.orm import Session
 from sqlalchemy import text
-from typing import List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
 from uuid import UUID
+import threading
+import numpy as np
 
+from app.core.config import settings
 from app.models.job import JobPosting
 from app.models.resume import Resume
 from app.core.logging import logger
 
 
+class JobEmbeddingCache:
+    """
+    공고 전체 텍스트 임베딩의 프로세스 내 캐시
+    
+    L2 정규화된 float32 (N, D) 연속 행렬 + job_id → 행 번호 인덱스로 보관하여
+    검색 시 코사인 유사도가 행렬-벡터 내적 한 번이 되도록 한다 (호출마다 norm 계산 없음).
+    행은 (job_id, updated_at)으로 식별하므로 공고가 수정되면 다음 조회에서 다시 계산된다.
+    """
+    
+    def __init__(self, dimension: int):
+        self._lock = threading.Lock()
+        self._matrix = np.zeros((0, dimension), dtype=np.float32)
+        self._rows: Dict[UUID, int] = {}
+        self._stamps: Dict[UUID, Any] = {}
+        self._size = 0
+    
+    def missing(self, jobs: List[JobPosting]) -> List[JobPosting]:
+        """캐시에 없거나 수정되어 다시 임베딩해야 하는 공고"""
+        with self._lock:
+            return [
+                job for job in jobs
+                if job.id not in self._rows or self._stamps.get(job.id) != job.updated_at
+            ]
+    
+    def put(self, jobs: List[JobPosting], vectors: np.ndarray) -> None:
+        """공고 임베딩 저장 (정규화 후 기존 행 덮어쓰기 또는 추가, 0벡터는 저장하지 않음)"""
+        if not jobs:
+            return
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        keep = norms[:, 0] > 0
+        jobs = [job for job, k in zip(jobs, keep) if k]
+        vectors = vectors[keep] / norms[keep]
+        with self._lock:
+            for job, vec in zip(jobs, vectors):
+                row = self._rows.get(job.id)
+                if row is None:
+                    if self._size == len(self._matrix):
+                        self._grow()
+                    row = self._size
+                    self._size += 1
+                    self._rows[job.id] = row
+                self._matrix[row] = vec
+                self._stamps[job.id] = job.updated_at
+    
+    def _grow(self) -> None:
+        """용량 2배씩 확장 (연속 메모리 유지, 호출자가 lock 보유)"""
+        capacity = max(64, 2 * len(self._matrix))
+        matrix = np.zeros((capacity, self._matrix.shape[1]), dtype=np.float32)
+        matrix[:self._size] = self._matrix[:self._size]
+        self._matrix = matrix
+    
+    def matrix_for(self, jobs: List[JobPosting]) -> np.ndarray:
+        """jobs 순서대로의 정규화 임베딩 행렬 (캐시에 없는 공고는 0벡터 행)"""
+        matrix = np.zeros((len(jobs), self._matrix.shape[1]), dtype=np.float32)
+        with self._lock:
+            rows = np.fromiter((self._rows.get(job.id, -1) for job in jobs), dtype=np.intp, count=len(jobs))
+            hit = rows >= 0
+            matrix[hit] = self._matrix[rows[hit]]
+        return matrix
+    
+    def top_k(self, jobs: List[JobPosting], query: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        jobs 중 query와 코사인 유사도가 높은 상위 k개
+        
+        정규화 float32 행렬과의 행렬-벡터 내적 한 번 + argpartition으로 고른다.
+        캐시에 없는 공고는 후보에서 제외된다.
+        
+        Returns:
+            (jobs 기준 인덱스 배열, 유사도 배열) - 유사도 내림차순
+        """
+        query = np.asarray(query, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0 or not jobs or k <= 0:
+            return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.float32)
+        query = query / norm
+        
+        with self._lock:
+            rows = np.fromiter((self._rows.get(job.id, -1) for job in jobs), dtype=np.intp, count=len(jobs))
+            idx = np.flatnonzero(rows >= 0)
+            sims = self._matrix[rows[idx]] @ query
+        
+        if len(sims) > k:
+            part = np.argpartition(-sims, k - 1)[:k]
+            idx, sims = idx[part], sims[part]
+        order = np.argsort(-sims, kind="stable")
+        return idx[order], sims[order]
+    
+    def invalidate(self, job_id: Optional[UUID] = None) -> None:
+        """특정 공고(또는 전체) 캐시 무효화"""
+        with self._lock:
+            if job_id is None:
+                self._rows.clear()
+                self._stamps.clear()
+                self._size = 0
+            else:
+                self._stamps.pop(job_id, None)  # 다음 조회 시 missing으로 분류되어 같은 행에 재계산
+
+
+# 전역 인스턴스 (싱글톤 패턴)
+_job_embedding_cache: Optional[JobEmbeddingCache] = None
+
+
+def get_job_embedding_cache() -> JobEmbeddingCache:
+    """공고 임베딩 캐시 인스턴스 가져오기 (싱글톤)"""
+    global _job_embedding_cache
+    if _job_embedding_cache is None:
+        _job_embedding_cache = JobEmbeddingCache(settings.EMBEDDING_DIMENSION)
+    return _job_embedding_cache
+
+
 class VectorSearchService:
     """벡터 검색 서비스 (pgvector 사용)"""
     
@@ -45,41 +159,25 @@ class VectorSearchService:
             else:
                 embedding_list = resume_embedding
             
-            # 모든 채용공고 가져오기
-            from sqlalchemy import and_
-            jobs = self.db.query(JobPosting).filter(
-                and_(
-                    JobPosting.embedding.isnot(None),
-                    JobPosting.is_active == True
-                )
-            ).all()
+            # 활성 공고만 대상으로 거리순 정렬 + LIMIT
+            # (is_active 조건이 있어야 ix_job_embedding_hnsw_active 부분 인덱스 사용)
+            distance = JobPosting.embedding.cosine_distance(embedding_list)
+            rows = self.db.query(JobPosting, distance.label("distance")).filter(
+                JobPosting.is_active,
+                JobPosting.embedding.isnot(None)
+            ).order_by(distance).limit(limit).all()
             
-            if not jobs:
+            if not rows:
                 logger.warning("No active jobs with embeddings found")
                 return []
             
-            # Python에서 유사도 계산
-            jobs_with_scores = []
-            for job in jobs:
-                if job.embedding is None:
-                    continue
-                
-                job_emb = job.embedding.tolist() if hasattr(job.embedding, 'tolist') else job.embedding
-                
-                # 코사인 유사도 계산
-                import numpy as np
-                vec1 = np.array(embedding_list)
-                vec2 = np.array(job_emb)
-                similarity = float(np.dot(vec1, vec2))
-                
-                if similarity >= min_similarity:
-                    jobs_with_scores.append((job, similarity))
-            
-            # 유사도 기준 정렬
-            jobs_with_scores.sort(key=lambda x: x[1], reverse=True)
-            
-            # limit 적용
-            result = jobs_with_scores[:limit]
+            # 최소 유사도 필터 (인덱스 순서 유지, 거리순이므로 임계 미만부터는 모두 제외)
+            result = []
+            for job, dist in rows:
+                similarity = 1.0 - float(dist)
+                if similarity < min_similarity:
+                    break
+                result.append((job, similarity))
             
             logger.info(f"Found {len(result)} similar jobs")
             return result
@@ -114,11 +212,11 @@ class VectorSearchService:
             query = text("""
                 SELECT 
                     id,
-                    1 - (embedding <=> :embedding::vector) as similarity
+                    1 - (embedding <=> :embedding::halfvec(768)) as similarity
                 FROM resume
                 WHERE embedding IS NOT NULL
-                    AND (1 - (embedding <=> :embedding::vector)) >= :min_similarity
-                ORDER BY embedding <=> :embedding::vector
+                    AND (1 - (embedding <=> :embedding::halfvec(768))) >= :min_similarity
+                ORDER BY embedding <=> :embedding::halfvec(768)
                 LIMIT :limit
             """)
             
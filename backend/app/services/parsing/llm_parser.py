@@ -1,13 +1,190 @@
 """
 LLM 기반 파싱 서비스 (이력서, 채용공고)
 """
+import hashlib
 import json
 import os
-from typing import Dict, Any, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 from openai import OpenAI
+from app.core.cache import mget_cache_sync, mset_cache_sync
+from app.core.config import settings
 from app.core.logging import logger
 
 
+# 문장 분할 요청 공유 스레드 풀 (워커 수 = 프로세스 전체 동시 LLM 요청 상한)
+_SPLIT_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.LLM_MAX_CONCURRENCY,
+    thread_name_prefix="llm-split",
+)
+
+
+# 폴백 문장 경계: 종결 부호/줄바꿈 뒤의 공백 (모듈 로드 시 한 번만 컴파일)
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?\n])\s+")
+
+
+# 고정 프롬프트 (프롬프트 캐싱용: 매 호출 바이트 단위로 동일해야 하므로
+# f-string/타임스탬프 없이 모듈 상수로 두고, 가변 텍스트는 항상 메시지 맨 뒤에 붙인다)
+_RESUME_SYSTEM_PROMPT = "당신은 이력서 분석 전문가입니다. 주어진 이력서에서 정확하게 정보를 추출하여 JSON 형식으로 반환합니다."
+_JOB_SYSTEM_PROMPT = "당신은 채용공고 분석 전문가입니다. 주어진 채용공고에서 정확하게 정보를 추출하여 JSON 형식으로 반환합니다."
+_SENTENCE_SPLIT_SYSTEM_PROMPT = "문장 분할 전문가로서, 입력을 고품질 문장 리스트로 변환합니다."
+
+_RESUME_PARSING_INSTRUCTIONS = """
+다음 이력서에서 정보를 추출하여 JSON 형식으로 반환하세요.
+
+추출할 정보:
+1. 개인정보 (이름, 연락처, 이메일)
+2. 경력 요약
+3. 회사 경력 (학교/프로젝트 제외, 실제 회사 근무만)
+   - 각 경력의 회사명, 직책, 기간(YYYY.MM~YYYY.MM, 불명확하면 null), 업무내용(responsibilities: 리스트)
+   - 총 경력 년수 계산 (개월 단위로 계산 후 년으로 변환, 소수점 1자리, 불명확하면 0)
+4. 학력
+5. 기술 스킬 (프로그래밍 언어, 프레임워크, 도구)
+6. 자격증
+7. 언어 능력
+8. 프로젝트 경험 (회사 프로젝트 제외)
+
+주의사항:
+- 경력 년수: 학교 다닌 기간 제외, 실제 회사 근무 기간만 계산
+- "2021.07 ~ 2022.02"는 7개월 (0.6년)
+- "1년차"는 1년
+- "만 10개월"은 0.8년
+- 인턴도 경력에 포함
+- 없는 정보는 빈 값 또는 null (추측 금지)
+
+JSON 형식:
+{
+  "personal_info": {
+    "name": "홍길동",
+    "phone": "010-1234-5678",
+    "email": "email@example.com"
+  },
+  "summary": "간단한 자기소개",
+  "total_experience_years": 2.5,
+  "work_experience": [
+    {
+      "company": "회사명",
+      "position": "직책",
+      "start_date": "2021.07",
+      "end_date": "2022.02",
+      "duration_months": 7,
+      "responsibilities": ["업무1", "업무2"]
+    }
+  ],
+  "education": [
+    {
+      "school": "대학교명",
+      "degree": "학사",
+      "major": "전공",
+      "graduation_year": "2024"
+    }
+  ],
+  "skills": {
+    "programming_languages": ["Python", "Java"],
+    "frameworks": ["Django", "React"],
+    "databases": ["MySQL", "PostgreSQL"],
+    "tools": ["Git", "Docker"],
+    "cloud": ["AWS", "GCP"]
+  },
+  "certifications": [
+    {
+      "name": "자격증명",
+      "issued_date": "2023.06"
+    }
+  ],
+  "languages": [
+    {
+      "language": "English",
+      "proficiency": "Business"
+    }
+  ],
+  "projects": [
+    {
+      "name": "프로젝트명",
+      "period": "2023.01 ~ 2023.03",
+      "description": "설명",
+      "tech_stack": ["React", "Node.js"]
+    }
+  ],
+  "skills_narrative": "React와 TypeScript로 SPA를 개발했습니다. Next.js로 SSR을 구현했습니다. Redux로 전역 상태를 관리했습니다. Django로 REST API 서버를 구축했습니다. (보유한 기술 스택과 사용 경험을 완전한 문장으로 서술)",
+  "projects_narrative": "Make your World 프로젝트에서 ChatGPT API를 연동하여 대화형 소설 생성 기능을 구현했습니다. POISON 프로젝트에서 이미지 인식 AI를 활용한 독초 판별 서비스를 개발했습니다. (주요 프로젝트 경험을 완전한 문장으로 서술)"
+}
+
+**추가 요구사항:**
+- skills_narrative: 기술 스택 사용 경험을 완전한 문장으로 작성 (필수!)
+- projects_narrative: 프로젝트 경험을 완전한 문장으로 작성 (필수!)
+- 이 두 필드는 임베딩 생성에 사용되므로 반드시 포함
+"""
+
+_JOB_PARSING_INSTRUCTIONS = """
+다음 채용공고에서 정보를 추출하여 JSON 형식으로 반환하세요.
+
+추출할 정보:
+1. 자격요건 (required) - 필수 조건, "이런 분과 함께하고 싶어요" 등
+   - 각 조건을 완전한 문장으로 추출
+   - 예: "React, Next.js, TypeScript 기반 프론트엔드 개발 경험이 있는 분"
+
+2. 우대사항 (preferred) - 우대 조건, "이런 분을 우대해요" 등
+   - 각 조건을 완전한 문장으로 추출
+   - 예: "메시지 큐(Kafka, RabbitMQ) 경험이 있는 분"
+
+3. 업무 설명 (description) - 주요 업무, "이런 일을 하게 돼요" 등
+   - 전체 업무 내용을 문단으로 작성
+
+4. 주요 업무 (responsibilities) - 구체적인 업무 항목들
+   - 리스트 형태로 추출
+
+5. 복지/혜택 (benefits)
+   - 리스트 형태로 추출
+
+주의사항:
+- required와 preferred는 **완전한 문장**으로 추출 (임베딩 생성에 사용)
+- 단순 키워드가 아닌 문맥이 있는 문장으로 작성
+- 없는 정보는 빈 리스트 또는 빈 문자열
+
+JSON 형식:
+{
+  "requirements": {
+    "required": [
+      "Java / Kotlin / Spring Framework를 활용한 백엔드 개발 경험이 있는 분",
+      "RDBMS 설계 및 최적화 경험이 있는 분",
+      "RESTful API 설계 및 구현 역량을 갖춘 분"
+    ],
+    "preferred": [
+      "메시지 큐(Kafka, RabbitMQ 등) 및 이벤트 드리븐 아키텍처 경험이 있는 분",
+      "대규모 트래픽 서비스 운영 경험이 있는 분",
+      "클라우드(AWS, GCP, Azure) 기반 서비스 운영 경험이 있는 분"
+    ]
+  },
+  "description": "Java / Spring Boot / Kotlin 기반 백엔드 서비스를 개발·운영합니다. RESTful API, WebSocket 기반 서비스를 설계·구현하고, 대규모 데이터 처리를 위한 DB 구조를 설계하고 최적화합니다.",
+  "responsibilities": [
+    "Java / Spring Boot / Kotlin 기반 백엔드 서비스를 개발·운영",
+    "RESTful API, WebSocket 기반 서비스를 설계·구현",
+    "대규모 데이터 처리를 위한 DB 구조를 설계하고 최적화"
+  ],
+  "benefits": [
+    "연봉 협상 가능",
+    "재택근무 지원",
+    "자기계발비 지원"
+  ]
+}
+
+**중요:**
+- required, preferred는 반드시 완전한 문장으로 작성!
+- 이 데이터는 섹션별 임베딩 생성에 사용됨
+"""
+
+_SENTENCE_SPLIT_INSTRUCTIONS = (
+    "다음 텍스트를 의미 단위의 완전한 문장으로 깔끔하게 분할하세요.\n"
+    "- 각 문장은 20-200자 내외의 의미 있는 단위여야 합니다.\n"
+    "- 기술 스킬, 경험, 프로젝트 내용을 명확히 구분합니다.\n"
+    "- 번호/불릿/불필요한 접두사는 제거합니다.\n"
+    "- 한국어/영어는 원문 어휘를 보존합니다.\n"
+    "- 출력은 JSON {\"sentences\": [..]} 형식만 반환하세요.\n\n"
+)
+
+
 class LLMParser:
     """LLM을 사용한 텍스트 구조화 파싱 (이력서, 채용공고)"""
     
@@ -17,7 +194,8 @@ class LLMParser:
             logger.warning("OPENAI_API_KEY not found. LLM parsing disabled.")
             self.client = None
         else:
-            self.client = OpenAI(api_key=api_key)
+            # 재시도는 SDK 내장 지수 백오프(+jitter) 사용
+            self.client = OpenAI(api_key=api_key, max_retries=settings.LLM_MAX_RETRIES)
             # GPT-5가 있는지 확인, 없으면 gpt-4o-mini 사용
             self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
             logger.info(f"LLM Parser initialized with model: {self.model}")
@@ -58,7 +236,7 @@ class LLMParser:
                 "messages": [
                     {
                         "role": "system",
-                        "content": "당신은 이력서 분석 전문가입니다. 주어진 이력서에서 정확하게 정보를 추출하여 JSON 형식으로 반환합니다."
+                        "content": _RESUME_SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
@@ -89,24 +267,61 @@ class LLMParser:
 
         Returns: { "sentences": ["..."] }
         """
-        if not raw_text:
-            return {"sentences": []}
+        return self.extract_sentences_many([raw_text])[0]
+
+    def extract_sentences_many(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """여러 텍스트의 문장 분할 (입력 순서대로 반환)
+
+        - 입력 텍스트 SHA-256 키로 Redis 캐시를 MGET 한 번에 조회 (재인덱싱 시 LLM 호출 생략)
+        - 미스만 블로킹 OpenAI 호출을 공유 스레드 풀에서 겹쳐 실행하여 N회 왕복을 약 1회로 줄인다
+        - LLM이 성공한 결과만 캐시 (정규식 폴백 결과는 저장하지 않음)
+        """
+        results: List[Dict[str, Any]] = [{"sentences": []} for _ in texts]
+        pending = [i for i, t in enumerate(texts) if t]
+        if not pending:
+            return results
         if not self.client:
-            return {"sentences": self._fallback_sentence_split(raw_text)}
+            for i in pending:
+                results[i] = {"sentences": self._fallback_sentence_split(texts[i])}
+            return results
+
+        keys = {i: self._sentence_cache_key(texts[i]) for i in pending}
+        cached = mget_cache_sync([keys[i] for i in pending])
+        misses = []
+        for i, hit in zip(pending, cached):
+            if hit:
+                results[i] = {"sentences": list(hit)}
+            else:
+                misses.append(i)
+
+        if len(misses) > 1:
+            splits = list(_SPLIT_EXECUTOR.map(self._llm_split_sentences, [texts[i] for i in misses]))
+        else:
+            splits = [self._llm_split_sentences(texts[i]) for i in misses]
+
+        to_cache = {}
+        for i, sents in zip(misses, splits):
+            if sents:
+                results[i] = {"sentences": sents}
+                to_cache[keys[i]] = sents
+            else:
+                results[i] = {"sentences": self._fallback_sentence_split(texts[i])}
+        mset_cache_sync(to_cache, expire=settings.LLM_SPLIT_CACHE_TTL)
+        return results
+
+    def _sentence_cache_key(self, raw_text: str) -> str:
+        """문장 분할 캐시 키 (모델 + 실제 프롬프트에 들어가는 텍스트 기준)"""
+        digest = hashlib.sha256(raw_text[:8000].encode("utf-8")).hexdigest()
+        return f"llm_split:{self.model}:{digest}"
+
+    def _llm_split_sentences(self, raw_text: str) -> List[str]:
+        """LLM 문장 분할 1회 호출 (실패/빈 결과면 빈 리스트)"""
         try:
-            prompt = (
-                "다음 텍스트를 의미 단위의 완전한 문장으로 깔끔하게 분할하세요.\n"
-                "- 각 문장은 20-200자 내외의 의미 있는 단위여야 합니다.\n"
-                "- 기술 스킬, 경험, 프로젝트 내용을 명확히 구분합니다.\n"
-                "- 번호/불릿/불필요한 접두사는 제거합니다.\n"
-                "- 한국어/영어는 원문 어휘를 보존합니다.\n"
-                "- 출력은 JSON {\"sentences\": [..]} 형식만 반환하세요.\n\n"
-                "텍스트:\n```\n" + raw_text[:8000] + "\n```"
-            )
+            prompt = _SENTENCE_SPLIT_INSTRUCTIONS + "텍스트:\n```\n" + raw_text[:8000] + "\n```"
             completion_params = {
                 "model": self.model,
                 "messages": [
-                    {"role": "system", "content": "문장 분할 전문가로서, 입력을 고품질 문장 리스트로 변환합니다."},
+                    {"role": "system", "content": _SENTENCE_SPLIT_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt},
                 ],
                 "response_format": {"type": "json_object"},
@@ -115,117 +330,20 @@ class LLMParser:
                 completion_params["temperature"] = 0.1
             resp = self.client.chat.completions.create(**completion_params)
             data = json.loads(resp.choices[0].message.content or "{}")
-            sents = [s.strip() for s in (data.get("sentences") or []) if isinstance(s, str) and s.strip()]
-            if sents:
-                return {"sentences": sents}
-            return {"sentences": self._fallback_sentence_split(raw_text)}
+            return [s.strip() for s in (data.get("sentences") or []) if isinstance(s, str) and s.strip()]
         except Exception as e:
             logger.warning(f"extract_sentences failed, fallback: {e}")
-            return {"sentences": self._fallback_sentence_split(raw_text)}
+            return []
 
     def _fallback_sentence_split(self, text: str) -> list:
-        import re
-        raw = re.split(r"(?<=[.!?\n])\s+", text)
-        sents = []
-        for s in raw:
-            s = " ".join(s.strip().split())
-            if 20 <= len(s) <= 300 and " " in s and "_" not in s:
-                sents.append(s)
-        return sents
+        return [
+            s for raw in _SENT_SPLIT_RE.split(text)
+            if 20 <= len(s := " ".join(raw.split())) <= 300 and " " in s and "_" not in s
+        ]
     
     def _create_parsing_prompt(self, text: str) -> str:
-        """파싱 프롬프트 생성"""
-        return f"""
-다음 이력서에서 정보를 추출하여 JSON 형식으로 반환하세요.
-
-이력서:
-```
-{text}
-```
-
-추출할 정보:
-1. 개인정보 (이름, 연락처, 이메일)
-2. 경력 요약
-3. 회사 경력 (학교/프로젝트 제외, 실제 회사 근무만)
-   - 각 경력의 회사명, 직책, 기간(YYYY.MM~YYYY.MM, 불명확하면 null), 업무내용(responsibilities: 리스트)
-   - 총 경력 년수 계산 (개월 단위로 계산 후 년으로 변환, 소수점 1자리, 불명확하면 0)
-4. 학력
-5. 기술 스킬 (프로그래밍 언어, 프레임워크, 도구)
-6. 자격증
-7. 언어 능력
-8. 프로젝트 경험 (회사 프로젝트 제외)
-
-주의사항:
-- 경력 년수: 학교 다닌 기간 제외, 실제 회사 근무 기간만 계산
-- "2021.07 ~ 2022.02"는 7개월 (0.6년)
-- "1년차"는 1년
-- "만 10개월"은 0.8년
-- 인턴도 경력에 포함
-- 없는 정보는 빈 값 또는 null (추측 금지)
-
-JSON 형식:
-{{
-  "personal_info": {{
-    "name": "홍길동",
-    "phone": "010-1234-5678",
-    "email": "email@example.com"
-  }},
-  "summary": "간단한 자기소개",
-  "total_experience_years": 2.5,
-  "work_experience": [
-    {{
-      "company": "회사명",
-      "position": "직책",
-      "start_date": "2021.07",
-      "end_date": "2022.02",
-      "duration_months": 7,
-      "responsibilities": ["업무1", "업무2"]
-    }}
-  ],
-  "education": [
-    {{
-      "school": "대학교명",
-      "degree": "학사",
-      "major": "전공",
-      "graduation_year": "2024"
-    }}
-  ],
-  "skills": {{
-    "programming_languages": ["Python", "Java"],
-    "frameworks": ["Django", "React"],
-    "databases": ["MySQL", "PostgreSQL"],
-    "tools": ["Git", "Docker"],
-    "cloud": ["AWS", "GCP"]
-  }},
-  "certifications": [
-    {{
-      "name": "자격증명",
-      "issued_date": "2023.06"
-    }}
-  ],
-  "languages": [
-    {{
-      "language": "English",
-      "proficiency": "Business"
-    }}
-  ],
-  "projects": [
-    {{
-      "name": "프로젝트명",
-      "period": "2023.01 ~ 2023.03",
-      "description": "설명",
-      "tech_stack": ["React", "Node.js"]
-    }}
-  ],
-  "skills_narrative": "React와 TypeScript로 SPA를 개발했습니다. Next.js로 SSR을 구현했습니다. Redux로 전역 상태를 관리했습니다. Django로 REST API 서버를 구축했습니다. (보유한 기술 스택과 사용 경험을 완전한 문장으로 서술)",
-  "projects_narrative": "Make your World 프로젝트에서 ChatGPT API를 연동하여 대화형 소설 생성 기능을 구현했습니다. POISON 프로젝트에서 이미지 인식 AI를 활용한 독초 판별 서비스를 개발했습니다. (주요 프로젝트 경험을 완전한 문장으로 서술)"
-}}
-
-**추가 요구사항:**
-- skills_narrative: 기술 스택 사용 경험을 완전한 문장으로 작성 (필수!)
-- projects_narrative: 프로젝트 경험을 완전한 문장으로 작성 (필수!)
-- 이 두 필드는 임베딩 생성에 사용되므로 반드시 포함
-"""
+        """파싱 프롬프트 생성 (고정 지시문이 앞, 가변 이력서 텍스트는 맨 뒤)"""
+        return _RESUME_PARSING_INSTRUCTIONS + "\n---\n이력서:\n```\n" + text + "\n```"
     
     def _fallback_parsing(self, raw_text: str) -> Dict[str, Any]:
         """LLM 실패 시 기본 파싱"""
@@ -350,7 +468,7 @@ JSON 형식:
                 "messages": [
                     {
                         "role": "system",
-                        "content": "당신은 채용공고 분석 전문가입니다. 주어진 채용공고에서 정확하게 정보를 추출하여 JSON 형식으로 반환합니다."
+                        "content": _JOB_SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
@@ -377,70 +495,8 @@ JSON 형식:
             return self._fallback_job_parsing(raw_text)
     
     def _create_job_parsing_prompt(self, text: str, title: str) -> str:
-        """채용공고 파싱 프롬프트 생성"""
-        return f"""
-다음 채용공고에서 정보를 추출하여 JSON 형식으로 반환하세요.
-
-채용공고:
-제목: {title}
-```
-{text}
-```
-
-추출할 정보:
-1. 자격요건 (required) - 필수 조건, "이런 분과 함께하고 싶어요" 등
-   - 각 조건을 완전한 문장으로 추출
-   - 예: "React, Next.js, TypeScript 기반 프론트엔드 개발 경험이 있는 분"
-
-2. 우대사항 (preferred) - 우대 조건, "이런 분을 우대해요" 등
-   - 각 조건을 완전한 문장으로 추출
-   - 예: "메시지 큐(Kafka, RabbitMQ) 경험이 있는 분"
-
-3. 업무 설명 (description) - 주요 업무, "이런 일을 하게 돼요" 등
-   - 전체 업무 내용을 문단으로 작성
-
-4. 주요 업무 (responsibilities) - 구체적인 업무 항목들
-   - 리스트 형태로 추출
-
-5. 복지/혜택 (benefits)
-   - 리스트 형태로 추출
-
-주의사항:
-- required와 preferred는 **완전한 문장**으로 추출 (임베딩 생성에 사용)
-- 단순 키워드가 아닌 문맥이 있는 문장으로 작성
-- 없는 정보는 빈 리스트 또는 빈 문자열
-
-JSON 형식:
-{{
-  "requirements": {{
-    "required": [
-      "Java / Kotlin / Spring Framework를 활용한 백엔드 개발 경험이 있는 분",
-      "RDBMS 설계 및 최적화 경험이 있는 분",
-      "RESTful API 설계 및 구현 역량을 갖춘 분"
-    ],
-    "preferred": [
-      "메시지 큐(Kafka, RabbitMQ 등) 및 이벤트 드리븐 아키텍처 경험이 있는 분",
-      "대규모 트래픽 서비스 운영 경험이 있는 분",
-      "클라우드(AWS, GCP, Azure) 기반 서비스 운영 경험이 있는 분"
-    ]
-  }},
-  "description": "Java / Spring Boot / Kotlin 기반 백엔드 서비스를 개발·운영합니다. RESTful API, WebSocket 기반 서비스를 설계·구현하고, 대규모 데이터 처리를 위한 DB 구조를 설계하고 최적화합니다.",
-  "responsibilities": [
-    "Java / Spring Boot / Kotlin 기반 백엔드 서비스를 개발·운영",
-    "RESTful API, WebSocket 기반 서비스를 설계·구현",
-    "대규모 데이터 처리를 위한 DB 구조를 설계하고 최적화"
-  ],
-  "benefits": [
-    "연봉 협상 가능",
-    "재택근무 지원",
-    "자기계발비 지원"
-  ]
-}}
-
-**중요:**
-- required, preferred는 반드시 완전한 문장으로 작성!
-- 이 데이터는 섹션별 임베딩 생성에 사용됨
-"""
+        """채용공고 파싱 프롬프트 생성 (고정 지시문이 앞, 가변 공고 텍스트는 맨 뒤)"""
+        return _JOB_PARSING_INSTRUCTIONS + "\n---\n채용공고:\n제목: " + str(title) + "\n```\n" + text + "\n```"
     
     def _fallback_job_parsing(self, raw_text: str) -> Dict[str, Any]:
         """LLM 실패 시 기본 공고 파싱"""
@@ -454,3 +510,15 @@ JSON 형식:
             "benefits": []
         }
 
+
+
+# 전역 인스턴스 (싱글톤 패턴) - OpenAI 클라이언트(커넥션 풀) 재사용
+_llm_parser = None
+
+
+def get_llm_parser() -> LLMParser:
+    """LLM 파서 인스턴스 가져오기 (싱글톤)"""
+    global _llm_parser
+    if _llm_parser is None:
+        _llm_parser = LLMParser()
+    return _llm_parser
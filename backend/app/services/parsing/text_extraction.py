@@ -0,0 +1,76 @@
+"""
+Text Extraction - 파일 타입별 텍스트 추출 (프로세스 풀 오프로딩)
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional
+
+
+_PARSER_POOL: Optional[ProcessPoolExecutor] = None
+
+
+@lru_cache(maxsize=None)
+def _get_parser(kind: str):
+    """워커 프로세스별 파서 싱글톤 (파서는 호출 간 상태가 없으므로 재사용 안전)"""
+    if kind == "pdf":
+        from app.services.parsing.pdf_parser import PDFParser
+        return PDFParser()
+    if kind == "docx":
+        from app.services.parsing.docx_parser import DOCXParser
+        return DOCXParser()
+    if kind == "xlsx":
+        from app.services.parsing.xlsx_parser import XLSXParser
+        return XLSXParser()
+    raise ValueError(f"Unknown parser kind: {kind}")
+
+
+# 확장자 → 파서 종류 (import 시 한 번 구성, 요청마다 분기하지 않음)
+_PARSERS = {
+    "pdf": "pdf",
+    "docx": "docx",
+    "doc": "docx",
+    "xlsx": "xlsx",
+    "xls": "xlsx",
+}
+
+
+def extract_text(file_type: str, file_path: str) -> str:
+    """
+    파일 타입에 따라 텍스트 추출 (워커 프로세스에서 실행되는 최상위 함수)
+
+    파서는 워커 안에서 생성하므로 pickle 불가능한 상태를 넘기지 않는다.
+    """
+    kind = _PARSERS.get(file_type)
+    if kind is not None:
+        return _get_parser(kind).extract_text(file_path)
+
+    # 기본 텍스트 파일로 처리
+    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+        return f.read()
+
+
+def get_parser_pool() -> ProcessPoolExecutor:
+    """파싱 전용 프로세스 풀 (최초 사용 시 생성)"""
+    global _PARSER_POOL
+    if _PARSER_POOL is None:
+        # 스레드가 떠 있는 서버 프로세스에서 fork하지 않도록 spawn 사용
+        _PARSER_POOL = ProcessPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, 4),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _PARSER_POOL
+
+
+def extract_text_in_pool(file_type: str, file_path: str) -> str:
+    """프로세스 풀에서 텍스트 추출 (호출 스레드는 결과만 대기, GIL 경합 없음)"""
+    return get_parser_pool().submit(extract_text, file_type, file_path).result()
+
+
+def shutdown_parser_pool() -> None:
+    """프로세스 풀 종료"""
+    global _PARSER_POOL
+    if _PARSER_POOL is not None:
+        _PARSER_POOL.shutdown(wait=False, cancel_futures=True)
+        _PARSER_POOL = None
@@ -2,6 +2,9 @@
 Helper Functions
 """
 from typing import Any, Dict
+import os
+import time
+import uuid
 
 
 def extract_skills(text: str) -> list:
@@ -21,3 +24,17 @@ def normalize_text(text: str) -> str:
     # TODO: Implement text normalization
     return text.strip()
 
+
+def uuid7() -> uuid.UUID:
+    """
+    UUIDv7 생성 (RFC 9562)
+    
+    상위 48비트 = Unix epoch 밀리초, 나머지 74비트 = 랜덤 (version/variant 비트 고정).
+    시간순으로 증가하므로 PK B-tree 삽입이 항상 가장 오른쪽 리프에 몰려
+    uuid4 대비 페이지 분할/쓰기 증폭이 적다.
+    """
+    ts_ms = time.time_ns() // 1_000_000
+    value = (ts_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # variant 10xx
+    return uuid.UUID(int=value)
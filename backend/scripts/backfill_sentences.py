@@ -2,6 +2,7 @@
 Backfill resume/job sentences using GPT-5 parsing and store embeddings.
 Run: docker compose exec backend python backend/scripts/backfill_sentences.py
 """
+from sqlalchemy import exists
 from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.core.logging import logger
@@ -15,13 +16,12 @@ def main() -> None:
     db: Session = next(get_db())
     indexer = SentenceIndexer(db)
 
-    # Backfill resumes (skip if sentences already exist)
-    resumes = db.query(Resume).all()
+    # Backfill resumes (skip if sentences already exist) - one anti-join instead of a probe per row
+    resumes = db.query(Resume).filter(
+        ~exists().where(ResumeSentence.resume_id == Resume.id)
+    ).all()
     done_r = 0
     for r in resumes:
-        exists = db.query(ResumeSentence).filter(ResumeSentence.resume_id == r.id).limit(1).first()
-        if exists:
-            continue
         try:
             cnt = indexer.index_resume(r)
             done_r += 1
@@ -30,12 +30,11 @@ def main() -> None:
             logger.warning(f"Resume {r.id} failed: {e}")
 
     # Backfill jobs (skip if sentences already exist)
-    jobs = db.query(JobPosting).all()
+    jobs = db.query(JobPosting).filter(
+        ~exists().where(JobSentence.job_id == JobPosting.id)
+    ).all()
     done_j = 0
     for j in jobs:
-        exists = db.query(JobSentence).filter(JobSentence.job_id == j.id).limit(1).first()
-        if exists:
-            continue
         try:
             rc, pc = indexer.index_job(j)
             done_j += 1
@@ -43,9 +42,24 @@ def main() -> None:
         except Exception as e:
             logger.warning(f"Job {j.id} failed: {e}")
 
+    # Backfill overall embeddings for rows indexed before they were stored
+    done_o = 0
+    for target in [
+        *db.query(Resume).filter(Resume.embedding.is_(None)).all(),
+        *db.query(JobPosting).filter(JobPosting.embedding.is_(None)).all(),
+    ]:
+        try:
+            if indexer.index_overall(target):
+                db.commit()
+                done_o += 1
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Overall embedding for {target.id} failed: {e}")
+
     print({
         "resumes_processed": done_r,
         "jobs_processed": done_j,
+        "overall_embeddings": done_o,
     })
 
 
@@ -152,7 +152,7 @@ def main():
     logger.info("Starting multiple resume matching test...")
     
     # 데이터베이스 연결
-    engine = create_engine(settings.DATABASE_URL)
+    engine = create_engine(settings.SQLALCHEMY_DATABASE_URL)
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     db = SessionLocal()
     